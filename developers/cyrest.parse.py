@@ -61,7 +61,7 @@ if net:
     text="\n\t\tnetwork=check_network(self,network,verbose=verbose)"
 else:
     text=""
-textf=text+'\n\t\tPARAMS=set_param('+textb+')\n\t\tresponse=api(url=self.__url+"/'+fname+'", PARAMS=PARAMS, method="POST", verbose=verbose)'
+textf=text+'\n\t\tPARAMS=set_param('+textb+')\n\t\tresponse=api(url=self.__url+"/'+fname+'", PARAMS=PARAMS, method="POST", verbose=verbose, session=self.__session)'
 
 print textd+textf
 
@@ -0,0 +1,165 @@
+# -*- coding: utf-8 -*-
+"""
+JSON encoding of the bodies sent to and received from CyREST.
+
+The fastest installed library is used: orjson, then ujson, then the json
+module of the standard library. All of them encode NumPy scalars and arrays
+and decode from bytes, so bodies never pass through an intermediate str.
+
+NaN and infinity, which are not valid JSON, are encoded as null by every
+library, so the bodies do not depend on which one is installed.
+
+The choice can be forced with the environment variable PY2CYTOSCAPE_JSON,
+e.g. PY2CYTOSCAPE_JSON=json, or with set_codec.
+"""
+import json
+import math
+import os
+
+import numpy as np
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ujson
+    # ujson only has default= and allow_nan= since 5.x
+    ujson.dumps(0, default=str, allow_nan=False)
+except (ImportError, TypeError):
+    ujson = None
+
+
+def _default(obj):
+    """ Encode the types the JSON libraries do not know. """
+    if isinstance(obj, np.generic):
+        return obj.item()
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    raise TypeError('Object of type %s is not JSON serializable'
+                    % type(obj).__name__)
+
+
+def _finite(obj):
+    """ Copy of obj with NaN and infinity replaced by None. """
+    if isinstance(obj, dict):
+        return dict((key, _finite(value)) for key, value in obj.items())
+    if isinstance(obj, (list, tuple)):
+        return [_finite(value) for value in obj]
+    if isinstance(obj, (np.generic, np.ndarray)):
+        return _finite(obj.tolist())
+    if isinstance(obj, float) and not math.isfinite(obj):
+        return None
+    return obj
+
+
+class StdlibCodec(object):
+    name = 'json'
+
+    @staticmethod
+    def dumps(obj):
+        try:
+            text = json.dumps(obj, default=_default, allow_nan=False)
+        except ValueError:
+            # Only bodies with NaN or infinity are walked a second time
+            text = json.dumps(_finite(obj), default=_default)
+        return text.encode('utf-8')
+
+    @staticmethod
+    def loads(data):
+        if isinstance(data, bytes):
+            data = data.decode('utf-8')
+        return json.loads(data)
+
+
+class UjsonCodec(object):
+    name = 'ujson'
+
+    @staticmethod
+    def dumps(obj):
+        try:
+            text = ujson.dumps(obj, default=_default, ensure_ascii=False,
+                               escape_forward_slashes=False, allow_nan=False)
+        except (ValueError, OverflowError):
+            text = ujson.dumps(_finite(obj), default=_default,
+                               ensure_ascii=False, escape_forward_slashes=False)
+        return text.encode('utf-8')
+
+    @staticmethod
+    def loads(data):
+        return ujson.loads(data)
+
+
+class OrjsonCodec(object):
+    name = 'orjson'
+
+    @staticmethod
+    def dumps(obj):
+        # orjson encodes NaN and infinity as null itself
+        return orjson.dumps(obj, default=_default,
+                            option=orjson.OPT_SERIALIZE_NUMPY |
+                            orjson.OPT_NON_STR_KEYS)
+
+    @staticmethod
+    def loads(data):
+        return orjson.loads(data)
+
+
+# Codecs of the installed libraries, fastest first
+CODECS = dict((codec.name, codec) for codec, module in (
+    (OrjsonCodec, orjson), (UjsonCodec, ujson), (StdlibCodec, json))
+    if module is not None)
+
+_codec = None
+
+
+def set_codec(name=None):
+    """
+    Choose the JSON library used by all clients.
+
+    :param name: 'orjson', 'ujson' or 'json'. The fastest installed one if
+        None.
+    :return: The codec, with name, dumps and loads.
+    """
+    global _codec
+    if name is None:
+        name = [n for n in ('orjson', 'ujson', 'json') if n in CODECS][0]
+    if name not in CODECS:
+        raise ValueError('JSON library not installed: ' + str(name))
+    _codec = CODECS[name]
+    return _codec
+
+
+def get_codec():
+    """ Get the codec used by all clients. """
+    return _codec
+
+
+def dumps(obj):
+    """
+    Encode obj as JSON.
+
+    :return: UTF-8 encoded JSON as bytes.
+    """
+    return _codec.dumps(obj)
+
+
+def loads(data):
+    """
+    Decode JSON.
+
+    :param data: bytes or str, e.g. response.content.
+    """
+    return _codec.loads(data)
+
+
+def response_json(response, **kwargs):
+    """
+    Decode the body of a requests.Response. Used in place of
+    Response.json by the Transport.
+    """
+    return _codec.loads(response.content)
+
+
+set_codec(os.environ.get('PY2CYTOSCAPE_JSON') or None)
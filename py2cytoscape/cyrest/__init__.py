@@ -5,3 +5,4 @@
 
 """
 from .cyrest import *
+from .aiocyrest import *
@@ -0,0 +1,105 @@
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+
+from .base import *
+from .cyrest import cyclient
+
+MAX_CONCURRENCY=8
+
+
+class aionamespace(object):
+    """
+    Asynchronous view of a cyclient namespace, eg. cyclient.network. Every
+    method of the namespace is exposed as a coroutine function taking the
+    same arguments.
+
+    :param namespace: the cyclient namespace to wrap
+    :param client: the aiocyclient running the calls
+    """
+
+    def __init__(self, namespace, client):
+        self.__namespace = namespace
+        self.__client = client
+
+    def __getattr__(self, name):
+        attr = getattr(self.__namespace, name)
+        if not callable(attr):
+            return attr
+
+        @functools.wraps(attr)
+        async def call(*args, **kwargs):
+            return await self.__client.run(attr, *args, **kwargs)
+        return call
+
+
+class aiocyclient(object):
+    """
+    An asynchronous CyREST client. It mirrors the cyclient namespaces
+    (network, node, edge, table, layout, view, networks, ...) but each call
+    returns a coroutine, so independent calls can be awaited together eg.
+    with asyncio.gather. At most max_concurrency calls are in flight at the
+    same time, each on its own keep-alive connection.
+
+    :param host: CyREST host server address. default='localhost'
+    :param port: CyREST port number. default=1234
+    :param version: CyREST version. default='v1'
+    :param max_concurrency: maximum number of calls sent at the same time. default=8
+    :param max_retries: number of times a failed connection is retried. default=3
+
+    returns: an aiocyclient object.
+    """
+
+    def __init__(self, host=HOST, port=PORT, version=VERSION, max_concurrency=MAX_CONCURRENCY, max_retries=MAX_RETRIES):
+        self.__client = cyclient(host=host, port=port, version=version, pool_size=max_concurrency, max_retries=max_retries)
+        self.__executor = ThreadPoolExecutor(max_workers=max_concurrency)
+        for name, namespace in vars(self.__client).items():
+            if not name.startswith('_'):
+                setattr(self, name, aionamespace(namespace, self))
+
+    async def run(self, func, *args, **kwargs):
+        """
+        Runs a blocking call on one of the client's connections.
+
+        :param func: the function to call
+        :param args: positional arguments for func
+        :param kwargs: keyword arguments for func
+
+        :returns: the result of func
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.__executor, functools.partial(func, *args, **kwargs))
+
+    async def status(self, verbose=False):
+        """
+        Checks the status of your CyREST server.
+        """
+        return await self.run(self.__client.status, verbose=verbose)
+
+    async def version(self, verbose=False):
+        """
+        Checks Cytoscape version
+        """
+        return await self.run(self.__client.version, verbose=verbose)
+
+    def close(self):
+        """
+        Waits for pending calls and releases the client's threads and
+        connections. Blocks the calling thread, use aclose from a coroutine.
+        """
+        self.__executor.shutdown(wait=True)
+        self.__client.close()
+
+    async def aclose(self):
+        """
+        Waits for pending calls and releases the client's threads and
+        connections, without blocking the event loop.
+        """
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self.close)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
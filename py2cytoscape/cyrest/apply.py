@@ -5,10 +5,12 @@ class apply(object):
     cytoscape session interface as shown in CyREST's swagger documentation for 'layout'.
 
     :param url: an url of the type 'http://' + host + ':' + str(port) + '/' + version + '/'.
+    :param session: a Transport or requests.Session to send the calls through, default=a shared pooled transport.
     """
 
-    def __init__(self, url):
+    def __init__(self, url, session=None):
         self.__url = url + 'commands/apply'
+        self.__session = session if session is not None else default_session()
 
 
     def applyLayout(algorithmName, networkId, column, verbose=None):
@@ -23,7 +25,7 @@ class apply(object):
         :returns: 200: successful operation
         """
 
-        response=api(url=self.url+'apply/layouts/'+str(algorithmName)+'/'+str(networkId)+'', PARAMS={'column':column}, method="GET", verbose=verbose, parse_params=False)
+        response=api(url=self.url+'apply/layouts/'+str(algorithmName)+'/'+str(networkId)+'', PARAMS={'column':column}, method="GET", verbose=verbose, parse_params=False, session=self.__session)
         return response
 
 
@@ -37,7 +39,7 @@ class apply(object):
         :returns: 200: successful operation
         """
 
-        response=api(url=self.url+'apply/fit/'+str(networkId)+'', PARAMS=None, method="GET", verbose=verbose, parse_params=False)
+        response=api(url=self.url+'apply/fit/'+str(networkId)+'', PARAMS=None, method="GET", verbose=verbose, parse_params=False, session=self.__session)
         return response
 
 
@@ -50,7 +52,7 @@ class apply(object):
         :returns: 200: successful operation
         """
 
-        response=api(url=self.url+'apply/styles', PARAMS=None, method="GET", verbose=verbose, parse_params=False)
+        response=api(url=self.url+'apply/styles', PARAMS=None, method="GET", verbose=verbose, parse_params=False, session=self.__session)
         return response
 
 
@@ -66,7 +68,7 @@ class apply(object):
         :returns: 200: successful operation; 404: Network View does not exist
         """
 
-        response=api(url=self.url+'apply/layouts/copycat/'+str(sourceViewSUID)+'/'+str(targetViewSUID)+'', method="PUT", body=body, verbose=verbose)
+        response=api(url=self.url+'apply/layouts/copycat/'+str(sourceViewSUID)+'/'+str(targetViewSUID)+'', method="PUT", body=body, verbose=verbose, session=self.__session)
         return response
 
 
@@ -80,7 +82,7 @@ class apply(object):
         :returns: 200: successful operation
         """
 
-        response=api(url=self.url+'apply/edgebundling/'+str(networkId)+'', PARAMS=None, method="GET", verbose=verbose, parse_params=False)
+        response=api(url=self.url+'apply/edgebundling/'+str(networkId)+'', PARAMS=None, method="GET", verbose=verbose, parse_params=False, session=self.__session)
         return response
 
 
@@ -95,7 +97,7 @@ class apply(object):
         :returns: 200: successful operation
         """
 
-        response=api(url=self.url+'apply/styles/'+str(styleName)+'/'+str(networkId)+'', PARAMS=None, method="GET", verbose=verbose, parse_params=False)
+        response=api(url=self.url+'apply/styles/'+str(styleName)+'/'+str(networkId)+'', PARAMS=None, method="GET", verbose=verbose, parse_params=False, session=self.__session)
         return response
 
 
@@ -110,7 +112,7 @@ class apply(object):
         :returns: default: successful operation
         """
 
-        response=api(url=self.url+'apply/layouts/'+str(algorithmName)+'/parameters', method="PUT", body=body, verbose=verbose)
+        response=api(url=self.url+'apply/layouts/'+str(algorithmName)+'/parameters', method="PUT", body=body, verbose=verbose, session=self.__session)
         return response
 
 
@@ -124,7 +126,7 @@ class apply(object):
         :returns: 200: successful operation
         """
 
-        response=api(url=self.url+'apply/layouts/'+str(algorithmName)+'/parameters', PARAMS=None, method="GET", verbose=verbose, parse_params=False)
+        response=api(url=self.url+'apply/layouts/'+str(algorithmName)+'/parameters', PARAMS=None, method="GET", verbose=verbose, parse_params=False, session=self.__session)
         return response
 
 
@@ -138,7 +140,7 @@ class apply(object):
         :returns: 200: successful operation
         """
 
-        response=api(url=self.url+'apply/layouts/'+str(algorithmName)+'', PARAMS=None, method="GET", verbose=verbose, parse_params=False)
+        response=api(url=self.url+'apply/layouts/'+str(algorithmName)+'', PARAMS=None, method="GET", verbose=verbose, parse_params=False, session=self.__session)
         return response
 
 
@@ -155,7 +157,7 @@ class apply(object):
         :returns: 200: successful operation
         """
 
-        response=api(url=self.url+'apply/layouts', PARAMS=None, method="GET", verbose=verbose, parse_params=False)
+        response=api(url=self.url+'apply/layouts', PARAMS=None, method="GET", verbose=verbose, parse_params=False, session=self.__session)
         return response
 
 
@@ -169,6 +171,6 @@ class apply(object):
         :returns: 200: successful operation
         """
 
-        response=api(url=self.url+'apply/layouts/'+str(algorithmName)+'/columntypes', PARAMS=None, method="GET", verbose=verbose, parse_params=False)
+        response=api(url=self.url+'apply/layouts/'+str(algorithmName)+'/columntypes', PARAMS=None, method="GET", verbose=verbose, parse_params=False, session=self.__session)
         return response
 
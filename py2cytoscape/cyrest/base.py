@@ -1,12 +1,12 @@
 import sys
+import time
 import requests
 
+from .. import codec
+from .. import tracing
+from ..transport import Transport, default_transport, POOL_SIZE, MAX_RETRIES
+
 PYTHON_VERSION=sys.version_info[0]
-if PYTHON_VERSION == 2:
-    import urllib2
-elif PYTHON_VERSION == 3:
-    import urllib.request as urllib2
-import json
 
 HOST = 'localhost'
 IP=HOST # temporary
@@ -16,11 +16,110 @@ BASE_URL = 'http://' + HOST + ':' + str(PORT) + '/' + VERSION + '/'
 HEADERS = {'Content-Type': 'application/json'}
 VERBOSE=False
 
+WAIT_TIMEOUT=30
 
 SUID_LIST = 'suid'
 
 BASE_URL_NETWORK = BASE_URL + 'networks'
 
+def create_session(pool_size=POOL_SIZE, max_retries=MAX_RETRIES, backoff_factor=0.1):
+    """
+    Creates a keep-alive HTTP transport with a pool of reusable connections.
+
+    :param pool_size: maximum number of connections kept open to CyREST, default=10
+    :param max_retries: number of times a failed connection is retried, default=3
+    :param backoff_factor: seconds to sleep between retries, doubled at every retry
+
+    :returns: a py2cytoscape.transport.Transport object, used like a requests.Session
+    """
+    return Transport(pool_size=pool_size, max_retries=max_retries, \
+        backoff_factor=backoff_factor)
+
+def default_session():
+    """
+    Returns the pooled transport shared by all calls made without a session of
+    their own. It is also used by the py2cytoscape.data clients.
+    """
+    return default_transport()
+
+class WaitTimeout(Exception):
+    """
+    Raised when Cytoscape does not become ready within the given time.
+    """
+    pass
+
+def wait_for(ready, timeout=WAIT_TIMEOUT, interval=0.01, max_interval=1.0, verbose=False):
+    """
+    Polls until a condition is met, doubling the pause between polls.
+
+    :param ready: function without arguments returning a true value once
+        done, eg. when a view is rendered or an exported file is written
+    :param timeout: seconds to wait before raising WaitTimeout, default=30
+    :param interval: seconds to wait after the first poll, default=0.01
+    :param max_interval: longest pause between two polls, default=1
+    :param verbose: print more
+
+    :returns: the first true value returned by ready
+    """
+    deadline=time.time()+timeout
+    polls=0
+    while True:
+        polls+=1
+        result=ready()
+        if result:
+            if verbose:
+                print("ready after "+str(polls)+" polls")
+                sys.stdout.flush()
+            return result
+        remaining=deadline-time.time()
+        if remaining <= 0:
+            raise WaitTimeout("not ready after "+str(timeout)+" seconds")
+        time.sleep(min(interval,remaining))
+        interval=min(interval*2,max_interval)
+
+def wait_until_stable(read, timeout=WAIT_TIMEOUT, interval=0.05, max_interval=1.0, verbose=False):
+    """
+    Polls until read returns the same true value twice in a row, eg. the size
+    of a file that is still being written or the visual properties of a view
+    that is still being fitted.
+
+    :param read: function without arguments returning the current state
+    :param timeout: seconds to wait before raising WaitTimeout, default=30
+    :param interval: seconds to wait after the first poll, default=0.05
+    :param max_interval: longest pause between two polls, default=1
+    :param verbose: print more
+
+    :returns: the stable value
+    """
+    last=[None]
+    def ready():
+        value=read()
+        stable=bool(value) and value == last[0]
+        last[0]=value
+        return (value,) if stable else None
+    return wait_for(ready, timeout=timeout, interval=interval, max_interval=max_interval, verbose=verbose)[0]
+
+def wait_until_ready(url=BASE_URL, timeout=WAIT_TIMEOUT, verbose=False, session=None):
+    """
+    Waits until CyREST answers its status call, eg. after starting Cytoscape.
+    CyREST answers it right away while busy, use wait_until_stable to wait
+    for UI work to finish.
+
+    :param url: CyREST base url, default='http://localhost:1234/v1/'
+    :param timeout: seconds to wait before raising WaitTimeout, default=30
+    :param verbose: print more
+    :param session: Transport or requests.Session to send the calls through, default=a shared
+        pooled session
+    """
+    if session is None:
+        session=default_session()
+    def ready():
+        try:
+            return session.get(url).status_code == 200
+        except requests.exceptions.ConnectionError:
+            return False
+    return wait_for(ready, timeout=timeout, verbose=verbose)
+
 def set_param(parameters,values):
     PARAMS={}
     for p,v in zip(parameters,values):
@@ -77,7 +176,7 @@ def handle_status_codes(x,verbose=False):
     return res
 
 
-def api(namespace=None, command="", PARAMS={}, body=None, host=HOST, port=str(PORT), version=VERSION, method="POST", verbose=VERBOSE, url=None, parse_params=True):
+def api(namespace=None, command="", PARAMS={}, body=None, host=HOST, port=str(PORT), version=VERSION, method="POST", verbose=VERBOSE, url=None, parse_params=True, session=None):
     """
     General function for interacting with Cytoscape API.
 
@@ -90,6 +189,8 @@ def api(namespace=None, command="", PARAMS={}, body=None, host=HOST, port=str(PO
     :param version: API version
     :param method: type of http call, ie. "POST" or "GET" or "HELP".
     :param verbose: print more information
+    :param session: Transport or requests.Session to send the call through, default=a shared
+        pooled session
 
     :returns: For "POST" the data in the content's response. For "GET" None.
 
@@ -97,6 +198,9 @@ def api(namespace=None, command="", PARAMS={}, body=None, host=HOST, port=str(PO
     cytoscape("string","pubmed query",{"pubmed":"p53 p21","limit":"50"})
     """
 
+    if session is None:
+        session=default_session()
+
     if url:
         baseurl=url
     else:
@@ -124,9 +228,9 @@ def api(namespace=None, command="", PARAMS={}, body=None, host=HOST, port=str(PO
             print("'"+URL+"'")
             sys.stdout.flush()
         if parse_params:
-            r = requests.get(url = URL)
+            r = session.get(url = URL)
         else:
-            r = requests.get(url = URL, params=PARAMS)
+            r = session.get(url = URL, params=PARAMS)
         verbose_=checkresponse(r, verbose=verbose)
         if (verbose) or (verbose_):
             print("'"+URL+"'")
@@ -142,12 +246,13 @@ def api(namespace=None, command="", PARAMS={}, body=None, host=HOST, port=str(PO
         if verbose:
             print("'"+URL+"'")
             sys.stdout.flush()
-        r = requests.delete(url = URL)
+        r = session.delete(url = URL)
         verbose_=checkresponse(r, verbose=verbose)
         if (verbose) or (verbose_):
             print("'"+URL+"'")
             sys.stdout.flush()
-        res=json.loads(r.content)
+        with tracing.timed('parse'):
+            res=codec.loads(r.content)
         if len(res["errors"]) > 0:
             raise ValueError(res["errors"][0])         
 
@@ -155,13 +260,14 @@ def api(namespace=None, command="", PARAMS={}, body=None, host=HOST, port=str(PO
         if verbose:
             print("'"+baseurl+"'")
             sys.stdout.flush()
-        r = requests.post(url = baseurl, json = PARAMS)
+        r = session.post(url = baseurl, json = PARAMS)
         verbose_=checkresponse(r, verbose=verbose)
         if (verbose) or (verbose_):
             verbose=True
             print(r.content)
             sys.stdout.flush()
-        res=json.loads(r.content)
+        with tracing.timed('parse'):
+            res=codec.loads(r.content)
         if "errors" in res.keys():
             if len(res["errors"]) > 0:
                 raise ValueError(res["errors"][0]) 
@@ -175,13 +281,14 @@ def api(namespace=None, command="", PARAMS={}, body=None, host=HOST, port=str(PO
         if verbose:
             print("'"+baseurl+"'")
             sys.stdout.flush()
-        r = requests.put(url = baseurl, data = None)
+        r = session.put(url = baseurl, json = body)
         verbose_=checkresponse(r, verbose=verbose)
         if (verbose) or (verbose_):
             verbose=True
             print(r.content)
             sys.stdout.flush()
-        res=json.loads(r.content)
+        with tracing.timed('parse'):
+            res=codec.loads(r.content)
         if "errors" in res.keys():
             if len(res["errors"]) > 0:
                 raise ValueError(res["errors"][0])     
@@ -203,11 +310,9 @@ def api(namespace=None, command="", PARAMS={}, body=None, host=HOST, port=str(PO
         if verbose:
             print("'"+URL+"'")
             sys.stdout.flush()
-        response = urllib2.urlopen(URL)
+        response = session.get(url = URL)
 
-        res = response.read()
-        if PYTHON_VERSION == 3:
-            res=res.decode("utf-8")
+        res = response.content.decode("utf-8")
         res = res.split("\n")
         def clean(x):
             r=x.split("</p>")[0].split(">")[-1]
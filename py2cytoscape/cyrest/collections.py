@@ -5,10 +5,12 @@ class collections(object):
     cytoscape session interface as shown in CyREST's swagger documentation.
 
     :param url: an url of the type 'http://' + host + ':' + str(port) + '/' + version + '/'.
+    :param session: a Transport or requests.Session to send the calls through, default=a shared pooled transport.
     """
 
-    def __init__(self, url):
+    def __init__(self, url, session=None):
         self.__url = url + 'commands/collections'
+        self.__session = session if session is not None else default_session()
 
 
     def getCollectionCount(verbose=None):
@@ -20,5 +22,5 @@ class collections(object):
         :returns: 200: successful operation
         """
 
-        response=api(url=self.url+'collections/count', PARAMS=None, method="GET", verbose=verbose, parse_params=False)
+        response=api(url=self.url+'collections/count', PARAMS=None, method="GET", verbose=verbose, parse_params=False, session=self.__session)
         return response
\ No newline at end of file
@@ -5,10 +5,12 @@ class command(object):
     cytoscape command as shown in CyREST's swagger documentation for 'Command'.
 
     :param url: an url of the type 'http://' + host + ':' + str(port) + '/' + version + '/'.
+    :param session: a Transport or requests.Session to send the calls through, default=a shared pooled transport.
     """
 
-    def __init__(self, url):
+    def __init__(self, url, session=None):
         self.__url = url + 'commands/command'
+        self.__session = session if session is not None else default_session()
 
     def echo(self, variableName, verbose=False):
         """
@@ -19,7 +21,7 @@ class command(object):
         :param verbose: print more
         """
         PARAMS={"variableName":variableName}
-        response=api(url=self.__url+"/echo", PARAMS=PARAMS, verbose=verbose)
+        response=api(url=self.__url+"/echo", PARAMS=PARAMS, verbose=verbose, session=self.__session)
         return response
 
     def open_dialog(self, verbose=False):
@@ -30,7 +32,7 @@ class command(object):
 
         :param verbose: print more
         """
-        response=api(url=self.__url+"/open dialog", verbose=verbose)
+        response=api(url=self.__url+"/open dialog", verbose=verbose, session=self.__session)
         return response
 
 
@@ -44,7 +46,7 @@ class command(object):
         """
 
         PARAMS=set_param(["message"],[message])
-        response=api(url=self.__url+"/pause", PARAMS=PARAMS, verbose=verbose)
+        response=api(url=self.__url+"/pause", PARAMS=PARAMS, verbose=verbose, session=self.__session)
         return response
 
     
@@ -55,7 +57,7 @@ class command(object):
 
         :param verbose: print more
         """
-        response=api(url=self.__url+"/quit", verbose=verbose)
+        response=api(url=self.__url+"/quit", verbose=verbose, session=self.__session)
         return response
 
     def run(self,script_file,args=None,verbose=False):
@@ -71,7 +73,7 @@ class command(object):
         """
 
         PARAMS=set_param(["file","args"],[script_file,args])
-        response=api(url=self.__url+"/run", PARAMS=PARAMS, verbose=verbose)
+        response=api(url=self.__url+"/run", PARAMS=PARAMS, verbose=verbose, session=self.__session)
         return response
 
     def sleep(self,duration,verbose=False):
@@ -83,7 +85,7 @@ class command(object):
         :param verbose: print more
         """
         PARAMS={"duration":str(duration)}
-        response=api(url=self.__url+"/sleep", PARAMS=PARAMS, verbose=verbose)
+        response=api(url=self.__url+"/sleep", PARAMS=PARAMS, verbose=verbose, session=self.__session)
         return response
 
     
\ No newline at end of file
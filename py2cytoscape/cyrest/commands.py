@@ -5,16 +5,18 @@ class commands(object):
     cytoscape commands as shown in CyREST's swagger documentation for 'Commands'.
 
     :param url: an url of the type 'http://' + host + ':' + str(port) + '/' + version + '/'.
+    :param session: a Transport or requests.Session to send the calls through, default=a shared pooled transport.
     """
 
-    def __init__(self, url):
+    def __init__(self, url, session=None):
         self.__url = url + 'commands'
+        self.__session = session if session is not None else default_session()
 
     def list_namespaces(self, verbose=False):
         """
         List all available command namespaces.
         """
-        response=api(url=self.__url,method="HTML", verbose=verbose)
+        response=api(url=self.__url,method="HTML", verbose=verbose, session=self.__session)
         return response
 
     def namespace(self, namespace, verbose=False):
@@ -24,7 +26,7 @@ class commands(object):
         :param namespace: a namespace as listed in rest.cyclient.commands.list().
         :param verbose: print more
         """
-        response=api(url=self.__url+"/"+namespace,method="HTML",verbose=verbose)
+        response=api(url=self.__url+"/"+namespace,method="HTML",verbose=verbose, session=self.__session)
         return response
 
     def command(self, namespace, command, verbose=False):
@@ -35,7 +37,7 @@ class commands(object):
         :param command: a commands as listed in rest.cyclient.commands.namespace(<namespace>).
         :param verbose: print more
         """
-        response=api(url=self.__url+"/"+namespace+"/"+command,method="HTML",verbose=verbose)
+        response=api(url=self.__url+"/"+namespace+"/"+command,method="HTML",verbose=verbose, session=self.__session)
         return response
 
     
\ No newline at end of file
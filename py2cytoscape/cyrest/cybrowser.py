@@ -5,10 +5,12 @@ class cybrowser(object):
     cytoscape cybrowser interface as shown in CyREST's swagger documentation for 'cybrowser'.
 
     :param url: an url of the type 'http://' + host + ':' + str(port) + '/' + version + '/'.
+    :param session: a Transport or requests.Session to send the calls through, default=a shared pooled transport.
     """
 
-    def __init__(self, url):
+    def __init__(self, url, session=None):
         self.__url = url + 'commands/cybrowser'
+        self.__session = session if session is not None else default_session()
 
     def dialog(self=None, wid=None, text=None, title=None, url=None, debug=False, verbose=False):
         """
@@ -23,7 +25,7 @@ class cybrowser(object):
         """
 
         PARAMS=set_param(["id","text","title","url","debug"],[wid,text,title,url,debug])
-        response=api(url=self.__url+"/dialog?",PARAMS=PARAMS, method="GET", verbose=verbose)
+        response=api(url=self.__url+"/dialog?",PARAMS=PARAMS, method="GET", verbose=verbose, session=self.__session)
         return response
 
     def hide(self, wid, verbose=False):
@@ -36,7 +38,7 @@ class cybrowser(object):
 
         PARAMS={"id":wid}
 
-        response=api(url=self.__url+"/hide?",PARAMS=PARAMS, method="GET", verbose=verbose)
+        response=api(url=self.__url+"/hide?",PARAMS=PARAMS, method="GET", verbose=verbose, session=self.__session)
         return response
 
     def show(self, wid=None, text=None, title=None, url=None, verbose=False):
@@ -55,7 +57,7 @@ class cybrowser(object):
             if v:
                 PARAMS[p]=v
 
-        response=api(url=self.__url+"/show?",PARAMS=PARAMS, method="GET", verbose=verbose)
+        response=api(url=self.__url+"/show?",PARAMS=PARAMS, method="GET", verbose=verbose, session=self.__session)
         return response
  
     def version(self, verbose=False):
@@ -64,7 +66,7 @@ class cybrowser(object):
 
         :param verbose: print more
         """
-        response=api(url=self.__url+"/version",method="HTML", verbose=verbose)
+        response=api(url=self.__url+"/version",method="HTML", verbose=verbose, session=self.__session)
         return response
 
     
\ No newline at end of file
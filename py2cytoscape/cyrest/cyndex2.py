@@ -5,10 +5,12 @@ class cyndex2(object):
     cytoscape session interface as shown in CyREST's swagger documentation.
 
     :param url: an url of the type 'http://' + host + ':' + str(port) + '/' + version + '/'.
+    :param session: a Transport or requests.Session to send the calls through, default=a shared pooled transport.
     """
 
-    def __init__(self, url):
+    def __init__(self, url, session=None):
         self.__url = url + 'commands/cyndex2'
+        self.__session = session if session is not None else default_session()
 
 
     def updateNetworkInNdex(suid, body, verbose=None):
@@ -25,7 +27,7 @@ class cyndex2(object):
         surl=self.url
         sv=surl.split('/')[-1]
         surl=surl.rstrip(sv+'/')
-        response=api(url=surl+'/cyndex2/'+sv+'/networks/'+str(suid)+'', method="PUT", body=body, verbose=verbose)
+        response=api(url=surl+'/cyndex2/'+sv+'/networks/'+str(suid)+'', method="PUT", body=body, verbose=verbose, session=self.__session)
         return response
 
 
@@ -44,7 +46,7 @@ class cyndex2(object):
         sv=surl.split('/')[-1]
         surl=surl.rstrip(sv+'/')
         PARAMS=set_param(['suid','body'],[suid,body])
-        response=api(url=surl+'/cyndex2/'+sv+'/networks/'+str(suid)+'', PARAMS=PARAMS, method="POST", verbose=verbose)
+        response=api(url=surl+'/cyndex2/'+sv+'/networks/'+str(suid)+'', PARAMS=PARAMS, method="POST", verbose=verbose, session=self.__session)
         return response
 
 
@@ -61,7 +63,7 @@ class cyndex2(object):
         surl=self.url
         sv=surl.split('/')[-1]
         surl=surl.rstrip(sv+'/')
-        response=api(url=surl+'/cyndex2/'+sv+'/networks/'+str(suid)+'', PARAMS=None, method="GET", verbose=verbose, parse_params=False)
+        response=api(url=surl+'/cyndex2/'+sv+'/networks/'+str(suid)+'', PARAMS=None, method="GET", verbose=verbose, parse_params=False, session=self.__session)
         return response
 
 
@@ -77,7 +79,7 @@ class cyndex2(object):
         surl=self.url
         sv=surl.split('/')[-1]
         surl=surl.rstrip(sv+'/')
-        response=api(url=surl+'/cyndex2/v1', PARAMS=None, method="GET", verbose=verbose, parse_params=False)
+        response=api(url=surl+'/cyndex2/v1', PARAMS=None, method="GET", verbose=verbose, parse_params=False, session=self.__session)
         return response
 
 
@@ -94,7 +96,7 @@ class cyndex2(object):
         surl=self.url
         sv=surl.split('/')[-1]
         surl=surl.rstrip(sv+'/')
-        response=api(url=surl+'/cyndex2/'+sv+'/networks/current', method="PUT", body=body, verbose=verbose)
+        response=api(url=surl+'/cyndex2/'+sv+'/networks/current', method="PUT", body=body, verbose=verbose, session=self.__session)
         return response
 
 
@@ -112,7 +114,7 @@ class cyndex2(object):
         sv=surl.split('/')[-1]
         surl=surl.rstrip(sv+'/')
         PARAMS=set_param(['body'],[body])
-        response=api(url=surl+'/cyndex2/'+sv+'/networks/current', PARAMS=PARAMS, method="POST", verbose=verbose)
+        response=api(url=surl+'/cyndex2/'+sv+'/networks/current', PARAMS=PARAMS, method="POST", verbose=verbose, session=self.__session)
         return response
 
 
@@ -128,7 +130,7 @@ class cyndex2(object):
         surl=self.url
         sv=surl.split('/')[-1]
         surl=surl.rstrip(sv+'/')
-        response=api(url=surl+'/cyndex2/'+sv+'/networks/current', PARAMS=None, method="GET", verbose=verbose, parse_params=False)
+        response=api(url=surl+'/cyndex2/'+sv+'/networks/current', PARAMS=None, method="GET", verbose=verbose, parse_params=False, session=self.__session)
         return response
 
 
@@ -146,5 +148,5 @@ class cyndex2(object):
         sv=surl.split('/')[-1]
         surl=surl.rstrip(sv+'/')
         PARAMS=set_param(['body'],[body])
-        response=api(url=surl+'/cyndex2/'+sv+'/networks', PARAMS=PARAMS, method="POST", verbose=verbose)
+        response=api(url=surl+'/cyndex2/'+sv+'/networks', PARAMS=PARAMS, method="POST", verbose=verbose, session=self.__session)
         return response
\ No newline at end of file
@@ -32,49 +32,90 @@ class cyclient(object):
     :param host: CyREST host server address. default='localhost'
     :param port: CyREST port number. default=1234
     :param version: CyREST version. default='v1'
+    :param pool_size: number of keep-alive connections kept open. default=10
+    :param max_retries: number of times a failed connection is retried. default=3
+    :param transport: a py2cytoscape.transport.Transport to send all calls through,
+        eg. one shared with a CyRestClient. pool_size and max_retries are ignored
+        when given. default=a new Transport
 
     returns: a cyclient object.
     """
 
-    def __init__(self, host=HOST, port=PORT, version=VERSION):
+    def __init__(self, host=HOST, port=PORT, version=VERSION, pool_size=POOL_SIZE, max_retries=MAX_RETRIES, transport=None):
         self.__url = 'http://' + host + ':' + str(port) + '/' + version + '/'
+        if transport is None:
+            transport = create_session(pool_size=pool_size, max_retries=max_retries)
+        self.__session = transport
         #self.host=host
         #self.port=port
         #self.version=version
-        self.commands=commands(self.__url)
-        self.command=command(self.__url)
-        self.cybrowser=cybrowser(self.__url)
-        self.session=session(self.__url)
-        self.network=network(self.__url)
-        self.node=node(self.__url)
-        self.vizmap=vizmap(self.__url)
-        self.diffusion=diffusion(self.__url)
-        self.edge=edge(self.__url)
-        self.group=group(self.__url)
-        self.view=view(self.__url)
-        self.layout=layout(self.__url)
-        self.table=table(self.__url)
-        self.cyndex2=cyndex2(self.__url)
-        self.apply=apply(self.__url)
-        self.styles=styles(self.__url)
-        self.ui=ui(self.__url)
-        self.enrichmentmap=enrichmentmap(self.__url)
-        self.collections=collections(self.__url)
-        self.apps=apps(self.__url)
-        self.networks=networks(self.__url)
+        self.commands=commands(self.__url, session=self.__session)
+        self.command=command(self.__url, session=self.__session)
+        self.cybrowser=cybrowser(self.__url, session=self.__session)
+        self.session=session(self.__url, session=self.__session)
+        self.network=network(self.__url, session=self.__session)
+        self.node=node(self.__url, session=self.__session)
+        self.vizmap=vizmap(self.__url, session=self.__session)
+        self.diffusion=diffusion(self.__url, session=self.__session)
+        self.edge=edge(self.__url, session=self.__session)
+        self.group=group(self.__url, session=self.__session)
+        self.view=view(self.__url, session=self.__session)
+        self.layout=layout(self.__url, session=self.__session)
+        self.table=table(self.__url, session=self.__session)
+        self.cyndex2=cyndex2(self.__url, session=self.__session)
+        self.apply=apply(self.__url, session=self.__session)
+        self.styles=styles(self.__url, session=self.__session)
+        self.ui=ui(self.__url, session=self.__session)
+        self.enrichmentmap=enrichmentmap(self.__url, session=self.__session)
+        self.collections=collections(self.__url, session=self.__session)
+        self.apps=apps(self.__url, session=self.__session)
+        self.networks=networks(self.__url, session=self.__session)
 
 
+    def close(self):
+        """
+        Closes the pooled connections of the client's transport.
+        """
+        self.__session.close()
+
     def status(self, verbose=False):
         """
         Checks the status of your CyREST server.
         """
         try:
-            response=api(url=self.__url, method="GET", verbose=verbose)
+            response=api(url=self.__url, method="GET", verbose=verbose, session=self.__session)
         except Exception as e:
             print('Could not get status from CyREST:\n\n' + str(e))
         else:
             print('CyREST online!')
 
+    def wait(self, timeout=WAIT_TIMEOUT, verbose=False):
+        """
+        Waits until your CyREST server answers, polling with a growing
+        pause between calls.
+
+        :param timeout: seconds to wait before raising WaitTimeout, default=30
+        """
+        return wait_until_ready(url=self.__url, timeout=timeout, verbose=verbose, session=self.__session)
+
+    def wait_for_view(self, network="current", timeout=WAIT_TIMEOUT, verbose=False):
+        """
+        Waits until the view of a network stops changing, eg. after fitting
+        it, by polling its network visual properties (center, scale, size).
+
+        :param network: network name, SUID:<suid> or "current", default="current"
+        :param timeout: seconds to wait before raising WaitTimeout, default=30
+
+        :returns: the network visual properties of the view
+        """
+        PARAMS={"network":network, "columnList":"SUID"}
+        suid=api(url=self.__url+"commands/network/get attribute", PARAMS=PARAMS, verbose=verbose, session=self.__session)[0]["SUID"]
+        url=self.__url+"networks/"+str(suid)+"/views/first/network"
+        def read():
+            response=self.__session.get(url)
+            return response.json() if response.status_code == 200 else None
+        return wait_until_stable(read, timeout=timeout, verbose=verbose)
+
     def copy(self):
         """
         Creates a copy of the cyclient object.
@@ -85,12 +126,12 @@ class cyclient(object):
         """
         Checks Cytoscape version
         """
-        response=api(url=self.__url+"version",method="H", verbose=verbose)
-        response=json.loads(response)
+        response=api(url=self.__url+"version",method="H", verbose=verbose, session=self.__session)
+        response=codec.loads(response)
         for k in response.keys():
             print(k, response[k])
 
-    def result(self, filetype="PNG", saveas=None, verbose=False):
+    def result(self, filetype="PNG", saveas=None, timeout=WAIT_TIMEOUT, verbose=False):
         """
         Checks the current network. 
             
@@ -98,15 +139,15 @@ class cyclient(object):
         :param saveas: /path/to/non/tmp/file.prefix
         :param host: cytoscape host address, default=cytoscape_host
         :param port: cytoscape port, default=1234
+        :param timeout: seconds to wait for Cytoscape and the exported file, default=30
         :returns: an image
         """
         from wand.image import Image as WImage
         from shutil import copyfile
         import tempfile
-        from time import sleep
         import os
 
-        sleep(1)
+        self.wait(timeout=timeout, verbose=verbose)
         u=self.__url 
         host=u.split("//")[1].split(":")[0]
         port=u.split(":")[2].split("/")[0]
@@ -123,10 +164,14 @@ class cyclient(object):
         extensions={"PNG":".png","PDF":".pdf","CYS":".cys","CYJS":".cyjs"}
         ext=extensions[filetype]
         
-        response=api("view","fit content",host=host,port=port, version=version, verbose=verbose)
-        sleep(2)
-        response=api("view", "export" , {"options":filetype,"OutputFile":outfile}, host=host,port=port,version=version,verbose=verbose)
-        if host!='localhost':
+        response=api("view","fit content",host=host,port=port, version=version, verbose=verbose, session=self.__session)
+        self.wait_for_view(timeout=timeout, verbose=verbose)
+        response=api("view", "export" , {"options":filetype,"OutputFile":outfile}, host=host,port=port,version=version,verbose=verbose, session=self.__session)
+        if host=='localhost':
+            # the file may still be written after the command returned
+            wait_until_stable(lambda: os.path.getsize(outfile+ext) if os.path.exists(outfile+ext) else 0, \
+                timeout=timeout, verbose=verbose)
+        else:
             import paramiko
             print("Looking to ssh keys for remote access.")
             ssh = paramiko.SSHClient()
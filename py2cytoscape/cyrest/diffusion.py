@@ -5,10 +5,12 @@ class diffusion(object):
     cytoscape session interface as shown in CyREST's swagger documentation for 'diffusion'.
 
     :param url: an url of the type 'http://' + host + ':' + str(port) + '/' + version + '/'.
+    :param session: a Transport or requests.Session to send the calls through, default=a shared pooled transport.
     """
 
-    def __init__(self, url):
+    def __init__(self, url, session=None):
         self.__url = url + 'commands/diffusion'
+        self.__session = session if session is not None else default_session()
 
     def diffuse(self, verbose=False):
         """
@@ -24,7 +26,7 @@ class diffusion(object):
         :param verbose: print more
 
         """
-        response=api(url=self.__url+"/diffuse", method="POST", verbose=verbose)
+        response=api(url=self.__url+"/diffuse", method="POST", verbose=verbose, session=self.__session)
         return response
 
     def diffuse_advanced(self, heatColumnName=None, time=None, verbose=False):
@@ -44,5 +46,5 @@ class diffusion(object):
         :param verbose: print more
         """
         PARAMS=set_param(["heatColumnName","time"],[heatColumnName,time])
-        response=api(url=self.__url+"/diffuse_advanced", PARAMS=PARAMS, method="POST", verbose=verbose)
+        response=api(url=self.__url+"/diffuse_advanced", PARAMS=PARAMS, method="POST", verbose=verbose, session=self.__session)
         return response
@@ -5,10 +5,12 @@ class edge(object):
     cytoscape session interface as shown in CyREST's swagger documentation for 'edge'.
 
     :param url: an url of the type 'http://' + host + ':' + str(port) + '/' + version + '/'.
+    :param session: a Transport or requests.Session to send the calls through, default=a shared pooled transport.
     """
 
-    def __init__(self, url):
+    def __init__(self, url, session=None):
         self.__url = url + 'commands/edge'
+        self.__session = session if session is not None else default_session()
 
     def create_attribute(self,column=None,listType=None,namespace=None, network=None, atype=None, verbose=False):
         """
@@ -31,7 +33,7 @@ class edge(object):
         """
         network=check_network(self,network,verbose=verbose)
         PARAMS=set_param(["column","listType","namespace","network","type"],[column,listType,namespace,network,atype])
-        response=api(url=self.__url+"/create attribute", PARAMS=PARAMS, method="POST", verbose=verbose)
+        response=api(url=self.__url+"/create attribute", PARAMS=PARAMS, method="POST", verbose=verbose, session=self.__session)
         return response
 
     def get(self,edge=None,network=None,sourceNode=None, targetNode=None, atype=None, verbose=False):
@@ -64,7 +66,7 @@ class edge(object):
         """
         network=check_network(self,network,verbose=verbose)
         PARAMS=set_param(["edge","network","sourceNode","targetNode","type"],[edge,network,sourceNode,targetNode,atype])
-        response=api(url=self.__url+"/get", PARAMS=PARAMS, method="POST", verbose=verbose)
+        response=api(url=self.__url+"/get", PARAMS=PARAMS, method="POST", verbose=verbose, session=self.__session)
         return response
 
     def get_attribute(self,columnList=None,edgeList=None,namespace=None, network=None, verbose=False):
@@ -94,7 +96,7 @@ class edge(object):
         """
         network=check_network(self,network,verbose=verbose)
         PARAMS=set_param(["columnList","edgeList","namespace","network"],[columnList,edgeList,namespace,network])
-        response=api(url=self.__url+"/get attribute", PARAMS=PARAMS, method="POST", verbose=verbose)
+        response=api(url=self.__url+"/get attribute", PARAMS=PARAMS, method="POST", verbose=verbose, session=self.__session)
         return response
 
     def get_properties(self,edgeList=None,network=None,propertyList=None, verbose=False):
@@ -134,7 +136,7 @@ class edge(object):
         """
         network=check_network(self,network,verbose=verbose)
         PARAMS=set_param(["edgeList","network","propertyList"],[edgeList,network,propertyList])
-        response=api(url=self.__url+"/get properties", PARAMS=PARAMS, method="POST", verbose=verbose)
+        response=api(url=self.__url+"/get properties", PARAMS=PARAMS, method="POST", verbose=verbose, session=self.__session)
         return response
 
     def list(self, edgeList=None, network=None, verbose=False):
@@ -157,7 +159,7 @@ class edge(object):
         """
         network=check_network(self,network,verbose=verbose)
         PARAMS=set_param(["edgeList","network"],[edgeList,network])
-        response=api(url=self.__url+"/list", PARAMS=PARAMS, method="POST", verbose=verbose)
+        response=api(url=self.__url+"/list", PARAMS=PARAMS, method="POST", verbose=verbose, session=self.__session)
         return response
 
     def list_attributes(self,columnList=None,edgeList=None,namespace=None, network=None, verbose=False):
@@ -194,7 +196,7 @@ class edge(object):
         """
         network=check_network(self,network,verbose=verbose)
         PARAMS=set_param(["columnList","edgeList","namespace","network"],[columnList,edgeList,namespace,network])
-        response=api(url=self.__url+"/list attributes", PARAMS=PARAMS, method="POST", verbose=verbose)
+        response=api(url=self.__url+"/list attributes", PARAMS=PARAMS, method="POST", verbose=verbose, session=self.__session)
         return response
 
     def list_properties(self,columnList=None,edgeList=None,namespace=None, network=None, verbose=False):
@@ -220,7 +222,7 @@ class edge(object):
         """
         network=check_network(self,network,verbose=verbose)
         PARAMS=set_param(["network"],[network])
-        response=api(url=self.__url+"/list properties", PARAMS=PARAMS, method="POST", verbose=verbose)
+        response=api(url=self.__url+"/list properties", PARAMS=PARAMS, method="POST", verbose=verbose, session=self.__session)
         return response
 
     def rename(self, edge=None, network=None, newName=None, verbose=False):
@@ -238,7 +240,7 @@ class edge(object):
         """
         network=check_network(self,network,verbose=verbose)
         PARAMS=set_param(["edge","network","newName"],[edge,network,newName])
-        response=api(url=self.__url+"/rename", PARAMS=PARAMS, method="POST", verbose=verbose)
+        response=api(url=self.__url+"/rename", PARAMS=PARAMS, method="POST", verbose=verbose, session=self.__session)
         return response
 
     def set_attribute(self, columnList=None, edgeList=None, namespace=None, network=None, valueList=None, verbose=False):
@@ -268,7 +270,7 @@ class edge(object):
         """
         network=check_network(self,network,verbose=verbose)
         PARAMS=set_param(["columnList","edgeList","namespace","network", "valueList"],[columnList, edgeList, namespace, network, valueList])
-        response=api(url=self.__url+"/set attribute", PARAMS=PARAMS, method="POST", verbose=verbose)
+        response=api(url=self.__url+"/set attribute", PARAMS=PARAMS, method="POST", verbose=verbose, session=self.__session)
         return response
 
     def set_properties(self, edgeList=None, network=None, propertyList=None, valueList=None, verbose=False):
@@ -292,5 +294,5 @@ class edge(object):
         """
         network=check_network(self,network,verbose=verbose)
         PARAMS=set_param(["edgeList","network","propertyList","valueList"],[edgeList, network, propertyList, valueList])
-        response=api(url=self.__url+"/set properties", PARAMS=PARAMS, method="POST", verbose=verbose)
+        response=api(url=self.__url+"/set properties", PARAMS=PARAMS, method="POST", verbose=verbose, session=self.__session)
         return response
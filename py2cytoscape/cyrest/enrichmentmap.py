@@ -5,10 +5,12 @@ class enrichmentmap(object):
     cytoscape session interface as shown in CyREST's swagger documentation.
 
     :param url: an url of the type 'http://' + host + ':' + str(port) + '/' + version + '/'.
+    :param session: a Transport or requests.Session to send the calls through, default=a shared pooled transport.
     """
 
-    def __init__(self, url):
+    def __init__(self, url, session=None):
         self.__url = url + 'commands/enrichmentmap'
+        self.__session = session if session is not None else default_session()
 
 
     def getModelData(network, verbose=None):
@@ -24,7 +26,7 @@ class enrichmentmap(object):
         surl=self.url
         sv=surl.split('/')[-1]
         surl=surl.rstrip(sv+'/')
-        response=api(url=surl+'/enrichmentmap/model/'+str(network)+'', PARAMS=None, method="GET", verbose=verbose, parse_params=False)
+        response=api(url=surl+'/enrichmentmap/model/'+str(network)+'', PARAMS=None, method="GET", verbose=verbose, parse_params=False, session=self.__session)
         return response
 
 
@@ -41,7 +43,7 @@ class enrichmentmap(object):
         surl=self.url
         sv=surl.split('/')[-1]
         surl=surl.rstrip(sv+'/')
-        response=api(url=surl+'/enrichmentmap/expressions/'+str(network)+'', PARAMS=None, method="GET", verbose=verbose, parse_params=False)
+        response=api(url=surl+'/enrichmentmap/expressions/'+str(network)+'', PARAMS=None, method="GET", verbose=verbose, parse_params=False, session=self.__session)
         return response
 
 
@@ -59,5 +61,5 @@ class enrichmentmap(object):
         surl=self.url
         sv=surl.split('/')[-1]
         surl=surl.rstrip(sv+'/')
-        response=api(url=surl+'/enrichmentmap/expressions/'+str(network)+'/'+str(node)+'', PARAMS=None, method="GET", verbose=verbose, parse_params=False)
+        response=api(url=surl+'/enrichmentmap/expressions/'+str(network)+'/'+str(node)+'', PARAMS=None, method="GET", verbose=verbose, parse_params=False, session=self.__session)
         return response
\ No newline at end of file
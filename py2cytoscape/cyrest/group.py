@@ -5,10 +5,12 @@ class group(object):
     cytoscape session interface as shown in CyREST's swagger documentation for 'group'.
 
     :param url: an url of the type 'http://' + host + ':' + str(port) + '/' + version + '/'.
+    :param session: a Transport or requests.Session to send the calls through, default=a shared pooled transport.
     """
 
-    def __init__(self, url):
+    def __init__(self, url, session=None):
         self.__url = url + 'commands/group'
+        self.__session = session if session is not None else default_session()
 
     def add(self, edgeList=None, groupName=None, network=None, nodeList=None, verbose=False):
         """
@@ -38,7 +40,7 @@ class group(object):
         """
         network=check_network(self,network,verbose=verbose)
         PARAMS=set_param(["edgeList","groupName","network","nodeList"],[edgeList,groupName,network,nodeList])
-        response=api(url=self.__url+"/add", PARAMS=PARAMS, method="POST", verbose=verbose)
+        response=api(url=self.__url+"/add", PARAMS=PARAMS, method="POST", verbose=verbose, session=self.__session)
         return response
 
     def collapse(self, groupList=None, network=None, verbose=False):
@@ -56,7 +58,7 @@ class group(object):
         """
         network=check_network(self,network,verbose=verbose)
         PARAMS=set_param(["groupList","network"],[groupList,network])
-        response=api(url=self.__url+"/collapse", PARAMS=PARAMS, method="POST", verbose=verbose)
+        response=api(url=self.__url+"/collapse", PARAMS=PARAMS, method="POST", verbose=verbose, session=self.__session)
         return response
 
     def create(self, groupName=None, network=None, nodeList=None, verbose=False):
@@ -82,7 +84,7 @@ class group(object):
         """
         network=check_network(self,network,verbose=verbose)
         PARAMS=set_param(["groupName","network","nodeList"],[groupName,network,nodeList])
-        response=api(url=self.__url+"/create", PARAMS=PARAMS, method="POST", verbose=verbose)
+        response=api(url=self.__url+"/create", PARAMS=PARAMS, method="POST", verbose=verbose, session=self.__session)
         return response
 
     def expand(self, groupList=None, network=None, verbose=False):
@@ -100,7 +102,7 @@ class group(object):
         """
         network=check_network(self,network,verbose=verbose)
         PARAMS=set_param(["groupList","network"],[groupList,network])
-        response=api(url=self.__url+"/expand", PARAMS=PARAMS, method="POST", verbose=verbose)
+        response=api(url=self.__url+"/expand", PARAMS=PARAMS, method="POST", verbose=verbose, session=self.__session)
         return response
 
     def get(self, network=None, node=None, verbose=False):
@@ -116,7 +118,7 @@ class group(object):
         """
         network=check_network(self,network,verbose=verbose)
         PARAMS=set_param(["network","node"],[network,node])
-        response=api(url=self.__url+"/get", PARAMS=PARAMS, method="POST", verbose=verbose)
+        response=api(url=self.__url+"/get", PARAMS=PARAMS, method="POST", verbose=verbose, session=self.__session)
         return response
 
     def glist(self, network=None, verbose=False):
@@ -132,7 +134,7 @@ class group(object):
         """
         network=check_network(self,network,verbose=verbose)
         PARAMS=set_param(["network"],[network])
-        response=api(url=self.__url+"/list", PARAMS=PARAMS, method="POST", verbose=verbose)
+        response=api(url=self.__url+"/list", PARAMS=PARAMS, method="POST", verbose=verbose, session=self.__session)
         return response
 
     def remove(self, edgeList=None, groupName=None, network=None, nodeList=None, verbose=False):
@@ -162,7 +164,7 @@ class group(object):
         """
         network=check_network(self,network,verbose=verbose)
         PARAMS=set_param(["edgeList","groupName","network","nodeList"],[edgeList,groupName,network,nodeList])
-        response=api(url=self.__url+"/remove", PARAMS=PARAMS, method="POST", verbose=verbose)
+        response=api(url=self.__url+"/remove", PARAMS=PARAMS, method="POST", verbose=verbose, session=self.__session)
         return response
 
     def rename(self, groupName=None, network=None, newName=None, verbose=False):
@@ -180,7 +182,7 @@ class group(object):
         """
         network=check_network(self,network,verbose=verbose)
         PARAMS=set_param(["network","nodeList","newName"],[network,nodeList,newName])
-        response=api(url=self.__url+"/rename", PARAMS=PARAMS, method="POST", verbose=verbose)
+        response=api(url=self.__url+"/rename", PARAMS=PARAMS, method="POST", verbose=verbose, session=self.__session)
         return response
 
 
@@ -202,5 +204,5 @@ class group(object):
         """
         network=check_network(self,network,verbose=verbose)
         PARAMS=set_param(["network","nodeList"],[network,nodeList])
-        response=api(url=self.__url+"/ungroup", PARAMS=PARAMS, method="POST", verbose=verbose)
+        response=api(url=self.__url+"/ungroup", PARAMS=PARAMS, method="POST", verbose=verbose, session=self.__session)
         return response
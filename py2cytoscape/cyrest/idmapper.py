@@ -5,10 +5,12 @@ class idmapper(object):
     cytoscape network interface as shown in CyREST's swagger documentation for 'idmapper'.
 
     :param url: an url of the type 'http://' + host + ':' + str(port) + '/' + version + '/'.
+    :param session: a Transport or requests.Session to send the calls through, default=a shared pooled transport.
     """
 
-    def __init__(self, url):
+    def __init__(self, url, session=None):
         self.__url = url + 'commands/idmapper'
+        self.__session = session if session is not None else default_session()
 
     def map_column(self, only_use_one=None, source_column=None, species=None, target_selection= None, verbose=False):
         """
@@ -34,6 +36,6 @@ class idmapper(object):
         :returns: eg. { "new column": "SGD " }
         """
         PARAMS=set_param(["only_use_one","source_column","species","target_selection"],[only_use_one,source_column,species,target_selection])
-        response=api(url=self.__url+"/map column", PARAMS=PARAMS, method="POST", verbose=verbose)
+        response=api(url=self.__url+"/map column", PARAMS=PARAMS, method="POST", verbose=verbose, session=self.__session)
         return response
 
@@ -5,10 +5,12 @@ class layout(object):
 	cytoscape session interface as shown in CyREST's swagger documentation for 'layout'.
 
 	:param url: an url of the type 'http://' + host + ':' + str(port) + '/' + version + '/'.
+	:param session: a Transport or requests.Session to send the calls through, default=a shared pooled transport.
 	"""
 
-	def __init__(self, url):
+	def __init__(self, url, session=None):
 		self.__url = url + 'commands/layout'
+		self.__session = session if session is not None else default_session()
 
 	def apply_preferred(self, network=None, verbose=False):
 		"""
@@ -22,7 +24,7 @@ class layout(object):
 		"""
 		network=check_network(self,network,verbose=verbose)
 		PARAMS=set_param(["network"],[network])
-		response=api(url=self.__url+"/apply preferred", PARAMS=PARAMS, method="POST", verbose=verbose)
+		response=api(url=self.__url+"/apply preferred", PARAMS=PARAMS, method="POST", verbose=verbose, session=self.__session)
 		return response
 
     
@@ -57,7 +59,7 @@ class layout(object):
 		network=check_network(self,network,verbose=verbose)
 		PARAMS=set_param(["EdgeAttribute","network","NodeAttribute","nodeList","singlePartition","spacing"],\
 		[EdgeAttribute,network,NodeAttribute,nodeList,singlePartition,spacing])
-		response=api(url=self.__url+"/attribute-circle", PARAMS=PARAMS, method="POST", verbose=verbose)
+		response=api(url=self.__url+"/attribute-circle", PARAMS=PARAMS, method="POST", verbose=verbose, session=self.__session)
 		return response
 
     
@@ -100,7 +102,7 @@ class layout(object):
 		[EdgeAttribute, maxwidth, \
 		minrad, network, NodeAttribute,nodeList, radmult, \
 		spacingx, spacingy])
-		response=api(url=self.__url+"/attributes-layout", PARAMS=PARAMS, method="POST", verbose=verbose)
+		response=api(url=self.__url+"/attributes-layout", PARAMS=PARAMS, method="POST", verbose=verbose, session=self.__session)
 		return response
 
 	def circular(self,EdgeAttribute=None,leftEdge=None,network=None,\
@@ -142,7 +144,7 @@ class layout(object):
 		'singlePartition','topEdge'],[EdgeAttribute,leftEdge,network,NodeAttribute,\
 		nodeHorizontalSpacing,nodeList,nodeVerticalSpacing,rightMargin,\
 		singlePartition,topEdge])
-		response=api(url=self.__url+"/circular", PARAMS=PARAMS, method="POST", verbose=verbose)
+		response=api(url=self.__url+"/circular", PARAMS=PARAMS, method="POST", verbose=verbose, session=self.__session)
 		return response
 
 	def copycat(self,gridUnmapped=None,selectUnmapped=None,sourceColumn=None,\
@@ -171,7 +173,7 @@ class layout(object):
 		PARAMS=set_param(['gridUnmapped','selectUnmapped','sourceColumn',\
 		'sourceNetwork','targetColumn','targetNetwork'],[gridUnmapped,\
 		selectUnmapped,sourceColumn,sourceNetwork,targetColumn,targetNetwork])
-		response=api(url=self.__url+"/copycat", PARAMS=PARAMS, method="POST", verbose=verbose)
+		response=api(url=self.__url+"/copycat", PARAMS=PARAMS, method="POST", verbose=verbose, session=self.__session)
 		return response
 
 	def cose(self,compoundGravityRange=None,compoundGravityStrength=None,\
@@ -227,7 +229,7 @@ class layout(object):
 		gravityRange,gravityStrength,idealEdgeLength,incremental,LayoutQuality,\
 		network,NodeAttribute,nodeList,repulsionStrength,smartEdgeLengthCalc,\
 		smartRepulsionRangeCalc,springStrength])
-		response=api(url=self.__url+"/cose", PARAMS=PARAMS, method="POST", verbose=verbose)
+		response=api(url=self.__url+"/cose", PARAMS=PARAMS, method="POST", verbose=verbose, session=self.__session)
 		return response
 
 	def degree_circle(self,EdgeAttribute=None,network=None,NodeAttribute=None,\
@@ -258,7 +260,7 @@ class layout(object):
 		PARAMS=set_param(['EdgeAttribute','network','NodeAttribute','nodeList',\
 		'singlePartition'],[EdgeAttribute,network,NodeAttribute,nodeList,\
 		singlePartition])
-		response=api(url=self.__url+"/degree-circle", PARAMS=PARAMS, method="POST", verbose=verbose)
+		response=api(url=self.__url+"/degree-circle", PARAMS=PARAMS, method="POST", verbose=verbose, session=self.__session)
 		return response
 
     
@@ -317,7 +319,7 @@ class layout(object):
 		defaultSpringCoefficient,defaultSpringLength,EdgeAttribute,isDeterministic,\
 		maxWeightCutoff,minWeightCutoff,network,NodeAttribute,nodeList,numIterations,\
 		singlePartition,Type])
-		response=api(url=self.__url+"/force-directed", PARAMS=PARAMS, method="POST", verbose=verbose)
+		response=api(url=self.__url+"/force-directed", PARAMS=PARAMS, method="POST", verbose=verbose, session=self.__session)
 		return response
 
 	def force_directed_cl(self,defaultEdgeWeight=None,defaultNodeMass=None,\
@@ -373,7 +375,7 @@ class layout(object):
 		defaultSpringLength,EdgeAttribute,fromScratch,isDeterministic,\
 		maxWeightCutoff,minWeightCutoff,network,NodeAttribute,nodeList,\
 		numIterations,numIterationsEdgeRepulsive,singlePartition,Type])
-		response=api(url=self.__url+"/force-directed-cl", PARAMS=PARAMS, method="POST", verbose=verbose)
+		response=api(url=self.__url+"/force-directed-cl", PARAMS=PARAMS, method="POST", verbose=verbose, session=self.__session)
 		return response
 
 
@@ -448,7 +450,7 @@ class layout(object):
 		minWeightCutoff,network,nIterations,NodeAttribute,nodeList,randomize,\
 		repulsion_multiplier,singlePartition,spread_factor,temperature,Type,\
 		update_iterations])
-		response=api(url=self.__url+"/fruchterman-rheingold", PARAMS=PARAMS, method="POST", verbose=verbose)
+		response=api(url=self.__url+"/fruchterman-rheingold", PARAMS=PARAMS, method="POST", verbose=verbose, session=self.__session)
 		return response
 
 
@@ -508,7 +510,7 @@ class layout(object):
 		ignoreHiddenElements,isDeterministic,maxNodeMass,maxWeightCutoff,\
 		midpointEdges,minNodeMass,minWeightCutoff,network,NodeAttribute,nodeList,\
 		numIterations,singlePartition,Type])
-		response=api(url=self.__url+"/genemania-force-directed", PARAMS=PARAMS, method="POST", verbose=verbose)
+		response=api(url=self.__url+"/genemania-force-directed", PARAMS=PARAMS, method="POST", verbose=verbose, session=self.__session)
 		return response
     
 
@@ -522,7 +524,7 @@ class layout(object):
 		"""
 		network=check_network(self,network,verbose=verbose)
 		PARAMS=set_param(['network'],[network])
-		response=api(url=self.__url+"/get preferred", PARAMS=PARAMS, method="POST", verbose=verbose)
+		response=api(url=self.__url+"/get preferred", PARAMS=PARAMS, method="POST", verbose=verbose, session=self.__session)
 		return response
 
 	def grid(self,EdgeAttribute=None,network=None,NodeAttribute=None,\
@@ -556,7 +558,7 @@ class layout(object):
 		'nodeHorizontalSpacing','nodeList','nodeVerticalSpacing'],\
 		[EdgeAttribute,network,NodeAttribute,nodeHorizontalSpacing,nodeList,\
 		nodeVerticalSpacing])
-		response=api(url=self.__url+"/grid", PARAMS=PARAMS, method="POST", verbose=verbose)
+		response=api(url=self.__url+"/grid", PARAMS=PARAMS, method="POST", verbose=verbose, session=self.__session)
 		return response
 
 
@@ -600,7 +602,7 @@ class layout(object):
 		'nodeVerticalSpacing','rightMargin','topEdge'],[bandGap,componentSpacing,\
 		EdgeAttribute,leftEdge,network,NodeAttribute,nodeHorizontalSpacing,\
 		nodeList,nodeVerticalSpacing,rightMargin,topEdge])
-		response=api(url=self.__url+"/hierarchical", PARAMS=PARAMS, method="POST", verbose=verbose)
+		response=api(url=self.__url+"/hierarchical", PARAMS=PARAMS, method="POST", verbose=verbose, session=self.__session)
 		return response
 
 
@@ -647,7 +649,7 @@ class layout(object):
 		'radius','radiusConstantTime','singlePartition','sizeFactor'],[coolingFactor,\
 		EdgeAttribute,initialAdaptation,maxEpoch,minAdaptation,minRadius,network,\
 		NodeAttribute,nodeList,radius,radiusConstantTime,singlePartition,sizeFactor])
-		response=api(url=self.__url+"/isom", PARAMS=PARAMS, method="POST", verbose=verbose)
+		response=api(url=self.__url+"/isom", PARAMS=PARAMS, method="POST", verbose=verbose, session=self.__session)
 		return response
 
 	def kamada_kawai(self,defaultEdgeWeight=None,EdgeAttribute=None,\
@@ -722,7 +724,7 @@ class layout(object):
 		m_nodeDistanceRestLengthConstant,m_nodeDistanceStrengthConstant,\
 		maxWeightCutoff,minWeightCutoff,network,NodeAttribute,nodeList,randomize,\
 		singlePartition,Type,unweighted])
-		response=api(url=self.__url+"/kamada-kawai", PARAMS=PARAMS, method="POST", verbose=verbose)
+		response=api(url=self.__url+"/kamada-kawai", PARAMS=PARAMS, method="POST", verbose=verbose, session=self.__session)
 		return response
 
 
@@ -735,7 +737,7 @@ class layout(object):
 			allowed names see Layout API
 		"""
 		PARAMS=set_param(['preferredLayout'],[preferredLayout])
-		response=api(url=self.__url+"/set preferred", PARAMS=PARAMS, method="POST", verbose=verbose)
+		response=api(url=self.__url+"/set preferred", PARAMS=PARAMS, method="POST", verbose=verbose, session=self.__session)
 		return response
 
 
@@ -768,5 +770,5 @@ class layout(object):
 		PARAMS=set_param(['EdgeAttribute','network','NodeAttribute','nodeList',\
 		'x_position','y_start_position'],[EdgeAttribute,network,NodeAttribute,\
 		nodeList,x_position,y_start_position])
-		response=api(url=self.__url+"/stacked-node-layout", PARAMS=PARAMS, method="POST", verbose=verbose)
+		response=api(url=self.__url+"/stacked-node-layout", PARAMS=PARAMS, method="POST", verbose=verbose, session=self.__session)
 		return response
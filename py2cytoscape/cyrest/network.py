@@ -5,10 +5,12 @@ class network(object):
     cytoscape network interface as shown in CyREST's swagger documentation for 'network'.
 
     :param url: an url of the type 'http://' + host + ':' + str(port) + '/' + version + '/'.
+    :param session: a Transport or requests.Session to send the calls through, default=a shared pooled transport.
     """
 
-    def __init__(self, url):
+    def __init__(self, url, session=None):
         self.__url = url + 'commands/network'
+        self.__session = session if session is not None else default_session()
 
     def add(self, edgeList=None, network=None, nodeList=None, verbose=False):
         """
@@ -38,7 +40,7 @@ class network(object):
         """
         network=check_network(self,network,verbose=verbose)
         PARAMS=set_param(["edgeList","network","nodeList"],[edgeList,network,nodeList])
-        response=api(url=self.__url+"/add", PARAMS=PARAMS, method="POST", verbose=verbose)
+        response=api(url=self.__url+"/add", PARAMS=PARAMS, method="POST", verbose=verbose, session=self.__session)
         return response
 
 
@@ -69,7 +71,7 @@ class network(object):
         network=check_network(self,network,verbose=verbose)
         PARAMS=set_param(["isDirected","name","network","sourceName","targetName"],\
         [isDirected,name,network,sourceName,targetName])
-        response=api(url=self.__url+"/add edge", PARAMS=PARAMS, method="POST", verbose=verbose)
+        response=api(url=self.__url+"/add edge", PARAMS=PARAMS, method="POST", verbose=verbose, session=self.__session)
         return response
 
     
@@ -89,7 +91,7 @@ class network(object):
         """
         network=check_network(self,network,verbose=verbose)
         PARAMS=set_param(["name","network"],[name,network])
-        response=api(url=self.__url+"/add node", PARAMS=PARAMS, method="POST", verbose=verbose)
+        response=api(url=self.__url+"/add node", PARAMS=PARAMS, method="POST", verbose=verbose, session=self.__session)
         return response
 
     def clone(self, network=None, verbose=False):
@@ -109,7 +111,7 @@ class network(object):
         """
         network=check_network(self,network,verbose=verbose)
         PARAMS=set_param(["network"], [network])
-        response=api(url=self.__url+"/clone", PARAMS=PARAMS, method="POST", verbose=verbose)
+        response=api(url=self.__url+"/clone", PARAMS=PARAMS, method="POST", verbose=verbose, session=self.__session)
         return response
 
     def connect_nodes(self, network=None, nodes=None, verbose=False):
@@ -131,7 +133,7 @@ class network(object):
         """
         network=check_network(self,network,verbose=verbose)
         PARAMS=set_param(["name","network"],[name,network])
-        response=api(url=self.__url+"/connect nodes", PARAMS=PARAMS, method="POST", verbose=verbose)
+        response=api(url=self.__url+"/connect nodes", PARAMS=PARAMS, method="POST", verbose=verbose, session=self.__session)
         return response
 
     def create(self, edgeList=None, excludeEdges=None, networkName=None, nodeList=None, source=None, verbose=False):
@@ -166,7 +168,7 @@ class network(object):
         network=check_network(self,source, verbose=verbose)
         PARAMS=set_param(["edgeList","excludeEdges","networkName","nodeList","source"], \
         [edgeList,excludeEdges,networkName,nodeList,network])
-        response=api(url=self.__url+"/create", PARAMS=PARAMS, method="POST", verbose=verbose)
+        response=api(url=self.__url+"/create", PARAMS=PARAMS, method="POST", verbose=verbose, session=self.__session)
         return response
 
     def create_attribute(self, column=None, listType=None, namespace=None, network=None, atype=None, verbose=False):
@@ -193,7 +195,7 @@ class network(object):
         network=check_network(self,network,verbose=verbose)
         PARAMS=set_param(["column","listType","namespace","network","type"], \
         [column,listType,namespace,network,atype])
-        response=api(url=self.__url+"/create attribute", PARAMS=PARAMS, method="POST", verbose=verbose)
+        response=api(url=self.__url+"/create attribute", PARAMS=PARAMS, method="POST", verbose=verbose, session=self.__session)
         return response
 
     
@@ -214,7 +216,7 @@ class network(object):
         :param verbose: print more
         """
         PARAMS=set_param(["name","renderers","RootNetworkList"],[name,renderers,RootNetworkList])
-        response=api(url=self.__url+"/create empty", PARAMS=PARAMS, method="POST", verbose=verbose)
+        response=api(url=self.__url+"/create empty", PARAMS=PARAMS, method="POST", verbose=verbose, session=self.__session)
         return response
 
     
@@ -244,7 +246,7 @@ class network(object):
         """
         network=check_network(self,network,verbose=verbose)
         PARAMS=set_param(["edgeList","network","nodeList"],[edgeList,network,nodeList])
-        response=api(url=self.__url+"/delete", PARAMS=PARAMS, method="POST", verbose=verbose)
+        response=api(url=self.__url+"/delete", PARAMS=PARAMS, method="POST", verbose=verbose, session=self.__session)
         return response
 
 
@@ -275,7 +277,7 @@ class network(object):
         """
         network=check_network(self,network,verbose=verbose)
         PARAMS=set_param(["edgeList","network","nodeList"],[edgeList,network,nodeList])
-        response=api(url=self.__url+"/deselect", PARAMS=PARAMS, method="POST", verbose=verbose)
+        response=api(url=self.__url+"/deselect", PARAMS=PARAMS, method="POST", verbose=verbose, session=self.__session)
         return response
 
     def destroy(self, network=None, verbose=False):
@@ -291,7 +293,7 @@ class network(object):
         """
         network=check_network(self,network,verbose=verbose)
         PARAMS=set_param(["network"],[network])
-        response=api(url=self.__url+"/destroy", PARAMS=PARAMS, method="POST", verbose=verbose)
+        response=api(url=self.__url+"/destroy", PARAMS=PARAMS, method="POST", verbose=verbose, session=self.__session)
         return response
 
     def export(self, options=None, OutputFile=None, verbose=False):
@@ -307,7 +309,7 @@ class network(object):
         :returns: { file }
         """
         PARAMS=set_param(["options","OutputFile"],[options,OutputFile])
-        response=api(url=self.__url+"/export", PARAMS=PARAMS, method="POST", verbose=verbose)
+        response=api(url=self.__url+"/export", PARAMS=PARAMS, method="POST", verbose=verbose, session=self.__session)
         return response
 
     def get(self, network=None, verbose=False):
@@ -329,7 +331,7 @@ class network(object):
 
         network=check_network(self,network,verbose=verbose)
         PARAMS=set_param(["network"],[network])
-        response=api(url=self.__url+"/get", PARAMS=PARAMS, method="POST", verbose=verbose)
+        response=api(url=self.__url+"/get", PARAMS=PARAMS, method="POST", verbose=verbose, session=self.__session)
         return response
 
     def get_attribute(self, columnList=None, namespace=None, network=None, verbose=False):
@@ -349,7 +351,7 @@ class network(object):
         """
         network=check_network(self,network,verbose=verbose)
         PARAMS=set_param(["columnList","namespace","network"],[columnList,namespace,network])
-        response=api(url=self.__url+"/get attribute", PARAMS=PARAMS, method="POST", verbose=verbose)
+        response=api(url=self.__url+"/get attribute", PARAMS=PARAMS, method="POST", verbose=verbose, session=self.__session)
         return response
 
     def get_porperties(self, network=None, propertyList=None, verbose=False):
@@ -366,7 +368,7 @@ class network(object):
         """
         network=check_network(self,network,verbose=verbose)
         PARAMS=set_param(["network","propertyList"],[network,propertyList])
-        response=api(url=self.__url+"/get properties", PARAMS=PARAMS, method="POST", verbose=verbose)
+        response=api(url=self.__url+"/get properties", PARAMS=PARAMS, method="POST", verbose=verbose, session=self.__session)
         return response
 
     def hide(self, edgeList=None, network=None, nodeList=None, verbose=False):
@@ -399,7 +401,7 @@ class network(object):
         """
         network=check_network(self,network,verbose=verbose)
         PARAMS=set_param(["network","propertyList"],[network,propertyList])
-        response=api(url=self.__url+"/hide", PARAMS=PARAMS, method="POST", verbose=verbose)
+        response=api(url=self.__url+"/hide", PARAMS=PARAMS, method="POST", verbose=verbose, session=self.__session)
         return response
 
 
@@ -463,7 +465,7 @@ class network(object):
         [dataTypeList,defaultInteraction,delimiters,delimitersForDataList,\
         afile,firstRowAsColumnNames,indexColumnSourceInteraction,indexColumnTargetInteraction,\
         indexColumnTypeInteraction,NetworkViewRendererList,RootNetworkList,startLoadRow,TargetColumnList])
-        response=api(url=self.__url+"/import file", PARAMS=PARAMS, method="POST", verbose=verbose)
+        response=api(url=self.__url+"/import file", PARAMS=PARAMS, method="POST", verbose=verbose, session=self.__session)
         return response
 
     def import_url(self, dataTypeList=None, defaultInteraction=None, delimiters=None, \
@@ -526,7 +528,7 @@ class network(object):
         [dataTypeList,defaultInteraction,delimiters,delimitersForDataList,\
         firstRowAsColumnNames,indexColumnSourceInteraction,indexColumnTargetInteraction,\
         indexColumnTypeInteraction,NetworkViewRendererList,RootNetworkList,startLoadRow,TargetColumnList, url])
-        response=api(url=self.__url+"/import url", PARAMS=PARAMS, method="POST", verbose=verbose)
+        response=api(url=self.__url+"/import url", PARAMS=PARAMS, method="POST", verbose=verbose, session=self.__session)
         return response
 
     def list(self, verbose=False):
@@ -538,7 +540,7 @@ class network(object):
         :returns: [ list of network suids ]
         """
 
-        response=api(url=self.__url+"/list", method="POST", verbose=verbose)
+        response=api(url=self.__url+"/list", method="POST", verbose=verbose, session=self.__session)
         return response
 
     def list_attributes(self, namespace=None, network=None, verbose=False):
@@ -558,7 +560,7 @@ class network(object):
         """
         network=check_network(self,network,verbose=verbose)
         PARAMS=set_param(["namespace","network"],[namespace,network])
-        response=api(url=self.__url+"/list attributes", PARAMS=PARAMS, method="POST", verbose=verbose)
+        response=api(url=self.__url+"/list attributes", PARAMS=PARAMS, method="POST", verbose=verbose, session=self.__session)
         return response
 
 
@@ -575,7 +577,7 @@ class network(object):
         """
         network=check_network(self,network,verbose=verbose)
         PARAMS=set_param(["network"],[network])
-        response=api(url=self.__url+"/list properties", PARAMS=PARAMS, method="POST", verbose=verbose)
+        response=api(url=self.__url+"/list properties", PARAMS=PARAMS, method="POST", verbose=verbose, session=self.__session)
         return response
 
 
@@ -594,7 +596,7 @@ class network(object):
         :returns: { SUIDs of the new networks and views }
         """
         PARAMS=set_param(["file"],[afile])
-        response=api(url=self.__url+"/load file", PARAMS=PARAMS, method="POST", verbose=verbose)
+        response=api(url=self.__url+"/load file", PARAMS=PARAMS, method="POST", verbose=verbose, session=self.__session)
         return response
 
     def load_url(self, afile=None, verbose=False):
@@ -613,7 +615,7 @@ class network(object):
         :returns: { SUIDs of the new networks and views }
         """
         PARAMS=set_param(["url"],[url])
-        response=api(url=self.__url+"/load url", PARAMS=PARAMS, method="POST", verbose=verbose)
+        response=api(url=self.__url+"/load url", PARAMS=PARAMS, method="POST", verbose=verbose, session=self.__session)
         return response
 
     def rename(self, name=None, sourceNetwork=None, verbose=False):
@@ -630,7 +632,7 @@ class network(object):
         """
         sourceNetwork=check_network(self,sourceNetwork,verbose=verbose)
         PARAMS=set_param(["name","sourceNetwork"],[name,sourceNetwork])
-        response=api(url=self.__url+"/rename", PARAMS=PARAMS, method="POST", verbose=verbose)
+        response=api(url=self.__url+"/rename", PARAMS=PARAMS, method="POST", verbose=verbose, session=self.__session)
         return response
 
     def select(self, adjacentEdges=None, edgeList=None, extendEdges=None, firstNeighbors=None, \
@@ -682,7 +684,7 @@ class network(object):
         "invert","network","nodeList"], \
         [adjacentEdges,edgeList,extendEdges,firstNeighbors,\
         invert,network,nodeList])
-        response=api(url=self.__url+"/select", PARAMS=PARAMS, method="POST", verbose=verbose)
+        response=api(url=self.__url+"/select", PARAMS=PARAMS, method="POST", verbose=verbose, session=self.__session)
         return response
 
     def set_attribute(self, columnList=None, namespace=None, network=None, valueList=None, verbose=False):
@@ -704,7 +706,7 @@ class network(object):
         network=check_network(self,network,verbose=verbose)
         PARAMS=set_param(["columnList","namespace","network","valueList"], \
         [columnList,namespace,network,valueList])
-        response=api(url=self.__url+"/set attribute", PARAMS=PARAMS, method="POST", verbose=verbose)
+        response=api(url=self.__url+"/set attribute", PARAMS=PARAMS, method="POST", verbose=verbose, session=self.__session)
         return response
  
 
@@ -720,7 +722,7 @@ class network(object):
         :param verbose: print more
         """
         PARAMS=set_param(["network"], [network])
-        response=api(url=self.__url+"/set current", PARAMS=PARAMS, method="POST", verbose=verbose)
+        response=api(url=self.__url+"/set current", PARAMS=PARAMS, method="POST", verbose=verbose, session=self.__session)
         return response
 
     def set_properties(self, network=None, propertyList=None, valueList=None, verbose=False):
@@ -740,7 +742,7 @@ class network(object):
         network=check_network(self,network,verbose=verbose)
         PARAMS=set_param(["network","propertyList","valueList"], \
         [network,propertyList,valueList])
-        response=api(url=self.__url+"/set properties", PARAMS=PARAMS, method="POST", verbose=verbose)
+        response=api(url=self.__url+"/set properties", PARAMS=PARAMS, method="POST", verbose=verbose, session=self.__session)
         return response
 
     def show(self, edgeList=None, network=None, nodeList=None, verbose=False):
@@ -773,5 +775,5 @@ class network(object):
         """
         network=check_network(self,network,verbose=verbose)
         PARAMS=set_param(["edgeList","network","nodeList"],[edgeList,network,nodeList])
-        response=api(url=self.__url+"/show", PARAMS=PARAMS, method="POST", verbose=verbose)
+        response=api(url=self.__url+"/show", PARAMS=PARAMS, method="POST", verbose=verbose, session=self.__session)
         return response
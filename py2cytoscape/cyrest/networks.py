@@ -5,10 +5,12 @@ class networks(object):
     cytoscape session interface as shown in CyREST's swagger documentation.
 
     :param url: an url of the type 'http://' + host + ':' + str(port) + '/' + version + '/'.
+    :param session: a Transport or requests.Session to send the calls through, default=a shared pooled transport.
     """
 
-    def __init__(self, url):
+    def __init__(self, url, session=None):
         self.__url = url + 'commands/networks'
+        self.__session = session if session is not None else default_session()
 
 
     def collapseGroup(networkId, groupNodeId, verbose=None):
@@ -22,7 +24,7 @@ class networks(object):
         :returns: 204: Group collapsed; 500: Failed to collapse group
         """
 
-        response=api(url=self.url+'networks/'+str(networkId)+'/groups/'+str(groupNodeId)+'/collapse', PARAMS=None, method="GET", verbose=verbose, parse_params=False)
+        response=api(url=self.url+'networks/'+str(networkId)+'/groups/'+str(groupNodeId)+'/collapse', PARAMS=None, method="GET", verbose=verbose, parse_params=False, session=self.__session)
         return response
 
 
@@ -37,7 +39,7 @@ class networks(object):
         :returns: 204: Group expanded; 500: Failed to expand group
         """
 
-        response=api(url=self.url+'networks/'+str(networkId)+'/groups/'+str(groupNodeId)+'/expand', PARAMS=None, method="GET", verbose=verbose, parse_params=False)
+        response=api(url=self.url+'networks/'+str(networkId)+'/groups/'+str(groupNodeId)+'/expand', PARAMS=None, method="GET", verbose=verbose, parse_params=False, session=self.__session)
         return response
 
 
@@ -53,7 +55,7 @@ class networks(object):
         :returns: 200: successful operation
         """
 
-        response=api(url=self.url+'networks/'+str(networkId)+'/views/count', PARAMS=None, method="GET", verbose=verbose, parse_params=False)
+        response=api(url=self.url+'networks/'+str(networkId)+'/views/count', PARAMS=None, method="GET", verbose=verbose, parse_params=False, session=self.__session)
         return response
 
 
@@ -70,7 +72,7 @@ class networks(object):
         :returns: 200: PDF image stream.
         """
 
-        response=api(url=self.url+'networks/'+str(networkId)+'/views/first.pdf', PARAMS={'h':h}, method="GET", verbose=verbose, parse_params=False)
+        response=api(url=self.url+'networks/'+str(networkId)+'/views/first.pdf', PARAMS={'h':h}, method="GET", verbose=verbose, parse_params=False, session=self.__session)
         return response
 
 
@@ -115,7 +117,7 @@ class networks(object):
         :returns: default: successful operation
         """
 
-        response=api(url=self.url+'networks/'+str(networkId)+'/views/'+str(viewId)+'/'+str(objectType)+'/'+str(objectId)+'', method="PUT", body=body, verbose=verbose)
+        response=api(url=self.url+'networks/'+str(networkId)+'/views/'+str(viewId)+'/'+str(objectType)+'/'+str(objectId)+'', method="PUT", body=body, verbose=verbose, session=self.__session)
         return response
 
 
@@ -134,7 +136,7 @@ class networks(object):
         :returns: 200: successful operation
         """
 
-        response=api(url=self.url+'networks/'+str(networkId)+'/views/'+str(viewId)+'/'+str(objectType)+'/'+str(objectId)+'', PARAMS=None, method="GET", verbose=verbose, parse_params=False)
+        response=api(url=self.url+'networks/'+str(networkId)+'/views/'+str(viewId)+'/'+str(objectType)+'/'+str(objectId)+'', PARAMS=None, method="GET", verbose=verbose, parse_params=False, session=self.__session)
         return response
 
 
@@ -149,7 +151,7 @@ class networks(object):
         :returns: 200: successful operation
         """
 
-        response=api(url=self.url+'networks/'+str(networkId)+'/tables/'+str(tableType)+'.csv', PARAMS=None, method="GET", verbose=verbose, parse_params=False)
+        response=api(url=self.url+'networks/'+str(networkId)+'/tables/'+str(tableType)+'.csv', PARAMS=None, method="GET", verbose=verbose, parse_params=False, session=self.__session)
         return response
 
 
@@ -164,7 +166,7 @@ class networks(object):
         :returns: 200: successful operation
         """
 
-        response=api(url=self.url+'networks/'+str(networkId)+'/nodes/'+str(nodeId)+'/neighbors', PARAMS=None, method="GET", verbose=verbose, parse_params=False)
+        response=api(url=self.url+'networks/'+str(networkId)+'/nodes/'+str(nodeId)+'/neighbors', PARAMS=None, method="GET", verbose=verbose, parse_params=False, session=self.__session)
         return response
 
 
@@ -183,7 +185,7 @@ class networks(object):
         :returns: 200: successful operation
         """
 
-        response=api(url=self.url+'networks/'+str(networkId)+'/views/'+str(viewId)+'/network/'+str(visualProperty)+'/bypass', method="PUT", body=body, verbose=verbose)
+        response=api(url=self.url+'networks/'+str(networkId)+'/views/'+str(viewId)+'/network/'+str(visualProperty)+'/bypass', method="PUT", body=body, verbose=verbose, session=self.__session)
         return response
 
 
@@ -201,7 +203,7 @@ class networks(object):
         :returns: 200: successful operation
         """
 
-        response=api(url=self.url+'networks/'+str(networkId)+'/views/'+str(viewId)+'/network/'+str(visualProperty)+'/bypass', method="DELETE", verbose=verbose)
+        response=api(url=self.url+'networks/'+str(networkId)+'/views/'+str(viewId)+'/network/'+str(visualProperty)+'/bypass', method="DELETE", verbose=verbose, session=self.__session)
         return response
 
 
@@ -219,7 +221,7 @@ class networks(object):
         :returns: 200: successful operation
         """
 
-        response=api(url=self.url+'networks/'+str(networkId)+'/views/'+str(viewId)+'/network/'+str(visualProperty)+'/bypass', PARAMS=None, method="GET", verbose=verbose, parse_params=False)
+        response=api(url=self.url+'networks/'+str(networkId)+'/views/'+str(viewId)+'/network/'+str(visualProperty)+'/bypass', PARAMS=None, method="GET", verbose=verbose, parse_params=False, session=self.__session)
         return response
 
 
@@ -233,7 +235,7 @@ class networks(object):
         :returns: 200: successful operation
         """
 
-        response=api(url=self.url+'networks/currentNetwork', method="PUT", body=body, verbose=verbose)
+        response=api(url=self.url+'networks/currentNetwork', method="PUT", body=body, verbose=verbose, session=self.__session)
         return response
 
 
@@ -246,7 +248,7 @@ class networks(object):
         :returns: 200: successful operation
         """
 
-        response=api(url=self.url+'networks/currentNetwork', PARAMS=None, method="GET", verbose=verbose, parse_params=False)
+        response=api(url=self.url+'networks/currentNetwork', PARAMS=None, method="GET", verbose=verbose, parse_params=False, session=self.__session)
         return response
 
 
@@ -264,7 +266,7 @@ class networks(object):
         :returns: 200: successful operation
         """
 
-        response=api(url=self.url+'networks/'+str(networkId)+'/views/'+str(viewId)+'/network/'+str(visualProperty)+'', PARAMS=None, method="GET", verbose=verbose, parse_params=False)
+        response=api(url=self.url+'networks/'+str(networkId)+'/views/'+str(viewId)+'/network/'+str(visualProperty)+'', PARAMS=None, method="GET", verbose=verbose, parse_params=False, session=self.__session)
         return response
 
 
@@ -282,7 +284,7 @@ class networks(object):
         """
 
         PARAMS=set_param(['networkId','title'],[networkId,title])
-        response=api(url=self.url+'networks/'+str(networkId)+'', PARAMS=PARAMS, method="POST", verbose=verbose)
+        response=api(url=self.url+'networks/'+str(networkId)+'', PARAMS=PARAMS, method="POST", verbose=verbose, session=self.__session)
         return response
 
 
@@ -296,7 +298,7 @@ class networks(object):
         :returns: default: successful operation
         """
 
-        response=api(url=self.url+'networks/'+str(networkId)+'', method="DELETE", verbose=verbose)
+        response=api(url=self.url+'networks/'+str(networkId)+'', method="DELETE", verbose=verbose, session=self.__session)
         return response
 
 
@@ -310,7 +312,7 @@ class networks(object):
         :returns: 200: successful operation
         """
 
-        response=api(url=self.url+'networks/'+str(networkId)+'', PARAMS=None, method="GET", verbose=verbose, parse_params=False)
+        response=api(url=self.url+'networks/'+str(networkId)+'', PARAMS=None, method="GET", verbose=verbose, parse_params=False, session=self.__session)
         return response
 
 
@@ -331,7 +333,7 @@ class networks(object):
         :returns: default: successful operation
         """
 
-        response=api(url=self.url+'networks/'+str(networkId)+'/tables/'+str(tableType)+'', method="PUT", body=body, verbose=verbose)
+        response=api(url=self.url+'networks/'+str(networkId)+'/tables/'+str(tableType)+'', method="PUT", body=body, verbose=verbose, session=self.__session)
         return response
 
 
@@ -346,7 +348,7 @@ class networks(object):
         :returns: 200: successful operation
         """
 
-        response=api(url=self.url+'networks/'+str(networkId)+'/tables/'+str(tableType)+'', PARAMS=None, method="GET", verbose=verbose, parse_params=False)
+        response=api(url=self.url+'networks/'+str(networkId)+'/tables/'+str(tableType)+'', PARAMS=None, method="GET", verbose=verbose, parse_params=False, session=self.__session)
         return response
 
 
@@ -366,7 +368,7 @@ class networks(object):
         :returns: 200: successful operation
         """
 
-        response=api(url=self.url+'networks/'+str(networkId)+'/views/'+str(viewId)+'/'+str(objectType)+'/'+str(objectId)+'/'+str(visualProperty)+'', PARAMS=None, method="GET", verbose=verbose, parse_params=False)
+        response=api(url=self.url+'networks/'+str(networkId)+'/views/'+str(viewId)+'/'+str(objectType)+'/'+str(objectId)+'/'+str(visualProperty)+'', PARAMS=None, method="GET", verbose=verbose, parse_params=False, session=self.__session)
         return response
 
 
@@ -415,7 +417,7 @@ class networks(object):
         :returns: default: successful operation
         """
 
-        response=api(url=self.url+'networks/'+str(networkId)+'/views/'+str(viewId)+'/'+str(objectType)+'', method="PUT", body=body, verbose=verbose)
+        response=api(url=self.url+'networks/'+str(networkId)+'/views/'+str(viewId)+'/'+str(objectType)+'', method="PUT", body=body, verbose=verbose, session=self.__session)
         return response
 
 
@@ -434,7 +436,7 @@ class networks(object):
         :returns: 200: successful operation
         """
 
-        response=api(url=self.url+'networks/'+str(networkId)+'/views/'+str(viewId)+'/'+str(objectType)+'', PARAMS={'visualProperty':visualProperty}, method="GET", verbose=verbose, parse_params=False)
+        response=api(url=self.url+'networks/'+str(networkId)+'/views/'+str(viewId)+'/'+str(objectType)+'', PARAMS={'visualProperty':visualProperty}, method="GET", verbose=verbose, parse_params=False, session=self.__session)
         return response
 
 
@@ -449,7 +451,7 @@ class networks(object):
         :returns: 200: successful operation
         """
 
-        response=api(url=self.url+'networks/'+str(networkId)+'/tables/'+str(tableType)+'.tsv', PARAMS=None, method="GET", verbose=verbose, parse_params=False)
+        response=api(url=self.url+'networks/'+str(networkId)+'/tables/'+str(tableType)+'.tsv', PARAMS=None, method="GET", verbose=verbose, parse_params=False, session=self.__session)
         return response
 
 
@@ -464,7 +466,7 @@ class networks(object):
         :returns: default: successful operation
         """
 
-        response=api(url=self.url+'networks/'+str(networkId)+'/views/'+str(viewId)+'.cx', PARAMS=None, method="GET", verbose=verbose, parse_params=False)
+        response=api(url=self.url+'networks/'+str(networkId)+'/views/'+str(viewId)+'.cx', PARAMS=None, method="GET", verbose=verbose, parse_params=False, session=self.__session)
         return response
 
 
@@ -481,7 +483,7 @@ class networks(object):
         :returns: 200: PDF image stream.
         """
 
-        response=api(url=self.url+'networks/'+str(networkId)+'/views/'+str(viewId)+'.pdf', PARAMS=None, method="GET", verbose=verbose, parse_params=False)
+        response=api(url=self.url+'networks/'+str(networkId)+'/views/'+str(viewId)+'.pdf', PARAMS=None, method="GET", verbose=verbose, parse_params=False, session=self.__session)
         return response
 
 
@@ -496,7 +498,7 @@ class networks(object):
         :returns: 200: successful operation
         """
 
-        response=api(url=self.url+'networks/'+str(networkId)+'/nodes/'+str(nodeId)+'/pointer', PARAMS=None, method="GET", verbose=verbose, parse_params=False)
+        response=api(url=self.url+'networks/'+str(networkId)+'/nodes/'+str(nodeId)+'/pointer', PARAMS=None, method="GET", verbose=verbose, parse_params=False, session=self.__session)
         return response
 
 
@@ -510,7 +512,7 @@ class networks(object):
         :returns: 200: successful operation
         """
 
-        response=api(url=self.url+'networks/'+str(networkId)+'/tables', PARAMS=None, method="GET", verbose=verbose, parse_params=False)
+        response=api(url=self.url+'networks/'+str(networkId)+'/tables', PARAMS=None, method="GET", verbose=verbose, parse_params=False, session=self.__session)
         return response
 
 
@@ -526,7 +528,7 @@ class networks(object):
         :returns: default: successful operation
         """
 
-        response=api(url=self.url+'networks/'+str(networkId)+'/tables/'+str(tableType)+'/columns', method="PUT", body=body, verbose=verbose)
+        response=api(url=self.url+'networks/'+str(networkId)+'/tables/'+str(tableType)+'/columns', method="PUT", body=body, verbose=verbose, session=self.__session)
         return response
 
 
@@ -545,7 +547,7 @@ class networks(object):
         """
 
         PARAMS=set_param(['networkId','tableType','body'],[networkId,tableType,body])
-        response=api(url=self.url+'networks/'+str(networkId)+'/tables/'+str(tableType)+'/columns', PARAMS=PARAMS, method="POST", verbose=verbose)
+        response=api(url=self.url+'networks/'+str(networkId)+'/tables/'+str(tableType)+'/columns', PARAMS=PARAMS, method="POST", verbose=verbose, session=self.__session)
         return response
 
 
@@ -560,7 +562,7 @@ class networks(object):
         :returns: 200: successful operation
         """
 
-        response=api(url=self.url+'networks/'+str(networkId)+'/tables/'+str(tableType)+'/columns', PARAMS=None, method="GET", verbose=verbose, parse_params=False)
+        response=api(url=self.url+'networks/'+str(networkId)+'/tables/'+str(tableType)+'/columns', PARAMS=None, method="GET", verbose=verbose, parse_params=False, session=self.__session)
         return response
 
 
@@ -587,7 +589,7 @@ class networks(object):
         :returns: 200: successful operation
         """
 
-        response=api(url=self.url+'networks/'+str(networkId)+'/tables/'+str(tableType)+'/rows/'+str(primaryKey)+'', PARAMS=None, method="GET", verbose=verbose, parse_params=False)
+        response=api(url=self.url+'networks/'+str(networkId)+'/tables/'+str(tableType)+'/rows/'+str(primaryKey)+'', PARAMS=None, method="GET", verbose=verbose, parse_params=False, session=self.__session)
         return response
 
 
@@ -602,7 +604,7 @@ class networks(object):
         :returns: 200: successful operation
         """
 
-        response=api(url=self.url+'networks/'+str(networkId)+'/edges/'+str(edgeId)+'/isDirected', PARAMS=None, method="GET", verbose=verbose, parse_params=False)
+        response=api(url=self.url+'networks/'+str(networkId)+'/edges/'+str(edgeId)+'/isDirected', PARAMS=None, method="GET", verbose=verbose, parse_params=False, session=self.__session)
         return response
 
 
@@ -615,7 +617,7 @@ class networks(object):
         :returns: 200: successful operation
         """
 
-        response=api(url=self.url+'networks/count', PARAMS=None, method="GET", verbose=verbose, parse_params=False)
+        response=api(url=self.url+'networks/count', PARAMS=None, method="GET", verbose=verbose, parse_params=False, session=self.__session)
         return response
 
 
@@ -653,7 +655,7 @@ class networks(object):
         :returns: default: successful operation
         """
 
-        response=api(url=self.url+'networks/'+str(networkId)+'/views/'+str(viewId)+'', PARAMS={'file':file}, method="GET", verbose=verbose, parse_params=False)
+        response=api(url=self.url+'networks/'+str(networkId)+'/views/'+str(viewId)+'', PARAMS={'file':file}, method="GET", verbose=verbose, parse_params=False, session=self.__session)
         return response
 
 
@@ -696,7 +698,7 @@ class networks(object):
         :returns: default: successful operation
         """
 
-        response=api(url=self.url+'networks/'+str(networkId)+'/views/'+str(viewId)+'/'+str(objectType)+'/'+str(objectId)+'/'+str(visualProperty)+'/bypass', method="PUT", body=body, verbose=verbose)
+        response=api(url=self.url+'networks/'+str(networkId)+'/views/'+str(viewId)+'/'+str(objectType)+'/'+str(objectId)+'/'+str(visualProperty)+'/bypass', method="PUT", body=body, verbose=verbose, session=self.__session)
         return response
 
 
@@ -716,7 +718,7 @@ class networks(object):
         :returns: 200: successful operation
         """
 
-        response=api(url=self.url+'networks/'+str(networkId)+'/views/'+str(viewId)+'/'+str(objectType)+'/'+str(objectId)+'/'+str(visualProperty)+'/bypass', method="DELETE", verbose=verbose)
+        response=api(url=self.url+'networks/'+str(networkId)+'/views/'+str(viewId)+'/'+str(objectType)+'/'+str(objectId)+'/'+str(visualProperty)+'/bypass', method="DELETE", verbose=verbose, session=self.__session)
         return response
 
 
@@ -736,7 +738,7 @@ class networks(object):
         :returns: 200: successful operation
         """
 
-        response=api(url=self.url+'networks/'+str(networkId)+'/views/'+str(viewId)+'/'+str(objectType)+'/'+str(objectId)+'/'+str(visualProperty)+'/bypass', PARAMS=None, method="GET", verbose=verbose, parse_params=False)
+        response=api(url=self.url+'networks/'+str(networkId)+'/views/'+str(viewId)+'/'+str(objectType)+'/'+str(objectId)+'/'+str(visualProperty)+'/bypass', PARAMS=None, method="GET", verbose=verbose, parse_params=False, session=self.__session)
         return response
 
 
@@ -751,7 +753,7 @@ class networks(object):
         :returns: default: successful operation
         """
 
-        response=api(url=self.url+'networks/'+str(networkId)+'/nodes/'+str(nodeId)+'', method="DELETE", verbose=verbose)
+        response=api(url=self.url+'networks/'+str(networkId)+'/nodes/'+str(nodeId)+'', method="DELETE", verbose=verbose, session=self.__session)
         return response
 
 
@@ -766,7 +768,7 @@ class networks(object):
         :returns: 200: successful operation
         """
 
-        response=api(url=self.url+'networks/'+str(networkId)+'/nodes/'+str(nodeId)+'', PARAMS=None, method="GET", verbose=verbose, parse_params=False)
+        response=api(url=self.url+'networks/'+str(networkId)+'/nodes/'+str(nodeId)+'', PARAMS=None, method="GET", verbose=verbose, parse_params=False, session=self.__session)
         return response
 
 
@@ -784,7 +786,7 @@ class networks(object):
         """
 
         PARAMS=set_param(['networkId','body'],[networkId,body])
-        response=api(url=self.url+'networks/'+str(networkId)+'/edges', PARAMS=PARAMS, method="POST", verbose=verbose)
+        response=api(url=self.url+'networks/'+str(networkId)+'/edges', PARAMS=PARAMS, method="POST", verbose=verbose, session=self.__session)
         return response
 
 
@@ -798,7 +800,7 @@ class networks(object):
         :returns: default: successful operation
         """
 
-        response=api(url=self.url+'networks/'+str(networkId)+'/edges', method="DELETE", verbose=verbose)
+        response=api(url=self.url+'networks/'+str(networkId)+'/edges', method="DELETE", verbose=verbose, session=self.__session)
         return response
 
 
@@ -816,7 +818,7 @@ class networks(object):
         :returns: 200: successful operation
         """
 
-        response=api(url=self.url+'networks/'+str(networkId)+'/edges', PARAMS={'column':column, 'query':query}, method="GET", verbose=verbose, parse_params=False)
+        response=api(url=self.url+'networks/'+str(networkId)+'/edges', PARAMS={'column':column, 'query':query}, method="GET", verbose=verbose, parse_params=False, session=self.__session)
         return response
 
 
@@ -833,7 +835,7 @@ class networks(object):
         :returns: 200: successful operation
         """
 
-        response=api(url=self.url+'networks/'+str(networkId)+'/edges/selected', method="PUT", body=body, verbose=verbose)
+        response=api(url=self.url+'networks/'+str(networkId)+'/edges/selected', method="PUT", body=body, verbose=verbose, session=self.__session)
         return response
 
 
@@ -847,7 +849,7 @@ class networks(object):
         :returns: 200: successful operation
         """
 
-        response=api(url=self.url+'networks/'+str(networkId)+'/edges/selected', PARAMS=None, method="GET", verbose=verbose, parse_params=False)
+        response=api(url=self.url+'networks/'+str(networkId)+'/edges/selected', PARAMS=None, method="GET", verbose=verbose, parse_params=False, session=self.__session)
         return response
 
 
@@ -864,7 +866,7 @@ class networks(object):
         :returns: 200: PNG image stream.
         """
 
-        response=api(url=self.url+'networks/'+str(networkId)+'/views/first.png', PARAMS={'h':h}, method="GET", verbose=verbose, parse_params=False)
+        response=api(url=self.url+'networks/'+str(networkId)+'/views/first.png', PARAMS={'h':h}, method="GET", verbose=verbose, parse_params=False, session=self.__session)
         return response
 
 
@@ -883,7 +885,7 @@ class networks(object):
         :returns: 200: successful operation
         """
 
-        response=api(url=self.url+'networks/'+str(networkId)+'/tables/'+str(tableType)+'/rows/'+str(primaryKey)+'/'+str(columnName)+'', PARAMS=None, method="GET", verbose=verbose, parse_params=False)
+        response=api(url=self.url+'networks/'+str(networkId)+'/tables/'+str(tableType)+'/rows/'+str(primaryKey)+'/'+str(columnName)+'', PARAMS=None, method="GET", verbose=verbose, parse_params=False, session=self.__session)
         return response
 
 
@@ -900,7 +902,7 @@ class networks(object):
         :returns: 200: successful operation
         """
 
-        response=api(url=self.url+'networks/'+str(networkId)+'/nodes/selected', method="PUT", body=body, verbose=verbose)
+        response=api(url=self.url+'networks/'+str(networkId)+'/nodes/selected', method="PUT", body=body, verbose=verbose, session=self.__session)
         return response
 
 
@@ -914,7 +916,7 @@ class networks(object):
         :returns: 200: successful operation
         """
 
-        response=api(url=self.url+'networks/'+str(networkId)+'/nodes/selected', PARAMS=None, method="GET", verbose=verbose, parse_params=False)
+        response=api(url=self.url+'networks/'+str(networkId)+'/nodes/selected', PARAMS=None, method="GET", verbose=verbose, parse_params=False, session=self.__session)
         return response
 
 
@@ -929,7 +931,7 @@ class networks(object):
         :returns: default: successful operation
         """
 
-        response=api(url=self.url+'networks/'+str(networkId)+'/groups/'+str(groupNodeId)+'', method="DELETE", verbose=verbose)
+        response=api(url=self.url+'networks/'+str(networkId)+'/groups/'+str(groupNodeId)+'', method="DELETE", verbose=verbose, session=self.__session)
         return response
 
 
@@ -944,7 +946,7 @@ class networks(object):
         :returns: 200: successful operation
         """
 
-        response=api(url=self.url+'networks/'+str(networkId)+'/groups/'+str(groupNodeId)+'', PARAMS=None, method="GET", verbose=verbose, parse_params=False)
+        response=api(url=self.url+'networks/'+str(networkId)+'/groups/'+str(groupNodeId)+'', PARAMS=None, method="GET", verbose=verbose, parse_params=False, session=self.__session)
         return response
 
 
@@ -958,7 +960,7 @@ class networks(object):
         :returns: 200: successful operation
         """
 
-        response=api(url=self.url+'networks/'+str(networkId)+'/edges/count', PARAMS=None, method="GET", verbose=verbose, parse_params=False)
+        response=api(url=self.url+'networks/'+str(networkId)+'/edges/count', PARAMS=None, method="GET", verbose=verbose, parse_params=False, session=self.__session)
         return response
 
 
@@ -980,7 +982,7 @@ class networks(object):
         :returns: default: successful operation
         """
 
-        response=api(url=self.url+'networks/'+str(networkId)+'/tables/'+str(tableType)+'/columns/'+str(columnName)+'', method="PUT", body=body, verbose=verbose)
+        response=api(url=self.url+'networks/'+str(networkId)+'/tables/'+str(tableType)+'/columns/'+str(columnName)+'', method="PUT", body=body, verbose=verbose, session=self.__session)
         return response
 
 
@@ -996,7 +998,7 @@ class networks(object):
         :returns: default: successful operation
         """
 
-        response=api(url=self.url+'networks/'+str(networkId)+'/tables/'+str(tableType)+'/columns/'+str(columnName)+'', method="DELETE", verbose=verbose)
+        response=api(url=self.url+'networks/'+str(networkId)+'/tables/'+str(tableType)+'/columns/'+str(columnName)+'', method="DELETE", verbose=verbose, session=self.__session)
         return response
 
 
@@ -1012,7 +1014,7 @@ class networks(object):
         :returns: 200: successful operation
         """
 
-        response=api(url=self.url+'networks/'+str(networkId)+'/tables/'+str(tableType)+'/columns/'+str(columnName)+'', PARAMS=None, method="GET", verbose=verbose, parse_params=False)
+        response=api(url=self.url+'networks/'+str(networkId)+'/tables/'+str(tableType)+'/columns/'+str(columnName)+'', PARAMS=None, method="GET", verbose=verbose, parse_params=False, session=self.__session)
         return response
 
 
@@ -1028,7 +1030,7 @@ class networks(object):
         """
 
         PARAMS=set_param(['networkId','body'],[networkId,body])
-        response=api(url=self.url+'networks/'+str(networkId)+'/nodes', PARAMS=PARAMS, method="POST", verbose=verbose)
+        response=api(url=self.url+'networks/'+str(networkId)+'/nodes', PARAMS=PARAMS, method="POST", verbose=verbose, session=self.__session)
         return response
 
 
@@ -1042,7 +1044,7 @@ class networks(object):
         :returns: default: successful operation
         """
 
-        response=api(url=self.url+'networks/'+str(networkId)+'/nodes', method="DELETE", verbose=verbose)
+        response=api(url=self.url+'networks/'+str(networkId)+'/nodes', method="DELETE", verbose=verbose, session=self.__session)
         return response
 
 
@@ -1060,7 +1062,7 @@ class networks(object):
         :returns: 200: successful operation
         """
 
-        response=api(url=self.url+'networks/'+str(networkId)+'/nodes', PARAMS={'column':column, 'query':query}, method="GET", verbose=verbose, parse_params=False)
+        response=api(url=self.url+'networks/'+str(networkId)+'/nodes', PARAMS={'column':column, 'query':query}, method="GET", verbose=verbose, parse_params=False, session=self.__session)
         return response
 
 
@@ -1074,7 +1076,7 @@ class networks(object):
         :returns: 200: successful operation
         """
 
-        response=api(url=self.url+'networks/views/currentNetworkView', method="PUT", body=body, verbose=verbose)
+        response=api(url=self.url+'networks/views/currentNetworkView', method="PUT", body=body, verbose=verbose, session=self.__session)
         return response
 
 
@@ -1087,7 +1089,7 @@ class networks(object):
         :returns: 200: successful operation
         """
 
-        response=api(url=self.url+'networks/views/currentNetworkView', PARAMS=None, method="GET", verbose=verbose, parse_params=False)
+        response=api(url=self.url+'networks/views/currentNetworkView', PARAMS=None, method="GET", verbose=verbose, parse_params=False, session=self.__session)
         return response
 
 
@@ -1101,7 +1103,7 @@ class networks(object):
         :returns: 200: successful operation
         """
 
-        response=api(url=self.url+'networks/'+str(networkId)+'/groups/count', PARAMS=None, method="GET", verbose=verbose, parse_params=False)
+        response=api(url=self.url+'networks/'+str(networkId)+'/groups/count', PARAMS=None, method="GET", verbose=verbose, parse_params=False, session=self.__session)
         return response
 
 
@@ -1116,7 +1118,7 @@ class networks(object):
         :returns: default: successful operation
         """
 
-        response=api(url=self.url+'networks/'+str(networkId)+'/edges/'+str(edgeId)+'', method="DELETE", verbose=verbose)
+        response=api(url=self.url+'networks/'+str(networkId)+'/edges/'+str(edgeId)+'', method="DELETE", verbose=verbose, session=self.__session)
         return response
 
 
@@ -1131,7 +1133,7 @@ class networks(object):
         :returns: 200: successful operation
         """
 
-        response=api(url=self.url+'networks/'+str(networkId)+'/edges/'+str(edgeId)+'', PARAMS=None, method="GET", verbose=verbose, parse_params=False)
+        response=api(url=self.url+'networks/'+str(networkId)+'/edges/'+str(edgeId)+'', PARAMS=None, method="GET", verbose=verbose, parse_params=False, session=self.__session)
         return response
 
 
@@ -1161,7 +1163,7 @@ class networks(object):
         :returns: 200: successful operation
         """
 
-        response=api(url=self.url+'networks/'+str(networkId)+'/tables/'+str(tableType)+'/rows', PARAMS=None, method="GET", verbose=verbose, parse_params=False)
+        response=api(url=self.url+'networks/'+str(networkId)+'/tables/'+str(tableType)+'/rows', PARAMS=None, method="GET", verbose=verbose, parse_params=False, session=self.__session)
         return response
 
 
@@ -1175,7 +1177,7 @@ class networks(object):
         :returns: 200: successful operation
         """
 
-        response=api(url=self.url+'networks/'+str(networkId)+'/nodes/count', PARAMS=None, method="GET", verbose=verbose, parse_params=False)
+        response=api(url=self.url+'networks/'+str(networkId)+'/nodes/count', PARAMS=None, method="GET", verbose=verbose, parse_params=False, session=self.__session)
         return response
 
 
@@ -1191,7 +1193,7 @@ class networks(object):
         :returns: 200: successful operation
         """
 
-        response=api(url=self.url+'networks/'+str(networkId)+'/nodes/selected/neighbors', PARAMS=None, method="GET", verbose=verbose, parse_params=False)
+        response=api(url=self.url+'networks/'+str(networkId)+'/nodes/selected/neighbors', PARAMS=None, method="GET", verbose=verbose, parse_params=False, session=self.__session)
         return response
 
 
@@ -1205,7 +1207,7 @@ class networks(object):
         :returns: default: successful operation
         """
 
-        response=api(url=self.url+'networks/'+str(networkId)+'/views/first', method="DELETE", verbose=verbose)
+        response=api(url=self.url+'networks/'+str(networkId)+'/views/first', method="DELETE", verbose=verbose, session=self.__session)
         return response
 
 
@@ -1242,7 +1244,7 @@ class networks(object):
         :returns: default: successful operation
         """
 
-        response=api(url=self.url+'networks/'+str(networkId)+'/views/first', PARAMS={'file':file}, method="GET", verbose=verbose, parse_params=False)
+        response=api(url=self.url+'networks/'+str(networkId)+'/views/first', PARAMS={'file':file}, method="GET", verbose=verbose, parse_params=False, session=self.__session)
         return response
 
 
@@ -1257,7 +1259,7 @@ class networks(object):
         :returns: 200: successful operation
         """
 
-        response=api(url=self.url+'networks/'+str(networkId)+'/nodes/'+str(nodeId)+'/adjEdges', PARAMS=None, method="GET", verbose=verbose, parse_params=False)
+        response=api(url=self.url+'networks/'+str(networkId)+'/nodes/'+str(nodeId)+'/adjEdges', PARAMS=None, method="GET", verbose=verbose, parse_params=False, session=self.__session)
         return response
 
 
@@ -1272,7 +1274,7 @@ class networks(object):
         """
 
         PARAMS=set_param(['networkId'],[networkId])
-        response=api(url=self.url+'networks/'+str(networkId)+'/views', PARAMS=PARAMS, method="POST", verbose=verbose)
+        response=api(url=self.url+'networks/'+str(networkId)+'/views', PARAMS=PARAMS, method="POST", verbose=verbose, session=self.__session)
         return response
 
 
@@ -1286,7 +1288,7 @@ class networks(object):
         :returns: default: successful operation
         """
 
-        response=api(url=self.url+'networks/'+str(networkId)+'/views', method="DELETE", verbose=verbose)
+        response=api(url=self.url+'networks/'+str(networkId)+'/views', method="DELETE", verbose=verbose, session=self.__session)
         return response
 
 
@@ -1300,7 +1302,7 @@ class networks(object):
         :returns: 200: An array of Network View SUIDs
         """
 
-        response=api(url=self.url+'networks/'+str(networkId)+'/views', PARAMS=None, method="GET", verbose=verbose, parse_params=False)
+        response=api(url=self.url+'networks/'+str(networkId)+'/views', PARAMS=None, method="GET", verbose=verbose, parse_params=False, session=self.__session)
         return response
 
 
@@ -1330,7 +1332,7 @@ class networks(object):
         :returns: 200: successful operation
         """
 
-        response=api(url=self.url+'networks/'+str(networkId)+'/edges/'+str(edgeId)+'/'+str(type)+'', PARAMS=None, method="GET", verbose=verbose, parse_params=False)
+        response=api(url=self.url+'networks/'+str(networkId)+'/edges/'+str(edgeId)+'/'+str(type)+'', PARAMS=None, method="GET", verbose=verbose, parse_params=False, session=self.__session)
         return response
 
 
@@ -1364,7 +1366,7 @@ class networks(object):
         :returns: default: successful operation
         """
 
-        response=api(url=self.url+'networks/'+str(networkId)+'/views/'+str(viewId)+'/network', method="PUT", body=body, verbose=verbose)
+        response=api(url=self.url+'networks/'+str(networkId)+'/views/'+str(viewId)+'/network', method="PUT", body=body, verbose=verbose, session=self.__session)
         return response
 
 
@@ -1381,7 +1383,7 @@ class networks(object):
         :returns: 200: successful operation
         """
 
-        response=api(url=self.url+'networks/'+str(networkId)+'/views/'+str(viewId)+'/network', PARAMS=None, method="GET", verbose=verbose, parse_params=False)
+        response=api(url=self.url+'networks/'+str(networkId)+'/views/'+str(viewId)+'/network', PARAMS=None, method="GET", verbose=verbose, parse_params=False, session=self.__session)
         return response
 
 
@@ -1397,7 +1399,7 @@ class networks(object):
         """
 
         PARAMS=set_param(['networkId','body'],[networkId,body])
-        response=api(url=self.url+'networks/'+str(networkId)+'/groups', PARAMS=PARAMS, method="POST", verbose=verbose)
+        response=api(url=self.url+'networks/'+str(networkId)+'/groups', PARAMS=PARAMS, method="POST", verbose=verbose, session=self.__session)
         return response
 
 
@@ -1411,7 +1413,7 @@ class networks(object):
         :returns: default: successful operation
         """
 
-        response=api(url=self.url+'networks/'+str(networkId)+'/groups', method="DELETE", verbose=verbose)
+        response=api(url=self.url+'networks/'+str(networkId)+'/groups', method="DELETE", verbose=verbose, session=self.__session)
         return response
 
 
@@ -1425,7 +1427,7 @@ class networks(object):
         :returns: 200: successful operation
         """
 
-        response=api(url=self.url+'networks/'+str(networkId)+'/groups', PARAMS=None, method="GET", verbose=verbose, parse_params=False)
+        response=api(url=self.url+'networks/'+str(networkId)+'/groups', PARAMS=None, method="GET", verbose=verbose, parse_params=False, session=self.__session)
         return response
 
 
@@ -1443,7 +1445,7 @@ class networks(object):
         :returns: 200: SVG image stream.
         """
 
-        response=api(url=self.url+'networks/'+str(networkId)+'/views/'+str(viewId)+'.svg', PARAMS={'h':h}, method="GET", verbose=verbose, parse_params=False)
+        response=api(url=self.url+'networks/'+str(networkId)+'/views/'+str(viewId)+'.svg', PARAMS={'h':h}, method="GET", verbose=verbose, parse_params=False, session=self.__session)
         return response
 
 
@@ -1461,7 +1463,7 @@ class networks(object):
         :returns: 200: PNG image stream.
         """
 
-        response=api(url=self.url+'networks/'+str(networkId)+'/views/'+str(viewId)+'.png', PARAMS={'h':h}, method="GET", verbose=verbose, parse_params=False)
+        response=api(url=self.url+'networks/'+str(networkId)+'/views/'+str(viewId)+'.png', PARAMS={'h':h}, method="GET", verbose=verbose, parse_params=False, session=self.__session)
         return response
 
 
@@ -1478,6 +1480,6 @@ class networks(object):
         :returns: 200: SVG image stream.
         """
 
-        response=api(url=self.url+'networks/'+str(networkId)+'/views/first.svg', PARAMS={'h':h}, method="GET", verbose=verbose, parse_params=False)
+        response=api(url=self.url+'networks/'+str(networkId)+'/views/first.svg', PARAMS={'h':h}, method="GET", verbose=verbose, parse_params=False, session=self.__session)
         return response
 
@@ -5,10 +5,12 @@ class node(object):
     cytoscape network interface as shown in CyREST's swagger documentation for 'node'.
 
     :param url: an url of the type 'http://' + host + ':' + str(port) + '/' + version + '/'.
+    :param session: a Transport or requests.Session to send the calls through, default=a shared pooled transport.
     """
 
-    def __init__(self, url):
+    def __init__(self, url, session=None):
         self.__url = url + 'commands/node'
+        self.__session = session if session is not None else default_session()
 
     def create_attribute(self, column=None, listType=None, namespace=None, network=None, coltype=None, verbose=False):
         """
@@ -32,7 +34,7 @@ class node(object):
         """
         network=check_network(self,network,verbose=verbose)
         PARAMS=set_param(["column","listType","namespace","network","type"],[column,listType,namespace,network,coltype])
-        response=api(url=self.__url+"/create attribute", PARAMS=PARAMS, method="POST", verbose=verbose)
+        response=api(url=self.__url+"/create attribute", PARAMS=PARAMS, method="POST", verbose=verbose, session=self.__session)
         return response
 
     def get(self, network=None, node=None, verbose=False):
@@ -52,7 +54,7 @@ class node(object):
         """
         network=check_network(self,network,verbose=verbose)
         PARAMS=set_param(["network","node"],[network,node])
-        response=api(url=self.__url+"/get", PARAMS=PARAMS, method="POST", verbose=verbose)
+        response=api(url=self.__url+"/get", PARAMS=PARAMS, method="POST", verbose=verbose, session=self.__session)
         return response
 
     def get_attribute(self, columnList=None, namespace=None, network=None, nodeList=None, verbose=False):
@@ -81,7 +83,7 @@ class node(object):
         """
         network=check_network(self,network,verbose=verbose)
         PARAMS=set_param(["columnList", "namespace", "network","nodeList"],[columnList, namespace, network, nodeList])
-        response=api(url=self.__url+"/get attribute", PARAMS=PARAMS, method="POST", verbose=verbose)
+        response=api(url=self.__url+"/get attribute", PARAMS=PARAMS, method="POST", verbose=verbose, session=self.__session)
         return response
 
     def get_properties(self, network=None, nodeList=None, propertyList=None, verbose=False):
@@ -132,7 +134,7 @@ class node(object):
         """
         network=check_network(self,network,verbose=verbose)
         PARAMS=set_param(["network", "nodeList", "propertyList"],[network, nodeList, propertyList])
-        response=api(url=self.__url+"/get properties", PARAMS=PARAMS, method="POST", verbose=verbose)
+        response=api(url=self.__url+"/get properties", PARAMS=PARAMS, method="POST", verbose=verbose, session=self.__session)
         return response
 
     
@@ -156,7 +158,7 @@ class node(object):
         """
         network=check_network(self,network,verbose=verbose)
         PARAMS=set_param(["network", "nodeList"],[network, nodeList])
-        response=api(url=self.__url+"/list", PARAMS=PARAMS, method="POST", verbose=verbose)
+        response=api(url=self.__url+"/list", PARAMS=PARAMS, method="POST", verbose=verbose, session=self.__session)
 
         return response
 
@@ -176,7 +178,7 @@ class node(object):
         """
         network=check_network(self,network,verbose=verbose)
         PARAMS=set_param(["namespace", "network"],[namespace, network])
-        response=api(url=self.__url+"/list attributes", PARAMS=PARAMS, method="POST", verbose=verbose)
+        response=api(url=self.__url+"/list attributes", PARAMS=PARAMS, method="POST", verbose=verbose, session=self.__session)
 
         return response
 
@@ -193,7 +195,7 @@ class node(object):
         """
         network=check_network(self,network,verbose=verbose)
         PARAMS=set_param(["network"],[network])
-        response=api(url=self.__url+"/list properties", PARAMS=PARAMS, method="POST", verbose=verbose)
+        response=api(url=self.__url+"/list properties", PARAMS=PARAMS, method="POST", verbose=verbose, session=self.__session)
         return response
 
     def rename(self, network=None, newName=None, node=None, verbose=False):
@@ -210,7 +212,7 @@ class node(object):
         """
         network=check_network(self,network,verbose=verbose)
         PARAMS=set_param(["network", "newName", "node"],[network, newName, node])
-        response=api(url=self.__url+"/rename", PARAMS=PARAMS, method="POST", verbose=verbose)
+        response=api(url=self.__url+"/rename", PARAMS=PARAMS, method="POST", verbose=verbose, session=self.__session)
         return response
 
     
@@ -223,7 +225,7 @@ class node(object):
         """
         network=check_network(self,network,verbose=verbose)
         PARAMS=set_param(["file"],[afile])
-        response=api(url=self.__url+"/select from file", PARAMS=PARAMS, method="POST", verbose=verbose)
+        response=api(url=self.__url+"/select from file", PARAMS=PARAMS, method="POST", verbose=verbose, session=self.__session)
         return response
 
     
@@ -252,7 +254,7 @@ class node(object):
         """
         network=check_network(self,network,verbose=verbose)
         PARAMS=set_param(["columnList", "namespace", "network", "nodeList", "valueList"],[columnList, namespace, network, nodeList, valueList])
-        response=api(url=self.__url+"/set attribute", PARAMS=PARAMS, method="POST", verbose=verbose)
+        response=api(url=self.__url+"/set attribute", PARAMS=PARAMS, method="POST", verbose=verbose, session=self.__session)
         return response
 
     
@@ -277,7 +279,7 @@ class node(object):
         """
         network=check_network(self,network,verbose=verbose)
         PARAMS=set_param(["network", "nodeList", "propertyList", "valueList"],[network, nodeList, propertyList, valueList])
-        response=api(url=self.__url+"/set properties", PARAMS=PARAMS, method="POST", verbose=verbose)
+        response=api(url=self.__url+"/set properties", PARAMS=PARAMS, method="POST", verbose=verbose, session=self.__session)
         return response
 
     
\ No newline at end of file
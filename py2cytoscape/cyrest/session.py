@@ -5,10 +5,12 @@ class session(object):
     cytoscape session interface as shown in CyREST's swagger documentation for 'session'.
 
     :param url: an url of the type 'http://' + host + ':' + str(port) + '/' + version + '/'.
+    :param session: a Transport or requests.Session to send the calls through, default=a shared pooled transport.
     """
 
-    def __init__(self, url):
+    def __init__(self, url, session=None):
         self.__url = url + 'commands/session'
+        self.__session = session if session is not None else default_session()
 
     def new(self, verbose=False):
         """
@@ -18,7 +20,7 @@ class session(object):
         :param verbose: print more
         """
 
-        response=api(url=self.__url+"/new", verbose=verbose)
+        response=api(url=self.__url+"/new", verbose=verbose, session=self.__session)
         return response
 
     
@@ -32,7 +34,7 @@ class session(object):
         """
 
         PARAMS=set_param(["file", "url"],[session_file, session_url])
-        response=api(url=self.__url+"/open", PARAMS=PARAMS, verbose=verbose)
+        response=api(url=self.__url+"/open", PARAMS=PARAMS, verbose=verbose, session=self.__session)
         return response
 
     
@@ -49,7 +51,7 @@ class session(object):
 
         PARAMS={"file":session_file}
 
-        response=api(url=self.__url+"/save", PARAMS=PARAMS, verbose=verbose)
+        response=api(url=self.__url+"/save", PARAMS=PARAMS, verbose=verbose, session=self.__session)
         return response
 
     
@@ -64,7 +66,7 @@ class session(object):
 
         PARAMS={"file":session_file}
 
-        response=api(url=self.__url+"/save as", PARAMS=PARAMS, verbose=verbose)
+        response=api(url=self.__url+"/save as", PARAMS=PARAMS, verbose=verbose, session=self.__session)
         return response
 
     def createSessionFile(file, verbose=None):
@@ -78,7 +80,7 @@ class session(object):
         """
 
         PARAMS=set_param(['file'],[file])
-        response=api(url=self.url+'session', PARAMS=PARAMS, method="POST", verbose=verbose)
+        response=api(url=self.url+'session', PARAMS=PARAMS, method="POST", verbose=verbose, session=self.__session)
         return response
 
 
@@ -91,7 +93,7 @@ class session(object):
         :returns: 200: successful operation
         """
 
-        response=api(url=self.url+'session', method="DELETE", verbose=verbose)
+        response=api(url=self.url+'session', method="DELETE", verbose=verbose, session=self.__session)
         return response
 
 
@@ -105,7 +107,7 @@ class session(object):
         :returns: 200: successful operation
         """
 
-        response=api(url=self.url+'session', PARAMS={'file':file}, method="GET", verbose=verbose, parse_params=False)
+        response=api(url=self.url+'session', PARAMS={'file':file}, method="GET", verbose=verbose, parse_params=False, session=self.__session)
         return response
 
 
@@ -118,7 +120,7 @@ class session(object):
         :returns: 200: successful operation
         """
 
-        response=api(url=self.url+'session/name', PARAMS=None, method="GET", verbose=verbose, parse_params=False)
+        response=api(url=self.url+'session/name', PARAMS=None, method="GET", verbose=verbose, parse_params=False, session=self.__session)
         return response
 
     def runGarbageCollection(verbose=None):
@@ -130,5 +132,5 @@ class session(object):
         :returns: 204: Successful Garbage Collection
         """
 
-        response=api(url=self.url+'gc', PARAMS=None, method="GET", verbose=verbose, parse_params=False)
+        response=api(url=self.url+'gc', PARAMS=None, method="GET", verbose=verbose, parse_params=False, session=self.__session)
         return response
\ No newline at end of file
@@ -5,10 +5,12 @@ class styles(object):
     cytoscape session interface as shown in CyREST's swagger documentation.
 
     :param url: an url of the type 'http://' + host + ':' + str(port) + '/' + version + '/'.
+    :param session: a Transport or requests.Session to send the calls through, default=a shared pooled transport.
     """
 
-    def __init__(self, url):
+    def __init__(self, url, session=None):
         self.__url = url + 'commands/styles'
+        self.__session = session if session is not None else default_session()
 
 
     def updateDefaults(name, body, verbose=None):
@@ -24,7 +26,7 @@ class styles(object):
         :returns: default: successful operation
         """
 
-        response=api(url=self.url+'styles/'+str(name)+'/defaults', method="PUT", body=body, verbose=verbose)
+        response=api(url=self.url+'styles/'+str(name)+'/defaults', method="PUT", body=body, verbose=verbose, session=self.__session)
         return response
 
 
@@ -38,7 +40,7 @@ class styles(object):
         :returns: 200: successful operation
         """
 
-        response=api(url=self.url+'styles/'+str(name)+'/defaults', PARAMS=None, method="GET", verbose=verbose, parse_params=False)
+        response=api(url=self.url+'styles/'+str(name)+'/defaults', PARAMS=None, method="GET", verbose=verbose, parse_params=False, session=self.__session)
         return response
 
 
@@ -54,7 +56,7 @@ class styles(object):
         :returns: 200: successful operation
         """
 
-        response=api(url=self.url+'styles/visualproperties/'+str(visualProperty)+'', PARAMS=None, method="GET", verbose=verbose, parse_params=False)
+        response=api(url=self.url+'styles/visualproperties/'+str(visualProperty)+'', PARAMS=None, method="GET", verbose=verbose, parse_params=False, session=self.__session)
         return response
 
 
@@ -71,7 +73,7 @@ class styles(object):
         """
 
         PARAMS=set_param(['body'],[body])
-        response=api(url=self.url+'styles', PARAMS=PARAMS, method="POST", verbose=verbose)
+        response=api(url=self.url+'styles', PARAMS=PARAMS, method="POST", verbose=verbose, session=self.__session)
         return response
 
 
@@ -84,7 +86,7 @@ class styles(object):
         :returns: default: successful operation
         """
 
-        response=api(url=self.url+'styles', method="DELETE", verbose=verbose)
+        response=api(url=self.url+'styles', method="DELETE", verbose=verbose, session=self.__session)
         return response
 
 
@@ -97,7 +99,7 @@ class styles(object):
         :returns: 200: successful operation
         """
 
-        response=api(url=self.url+'styles', PARAMS=None, method="GET", verbose=verbose, parse_params=False)
+        response=api(url=self.url+'styles', PARAMS=None, method="GET", verbose=verbose, parse_params=False, session=self.__session)
         return response
 
 
@@ -112,7 +114,7 @@ class styles(object):
         :returns: default: successful operation
         """
 
-        response=api(url=self.url+'styles/'+str(name)+'/dependencies', method="PUT", body=body, verbose=verbose)
+        response=api(url=self.url+'styles/'+str(name)+'/dependencies', method="PUT", body=body, verbose=verbose, session=self.__session)
         return response
 
 
@@ -126,7 +128,7 @@ class styles(object):
         :returns: 200: successful operation
         """
 
-        response=api(url=self.url+'styles/'+str(name)+'/dependencies', PARAMS=None, method="GET", verbose=verbose, parse_params=False)
+        response=api(url=self.url+'styles/'+str(name)+'/dependencies', PARAMS=None, method="GET", verbose=verbose, parse_params=False, session=self.__session)
         return response
 
 
@@ -140,7 +142,7 @@ class styles(object):
         :returns: 200: successful operation
         """
 
-        response=api(url=self.url+'styles/'+str(name)+'.json', PARAMS=None, method="GET", verbose=verbose, parse_params=False)
+        response=api(url=self.url+'styles/'+str(name)+'.json', PARAMS=None, method="GET", verbose=verbose, parse_params=False, session=self.__session)
         return response
 
 
@@ -153,7 +155,7 @@ class styles(object):
         :returns: 200: successful operation
         """
 
-        response=api(url=self.url+'styles/count', PARAMS=None, method="GET", verbose=verbose, parse_params=False)
+        response=api(url=self.url+'styles/count', PARAMS=None, method="GET", verbose=verbose, parse_params=False, session=self.__session)
         return response
 
 
@@ -168,7 +170,7 @@ class styles(object):
         :returns: default: successful operation
         """
 
-        response=api(url=self.url+'styles/'+str(name)+'/mappings/'+str(vpName)+'', method="DELETE", verbose=verbose)
+        response=api(url=self.url+'styles/'+str(name)+'/mappings/'+str(vpName)+'', method="DELETE", verbose=verbose, session=self.__session)
         return response
 
 
@@ -186,7 +188,7 @@ class styles(object):
         :returns: 200: successful operation
         """
 
-        response=api(url=self.url+'styles/visualproperties/'+str(vp)+'/values', PARAMS=None, method="GET", verbose=verbose, parse_params=False)
+        response=api(url=self.url+'styles/visualproperties/'+str(vp)+'/values', PARAMS=None, method="GET", verbose=verbose, parse_params=False, session=self.__session)
         return response
 
 
@@ -201,7 +203,7 @@ class styles(object):
         :returns: default: successful operation
         """
 
-        response=api(url=self.url+'styles/'+str(name)+'', method="PUT", body=body, verbose=verbose)
+        response=api(url=self.url+'styles/'+str(name)+'', method="PUT", body=body, verbose=verbose, session=self.__session)
         return response
 
 
@@ -215,7 +217,7 @@ class styles(object):
         :returns: default: successful operation
         """
 
-        response=api(url=self.url+'styles/'+str(name)+'', method="DELETE", verbose=verbose)
+        response=api(url=self.url+'styles/'+str(name)+'', method="DELETE", verbose=verbose, session=self.__session)
         return response
 
 
@@ -229,7 +231,7 @@ class styles(object):
         :returns: 200: successful operation
         """
 
-        response=api(url=self.url+'styles/'+str(name)+'', PARAMS=None, method="GET", verbose=verbose, parse_params=False)
+        response=api(url=self.url+'styles/'+str(name)+'', PARAMS=None, method="GET", verbose=verbose, parse_params=False, session=self.__session)
         return response
 
 
@@ -293,7 +295,7 @@ class styles(object):
         """
 
         PARAMS=set_param(['name','body'],[name,body])
-        response=api(url=self.url+'styles/'+str(name)+'/mappings', PARAMS=PARAMS, method="POST", verbose=verbose)
+        response=api(url=self.url+'styles/'+str(name)+'/mappings', PARAMS=PARAMS, method="POST", verbose=verbose, session=self.__session)
         return response
 
 
@@ -355,7 +357,7 @@ class styles(object):
         :returns: 200: successful operation
         """
 
-        response=api(url=self.url+'styles/'+str(name)+'/mappings', PARAMS=None, method="GET", verbose=verbose, parse_params=False)
+        response=api(url=self.url+'styles/'+str(name)+'/mappings', PARAMS=None, method="GET", verbose=verbose, parse_params=False, session=self.__session)
         return response
 
 
@@ -370,7 +372,7 @@ class styles(object):
         :returns: 200: successful operation
         """
 
-        response=api(url=self.url+'styles/visualproperties', PARAMS=None, method="GET", verbose=verbose, parse_params=False)
+        response=api(url=self.url+'styles/visualproperties', PARAMS=None, method="GET", verbose=verbose, parse_params=False, session=self.__session)
         return response
 
 
@@ -434,7 +436,7 @@ class styles(object):
         :returns: default: successful operation
         """
 
-        response=api(url=self.url+'styles/'+str(name)+'/mappings/'+str(vp)+'', method="PUT", body=body, verbose=verbose)
+        response=api(url=self.url+'styles/'+str(name)+'/mappings/'+str(vp)+'', method="PUT", body=body, verbose=verbose, session=self.__session)
         return response
 
 
@@ -497,7 +499,7 @@ class styles(object):
         :returns: 200: successful operation
         """
 
-        response=api(url=self.url+'styles/'+str(name)+'/mappings/'+str(vp)+'', PARAMS=None, method="GET", verbose=verbose, parse_params=False)
+        response=api(url=self.url+'styles/'+str(name)+'/mappings/'+str(vp)+'', PARAMS=None, method="GET", verbose=verbose, parse_params=False, session=self.__session)
         return response
 
 
@@ -514,7 +516,7 @@ class styles(object):
         :returns: 200: successful operation
         """
 
-        response=api(url=self.url+'styles/'+str(name)+'/defaults/'+str(vp)+'', PARAMS=None, method="GET", verbose=verbose, parse_params=False)
+        response=api(url=self.url+'styles/'+str(name)+'/defaults/'+str(vp)+'', PARAMS=None, method="GET", verbose=verbose, parse_params=False, session=self.__session)
         return response
 
 
@@ -1,16 +1,56 @@
 from .base import *
-import pandas as pd
+from ..util.util_concurrent import run_concurrently
+from ..util import util_table
+import numpy as np
 import sys
 
+BATCH_SIZE=10000
+
+def table_rows(df, key_column="name"):
+    """
+    Converts a dataframe into the rows of a CyREST table update. Every row
+    holds the index value as key plus all of its non missing cells. Values
+    that are not strings are sent as floats.
+
+    :param df: a pandas dataframe indexed by the key values
+    :param key_column: name of the key column in the target table, default="name"
+
+    :returns: a list of dictionaries, one per row with at least one value
+    """
+    names=[str(key_column)]
+    values=[[str(r) for r in df.index.tolist()]]
+    sparse=[]
+    for c in df.columns.tolist():
+        col=df[c]
+        if col.dtype.kind in "biuf":
+            vals=col.astype(float)
+        else:
+            vals=col.map(lambda v: v if type(v) == str else float(v), na_action="ignore")
+        notna=col.notna().to_numpy()
+        if notna.all():
+            names.append(str(c))
+            values.append(vals.tolist())
+        else:
+            sparse.append((str(c), np.flatnonzero(notna).tolist(), vals[notna].tolist()))
+
+    rows=[dict(zip(names, row)) for row in zip(*values)]
+    for c, positions, vals in sparse:
+        for i, v in zip(positions, vals):
+            rows[i][c]=v
+    return [row for row in rows if len(row) > 1]
+
 class table(object):
     """
     cytoscape session interface as shown in CyREST's swagger documentation for 'table'.
 
     :param url: an url of the type 'http://' + host + ':' + str(port) + '/' + version + '/'.
+    :param session: a Transport or requests.Session to send the calls through, default=a shared pooled transport.
     """
 
-    def __init__(self, url):
+    def __init__(self, url, session=None):
         self.__url = url + 'commands/table'
+        self.__session = session if session is not None else default_session()
+        self.__suids = {}
         
     def add_row(self,keyValue=None,table=None,verbose=None):
         """
@@ -24,7 +64,7 @@ class table(object):
             d.
         """
         PARAMS=set_param(['keyValue','table'],[keyValue,table])
-        response=api(url=self.__url+"/add row", PARAMS=PARAMS, method="POST", verbose=verbose)
+        response=api(url=self.__url+"/add row", PARAMS=PARAMS, method="POST", verbose=verbose, session=self.__session)
         return response
 
     def create_column(self,columnName=None,listType=None,table=None,ntype=None,verbose=None):
@@ -42,7 +82,7 @@ class table(object):
         """
         PARAMS=set_param(['columnName','listType','table','type'],[columnName,\
         listType,table,ntype])
-        response=api(url=self.__url+"/create column", PARAMS=PARAMS, method="POST", verbose=verbose)
+        response=api(url=self.__url+"/create column", PARAMS=PARAMS, method="POST", verbose=verbose, session=self.__session)
         return response
 
     
@@ -61,7 +101,7 @@ class table(object):
         """
         PARAMS=set_param(['keyColumn','keyColumnType','title'],[keyColumn,\
         keyColumnType,title])
-        response=api(url=self.__url+"/create table", PARAMS=PARAMS, method="POST", verbose=verbose)
+        response=api(url=self.__url+"/create table", PARAMS=PARAMS, method="POST", verbose=verbose, session=self.__session)
         return response
 
     def delete_column(self,column=None,table=None,verbose=None):
@@ -76,7 +116,7 @@ class table(object):
             d.
         """
         PARAMS=set_param(['column','table'],[column,table])
-        response=api(url=self.__url+"/delete column", PARAMS=PARAMS, method="POST", verbose=verbose)
+        response=api(url=self.__url+"/delete column", PARAMS=PARAMS, method="POST", verbose=verbose, session=self.__session)
         return response
 
     
@@ -91,7 +131,7 @@ class table(object):
             d.
         """
         PARAMS=set_param(['keyValue','table'],[keyValue,table])
-        response=api(url=self.__url+"/delete row", PARAMS=PARAMS, method="POST", verbose=verbose)
+        response=api(url=self.__url+"/delete row", PARAMS=PARAMS, method="POST", verbose=verbose, session=self.__session)
         return response
 
     
@@ -104,7 +144,7 @@ class table(object):
             d.
         """
         PARAMS=set_param(['table'],[table])
-        response=api(url=self.__url+"/destroy", PARAMS=PARAMS, method="POST", verbose=verbose)
+        response=api(url=self.__url+"/destroy", PARAMS=PARAMS, method="POST", verbose=verbose, session=self.__session)
         return response
 
 
@@ -120,7 +160,7 @@ class table(object):
             d.
         """
         PARAMS=set_param(['options','OutputFile','table'],[options,OutputFile,table])
-        response=api(url=self.__url+"/export", PARAMS=PARAMS, method="POST", verbose=verbose)
+        response=api(url=self.__url+"/export", PARAMS=PARAMS, method="POST", verbose=verbose, session=self.__session)
         return response
 
 
@@ -136,7 +176,7 @@ class table(object):
         :returns: information about a table column
         """
         PARAMS=set_param(['column','table'],[column,table])
-        response=api(url=self.__url+"/get column", PARAMS=PARAMS, method="POST", verbose=verbose)
+        response=api(url=self.__url+"/get column", PARAMS=PARAMS, method="POST", verbose=verbose, session=self.__session)
         return response
 
 
@@ -153,7 +193,7 @@ class table(object):
 
         """
         PARAMS = set_param(['keyValue','table'],[keyValue,table])
-        response=api(url=self.__url+"/get row", PARAMS=PARAMS, method="POST", verbose=verbose)
+        response=api(url=self.__url+"/get row", PARAMS=PARAMS, method="POST", verbose=verbose, session=self.__session)
         return response
 
 
@@ -172,7 +212,7 @@ class table(object):
 
         """
         PARAMS=set_param(['column','keyValue','table'],[column,keyValue,table])
-        response=api(url=self.__url+"/get value", PARAMS=PARAMS, method="POST", verbose=verbose)
+        response=api(url=self.__url+"/get value", PARAMS=PARAMS, method="POST", verbose=verbose, session=self.__session)
         return response
 
 
@@ -239,7 +279,7 @@ class table(object):
         firstRowAsColumnNames,KeyColumnForMapping,KeyColumnForMappingNetworkList,\
         keyColumnIndex,newTableName,startLoadRow,TargetNetworkCollection,\
         TargetNetworkList,WhereImportTable])
-        response=api(url=self.__url+"/import file", PARAMS=PARAMS, method="POST", verbose=verbose)
+        response=api(url=self.__url+"/import file", PARAMS=PARAMS, method="POST", verbose=verbose, session=self.__session)
         return response
 
 
@@ -307,7 +347,7 @@ class table(object):
         firstRowAsColumnNames,KeyColumnForMapping,KeyColumnForMappingNetworkList,\
         keyColumnIndex,newTableName,startLoadRow,TargetNetworkCollection,\
         TargetNetworkList,url,WhereImportTable])
-        response=api(url=self.__url+"/import url", PARAMS=PARAMS, method="POST", verbose=verbose)
+        response=api(url=self.__url+"/import url", PARAMS=PARAMS, method="POST", verbose=verbose, session=self.__session)
         return response
 
 
@@ -325,7 +365,7 @@ class table(object):
         """
         PARAMS=set_param(['includePrivate','namespace','type'],\
         [includePrivate,namespace,atype])
-        response=api(url=self.__url+"/list", PARAMS=PARAMS, method="POST", verbose=verbose)
+        response=api(url=self.__url+"/list", PARAMS=PARAMS, method="POST", verbose=verbose, session=self.__session)
         return response
 
 
@@ -339,7 +379,7 @@ class table(object):
         :returns: list of columns in the table.
         """
         PARAMS=set_param(['table'],[table])
-        response=api(url=self.__url+"/list columns", PARAMS=PARAMS, method="POST", verbose=verbose)
+        response=api(url=self.__url+"/list columns", PARAMS=PARAMS, method="POST", verbose=verbose, session=self.__session)
         return response
 
 
@@ -358,7 +398,7 @@ class table(object):
             d.
         """
         PARAMS=set_param(['rowList','table'],[rowList,table])
-        response=api(url=self.__url+"/list rows", PARAMS=PARAMS, method="POST", verbose=verbose)
+        response=api(url=self.__url+"/list rows", PARAMS=PARAMS, method="POST", verbose=verbose, session=self.__session)
         return response
 
     
@@ -396,7 +436,7 @@ class table(object):
         """
         PARAMS=set_param(['DataTypeTargetForNetworkCollection','dataTypeTargetForNetworkList','mergeType','SourceMergeColumns','SourceMergeKey','SourceTable','TargetKeyNetworkCollection','TargetMergeKey','TargetNetworkCollection','TargetNetworkList','UnassignedTable','WhereMergeTable'],\
         [DataTypeTargetForNetworkCollection,dataTypeTargetForNetworkList,mergeType,SourceMergeColumns,SourceMergeKey,SourceTable,TargetKeyNetworkCollection,TargetMergeKey,TargetNetworkCollection,TargetNetworkList,UnassignedTable,WhereMergeTable])
-        response=api(url=self.__url+"/merge", PARAMS=PARAMS, method="POST", verbose=verbose)
+        response=api(url=self.__url+"/merge", PARAMS=PARAMS, method="POST", verbose=verbose, session=self.__session)
         return response
 
 
@@ -412,7 +452,7 @@ class table(object):
             d.
         """
         PARAMS=set_param(['columnName','newColumnName','table'],[columnName,newColumnName,table])
-        response=api(url=self.__url+"/rename column", PARAMS=PARAMS, method="POST", verbose=verbose)
+        response=api(url=self.__url+"/rename column", PARAMS=PARAMS, method="POST", verbose=verbose, session=self.__session)
         return response
 
 
@@ -428,7 +468,7 @@ class table(object):
             network
         """
         PARAMS=set_param(['table','title'],[table,title])
-        response=api(url=self.__url+"/set title", PARAMS=PARAMS, method="POST", verbose=verbose)
+        response=api(url=self.__url+"/set title", PARAMS=PARAMS, method="POST", verbose=verbose, session=self.__session)
         return response
 
 
@@ -453,69 +493,79 @@ class table(object):
             o the appropriate column type.
         """
         PARAMS=set_param(['columnName','rowList','table','value'],[columnName,rowList,table,value])
-        response=api(url=self.__url+"/set values", PARAMS=PARAMS, method="POST", verbose=verbose)
+        response=api(url=self.__url+"/set values", PARAMS=PARAMS, method="POST", verbose=verbose, session=self.__session)
         return response
 
-    def getTable(self, columns=None, table=None, network = "current", namespace='default', verbose=VERBOSE):
+    def getTable(self, columns=None, table=None, network = "current", namespace='default', max_workers=POOL_SIZE, verbose=VERBOSE):
         """
         Gets tables from cytoscape.
 
         :param table: table to retrieve eg. node
-        :param columns: columns to retrieve in list format
+        :param columns: columns to retrieve in list format, default=all columns
         :param network (string, optional): Specifies a network by name, or by
             SUID if the prefix SUID: is used. The keyword CURRENT, or a blank
             value can also be used to specify the current network.
         :param namespace (string, optional): Node, Edge, and Network objects support
             the default, local, and hidden namespaces. Root networks also support the
             shared namespace. Custom namespaces may be specified by Apps.
+        :param max_workers: number of columns fetched at the same time. When more
+            columns are requested the whole table is fetched in a single call.
+            default=10
 
         :returns: a pandas dataframe
         """
 
-        u=self.__url 
-        host=u.split("//")[1].split(":")[0]
-        port=u.split(":")[2].split("/")[0]
-        version=u.split(":")[2].split("/")[1]
+        # column types are taken from the column definitions
+        response, URL=self.__table_request("GET", network, namespace, table, "/columns", verbose=verbose)
+        with tracing.timed('parse'):
+            definitions=codec.loads(response.content)
+        definitions=dict([(d["name"],d) for d in definitions])
 
-        if type(network) != int:
-            network=check_network(self,network,verbose=verbose)
-            PARAMS=set_param(["columnList","namespace","network"],["SUID",namespace,network])
-            network=api(namespace="network", command="get attribute",PARAMS=PARAMS, host=host,port=str(port),version=version)
-            network=network[0]["SUID"]
+        if columns is not None:
+            for c in columns:
+                if c not in definitions:
+                    print("Could not find "+c)
+                    sys.stdout.flush()
+            columns=[c for c in columns if c in definitions]
 
-        df=pd.DataFrame()
-        def target(column):
-            URL="http://"+str(host)+":"+str(port)+"/v1/networks/"+str(network)+"/tables/"+namespace+table+"/columns/"+column
+        if columns is None or len(columns)+1 > max_workers:
             if verbose:
-                print("'"+URL+"'")
-                sys.stdout.flush()
-            response = urllib2.urlopen(URL)
-            response = response.read()
-            colA=json.loads(response)
-
-            col=pd.DataFrame()    
-            colHeader=colA["name"]
-            colValues=colA["values"]
-            col[colHeader]=colValues
-            return col
-
-        ncols=["name"]
-        for c in columns:
-            ncols.append(c.replace(" ","%20") )
-        for c in ncols:
-            try:
-                col=target(c)
-                df=pd.concat([df,col],axis=1)
-            except:
-                print("Could not find "+c)
+                print("'"+URL+"/rows'")
                 sys.stdout.flush()
+            response = self.__session.get(URL+"/rows")
+            with tracing.timed('parse'):
+                rows=codec.loads(response.content)
+            if columns is None:
+                cols=list(definitions.values())
+            else:
+                cols=[definitions[c] for c in ["name"]+columns]
+            df=util_table.to_dataframe(cols, util_table.rows_to_columns(cols, rows))
+        else:
+            def target(column):
+                CURL=URL+"/columns/"+column.replace(" ","%20")
+                if verbose:
+                    print("'"+CURL+"'")
+                    sys.stdout.flush()
+                try:
+                    response = self.__session.get(CURL)
+                    with tracing.timed('parse'):
+                        colA=codec.loads(response.content)
+                    return colA["name"], colA["values"]
+                except:
+                    print("Could not find "+column)
+                    sys.stdout.flush()
+                    return None
+
+            cols=run_concurrently(target, ["name"]+list(columns), max_workers)
+            cols=[c for c in cols if c is not None]
+            df=util_table.to_dataframe([definitions[c[0]] for c in cols], [c[1] for c in cols])
 
         df.index=df["name"].tolist()
         df=df.drop(["name"],axis=1)
         return df
 
     def loadTableData(self, df, df_key='index',table="node", table_key_column = "name", \
-        network="current",namespace="default",verbose=False):
+        network="current",namespace="default",batch_size=BATCH_SIZE,verbose=False):
         """
         Loads tables into cytoscape.
 
@@ -529,64 +579,86 @@ class table(object):
         :param namespace (string, optional): Node, Edge, and Network objects support
             the default, local, and hidden namespaces. Root networks also support the
             shared namespace. Custom namespaces may be specified by Apps.
+        :param batch_size: maximum number of rows sent in a single put request,
+            default=10000
         :param verbose: print more information
 
-        :returns: output of put request
+        :returns: output of the last put request
         """
 
-        u=self.__url 
-        host=u.split("//")[1].split(":")[0]
-        port=u.split(":")[2].split("/")[0]
-        version=u.split(":")[2].split("/")[1]
-
-        if type(network) != int:
-            network=check_network(self,network,verbose=verbose)
-            
-            PARAMS=set_param(["columnList","namespace","network"],["SUID",namespace,network])
-            networkID=api(namespace="network", command="get attribute",PARAMS=PARAMS, host=host,port=str(port),version=version)
-            
-            PARAMS=set_param(["columnList","namespace","network"],["name",namespace,network])
-            networkname=api(namespace="network", command="get attribute",PARAMS=PARAMS, host=host,port=str(port),version=version)
-                    
-            network=networkID[0]["SUID"]
-            networkname=networkname[0]["name"]
-
         tmp=df.copy()
         if df_key!="index":
             tmp.index=tmp[df_key].tolist()
             tmp=tmp.drop([df_key],axis=1)
-                
-        tablen=networkname+" default node"
-
-        data=[]
-
-        for c in tmp.columns.tolist():
-            tmpcol=tmp[[c]].dropna()
-            for r in tmpcol.index.tolist():
-                cell={}
-                cell[str(table_key_column)]=str(r) # {"name":"p53"}
-                val=tmpcol.loc[r,c]
-                if type(val) != str:
-                    val=float(val)
-                cell[str(c)]=val
-                data.append(cell)
-
-
-        upload={"key":table_key_column,"dataKey":table_key_column,\
-                "data":data}
-
-
-        URL="http://"+str(host)+":"+str(port)+"/v1/networks/"+str(network)+"/tables/"+namespace+table  
-        if verbose:
-            print("'"+URL+"'", upload)
-            sys.stdout.flush()
-        r = requests.put(url = URL, json = upload)
-        if verbose:
-            print(r)
-        checkresponse(r)
+
+        data=table_rows(tmp, table_key_column)
+
+        URL=None
+        for i in range(0, max(len(data), 1), batch_size):
+            upload={"key":table_key_column,"dataKey":table_key_column,\
+                    "data":data[i:i+batch_size]}
+            if URL is None:
+                r, URL=self.__table_request("PUT", network, namespace, table, json=upload, verbose=verbose)
+            else:
+                if verbose:
+                    print("'"+URL+"'")
+                    sys.stdout.flush()
+                r = self.__session.put(url = URL, json = upload)
+            if verbose:
+                print(r)
+            checkresponse(r)
         res=r.content
         return res
 
+    def __table_request(self, method, network, namespace, table, path="", verbose=False, **kwargs):
+        """
+        Sends a request to a default table of a network given by name or SUID.
+        A cached SUID that is not found any more, e.g. because the network was
+        deleted and created again under the same name, is resolved again.
+
+        :returns: the response and the URL of the table
+        """
+        u=self.__url
+        host=u.split("//")[1].split(":")[0]
+        port=u.split(":")[2].split("/")[0]
+        version=u.split(":")[2].split("/")[1]
+
+        refresh=False
+        while True:
+            if type(network) == int:
+                suid=network
+            else:
+                cached=(check_network(self,network), namespace) in self.__suids
+                suid=self.__get_network_suid(network,namespace,host,port,version,refresh=refresh,verbose=verbose)
+            URL="http://"+str(host)+":"+str(port)+"/"+version+"/networks/"+str(suid)+"/tables/"+namespace+table
+            if verbose:
+                print("'"+URL+path+"'")
+                sys.stdout.flush()
+            response=self.__session.request(method, URL+path, **kwargs)
+            if response.status_code != 404 or type(network) == int or refresh or not cached:
+                return response, URL
+            refresh=True
+
+    def __get_network_suid(self, network, namespace, host, port, version, refresh=False, verbose=False):
+        """
+        Resolves a network name to its SUID. Resolved names are cached, only
+        the current network is looked up on every call.
+
+        :param refresh: look the name up again instead of using the cache
+        """
+        network=check_network(self,network,verbose=verbose)
+        current=str(network).lower() in ["", "current"]
+        if refresh:
+            self.__suids.pop((network, namespace), None)
+        if not current and (network, namespace) in self.__suids:
+            return self.__suids[(network, namespace)]
+        PARAMS=set_param(["columnList","namespace","network"],["SUID",namespace,network])
+        response=api(namespace="network", command="get attribute",PARAMS=PARAMS, host=host,port=str(port),version=version, verbose=verbose, session=self.__session)
+        suid=response[0]["SUID"]
+        if not current:
+            self.__suids[(network, namespace)]=suid
+        return suid
+
     def getTableCount(verbose=None):
         """
         Returns the number of global tables.
@@ -596,5 +668,5 @@ class table(object):
         :returns: 200: successful operation
         """
 
-        response=api(url=self.url+'tables/count', PARAMS=None, method="GET", verbose=verbose, parse_params=False)
+        response=api(url=self.url+'tables/count', PARAMS=None, method="GET", verbose=verbose, parse_params=False, session=self.__session)
         return response
@@ -5,10 +5,12 @@ class ui(object):
     cytoscape session interface as shown in CyREST's swagger documentation.
 
     :param url: an url of the type 'http://' + host + ':' + str(port) + '/' + version + '/'.
+    :param session: a Transport or requests.Session to send the calls through, default=a shared pooled transport.
     """
 
-    def __init__(self, url):
+    def __init__(self, url, session=None):
         self.__url = url + 'commands/ui'
+        self.__session = session if session is not None else default_session()
 
 
     def updatePanelStatus(body, verbose=None):
@@ -21,7 +23,7 @@ class ui(object):
         :returns: default: successful operation
         """
 
-        response=api(url=self.url+'ui/panels', method="PUT", body=body, verbose=verbose)
+        response=api(url=self.url+'ui/panels', method="PUT", body=body, verbose=verbose, session=self.__session)
         return response
 
 
@@ -34,7 +36,7 @@ class ui(object):
         :returns: 200: successful operation
         """
 
-        response=api(url=self.url+'ui/panels', PARAMS=None, method="GET", verbose=verbose, parse_params=False)
+        response=api(url=self.url+'ui/panels', PARAMS=None, method="GET", verbose=verbose, parse_params=False, session=self.__session)
         return response
 
 
@@ -47,7 +49,7 @@ class ui(object):
         :returns: 200: successful operation
         """
 
-        response=api(url=self.url+'ui', PARAMS=None, method="GET", verbose=verbose, parse_params=False)
+        response=api(url=self.url+'ui', PARAMS=None, method="GET", verbose=verbose, parse_params=False, session=self.__session)
         return response
 
 
@@ -61,7 +63,7 @@ class ui(object):
         :returns: 200: successful operation
         """
 
-        response=api(url=self.url+'ui/panels/'+str(panelName)+'', PARAMS=None, method="GET", verbose=verbose, parse_params=False)
+        response=api(url=self.url+'ui/panels/'+str(panelName)+'', PARAMS=None, method="GET", verbose=verbose, parse_params=False, session=self.__session)
         return response
 
 
@@ -76,6 +78,6 @@ class ui(object):
         :returns: 200: successful operation
         """
 
-        response=api(url=self.url+'ui/lod', method="PUT", verbose=verbose)
+        response=api(url=self.url+'ui/lod', method="PUT", verbose=verbose, session=self.__session)
         return response
 
@@ -5,10 +5,12 @@ class view(object):
     cytoscape session interface as shown in CyREST's swagger documentation for 'view'.
 
     :param url: an url of the type 'http://' + host + ':' + str(port) + '/' + version + '/'.
+    :param session: a Transport or requests.Session to send the calls through, default=a shared pooled transport.
     """
 
-    def __init__(self, url):
+    def __init__(self, url, session=None):
         self.__url = url + 'commands/view'
+        self.__session = session if session is not None else default_session()
 
     def create(self, layout=None, network=None, verbose=False):
         """
@@ -28,7 +30,7 @@ class view(object):
         """
         network=check_network(self,network,verbose=verbose)
         PARAMS=set_param(["layout","network"],[layout,network])
-        response=api(url=self.__url+"/create", PARAMS=PARAMS, method="POST", verbose=verbose)
+        response=api(url=self.__url+"/create", PARAMS=PARAMS, method="POST", verbose=verbose, session=self.__session)
         return response
 
     def destroy(self, verbose=False):
@@ -40,7 +42,7 @@ class view(object):
         :returns: eg. [ 2155 ]
         """
         PARAMS={}
-        response=api(url=self.__url+"/destroy", PARAMS=PARAMS, method="POST", verbose=verbose)
+        response=api(url=self.__url+"/destroy", PARAMS=PARAMS, method="POST", verbose=verbose, session=self.__session)
         return response
 
     def export(self, Height=None, options=None, OutputFile=None, Resolution=None,\
@@ -81,7 +83,7 @@ class view(object):
         PARAMS=set_param(["Height","options","OutputFile","Resolution",\
         "Units","Width","Zoom"],\
         [Height,options,OutputFile,Resolution,Units,Width,Zoom ])
-        response=api(url=self.__url+"/export", PARAMS=PARAMS, method="POST", verbose=verbose)
+        response=api(url=self.__url+"/export", PARAMS=PARAMS, method="POST", verbose=verbose, session=self.__session)
         return response
 
     def fit_content(self, verbose=False):
@@ -92,7 +94,7 @@ class view(object):
 
         """
         PARAMS={}
-        response=api(url=self.__url+"/fit content", PARAMS=PARAMS, method="POST", verbose=verbose)
+        response=api(url=self.__url+"/fit content", PARAMS=PARAMS, method="POST", verbose=verbose, session=self.__session)
         return response 
 
     def fit_selected(self, verbose=False):
@@ -104,7 +106,7 @@ class view(object):
 
         """
         PARAMS={}
-        response=api(url=self.__url+"/fit selected", PARAMS=PARAMS, method="POST", verbose=verbose)
+        response=api(url=self.__url+"/fit selected", PARAMS=PARAMS, method="POST", verbose=verbose, session=self.__session)
         return response
     
     def get_current(self, layout=None, network=None, verbose=False):
@@ -116,7 +118,7 @@ class view(object):
         :returns: current view or null if there is none
         """
         PARAMS={}
-        response=api(url=self.__url+"/get_current", PARAMS=PARAMS, method="POST", verbose=verbose)
+        response=api(url=self.__url+"/get_current", PARAMS=PARAMS, method="POST", verbose=verbose, session=self.__session)
         return response
 
     def list(self, network=None, verbose=False):
@@ -135,7 +137,7 @@ class view(object):
         """
         network=check_network(self,network,verbose=verbose)
         PARAMS=set_param(["network"],[network])
-        response=api(url=self.__url+"/list", PARAMS=PARAMS, method="POST", verbose=verbose)
+        response=api(url=self.__url+"/list", PARAMS=PARAMS, method="POST", verbose=verbose, session=self.__session)
         return response
 
     def set_current(self, network=None, verbose=False):
@@ -150,7 +152,7 @@ class view(object):
         """
         network=check_network(self,network,verbose=verbose)
         PARAMS=set_param(["network"],[network])
-        response=api(url=self.__url+"/set current", PARAMS=PARAMS, method="POST", verbose=verbose)
+        response=api(url=self.__url+"/set current", PARAMS=PARAMS, method="POST", verbose=verbose, session=self.__session)
         return response
 
     def update(self, network=None, verbose=False):
@@ -165,5 +167,5 @@ class view(object):
         """
         network=check_network(self,network,verbose=verbose)
         PARAMS=set_param(["network"],[network])
-        response=api(url=self.__url+"/update", PARAMS=PARAMS, method="POST", verbose=verbose)
+        response=api(url=self.__url+"/update", PARAMS=PARAMS, method="POST", verbose=verbose, session=self.__session)
         return response
\ No newline at end of file
@@ -5,10 +5,12 @@ class vizmap(object):
     cytoscape session interface as shown in CyREST's swagger documentation for 'vizmap'.
 
     :param url: an url of the type 'http://' + host + ':' + str(port) + '/' + version + '/'.
+    :param session: a Transport or requests.Session to send the calls through, default=a shared pooled transport.
     """
 
-    def __init__(self, url):
+    def __init__(self, url, session=None):
         self.__url = url + 'commands/vizmap'
+        self.__session = session if session is not None else default_session()
 
     def apply(self, styles=None, verbose=False):
         """
@@ -35,7 +37,7 @@ class vizmap(object):
         """
 
         PARAMS=set_param(["styles"],[styles])
-        response=api(url=self.__url+"/apply", PARAMS=PARAMS, method="POST", verbose=verbose)
+        response=api(url=self.__url+"/apply", PARAMS=PARAMS, method="POST", verbose=verbose, session=self.__session)
         return response
 
 
@@ -67,7 +69,7 @@ class vizmap(object):
         """
 
         PARAMS=set_param(["options","OutputFile", "styles"],[options,OutputFile,styles])
-        response=api(url=self.__url+"/export", PARAMS=PARAMS, method="POST", verbose=verbose)
+        response=api(url=self.__url+"/export", PARAMS=PARAMS, method="POST", verbose=verbose, session=self.__session)
         return response
 
 
@@ -82,7 +84,7 @@ class vizmap(object):
 
         network=check_network(self,network,verbose=verbose)
         PARAMS=set_param(["afile"],[afile])
-        response=api(url=self.__url+"/load file", PARAMS=PARAMS, method="POST", verbose=verbose)
+        response=api(url=self.__url+"/load file", PARAMS=PARAMS, method="POST", verbose=verbose, session=self.__session)
         return response
 
     def create_style(self,title=None,defaults=None,mappings=None,verbose=VERBOSE):
@@ -127,7 +129,7 @@ class vizmap(object):
             PARAMS={"title":title,\
                 "defaults":defaults,\
                 "mappings":mappings}
-            r = requests.post(url = URL, json = PARAMS)
+            r = self.__session.post(url = URL, json = PARAMS)
             checkresponse(r)
 
     def update_style(self, title=None,defaults=None,mappings=None, verbose=False):
@@ -164,9 +166,9 @@ class vizmap(object):
             print(URL)
             sys.stdout.flush()
 
-        response = urllib2.urlopen(URL)    
-        response = response.read()
-        response = json.loads(response)
+        response = self.__session.get(URL)
+        with tracing.timed('parse'):
+            response = codec.loads(response.content)
         
         olddefaults=response["defaults"]
         oldmappings=response["mappings"]
@@ -187,14 +189,14 @@ class vizmap(object):
         else:
             newdefaults=olddefaults
             
-        r=requests.delete(URL)
+        r=self.__session.delete(URL)
         checkresponse(r)    
 
         URL="http://"+str(host)+":"+str(port)+"/v1/styles"
         PARAMS={"title":title,\
             "defaults":newdefaults,\
             "mappings":newmappings}
-        r = requests.post(url = URL, json = PARAMS)
+        r = self.__session.post(url = URL, json = PARAMS)
         checkresponse(r)
 
     def mapVisualProperty(self, visualProperty=None,mappingType=None, mappingColumn=None,
@@ -228,9 +230,9 @@ class vizmap(object):
         if type(network) != int:
             network=check_network(self,network,verbose=verbose)
             PARAMS=set_param(["columnList","namespace","network"],["SUID",namespace,network])
-            networkID=api(namespace="network", command="get attribute",PARAMS=PARAMS, host=host,port=str(port),version=version)
+            networkID=api(namespace="network", command="get attribute",PARAMS=PARAMS, host=host,port=str(port),version=version, session=self.__session)
             PARAMS=set_param(["columnList","namespace","network"],["name",namespace,network])
-            networkname=api(namespace="network", command="get attribute",PARAMS=PARAMS, host=host,port=str(port),version=version)
+            networkname=api(namespace="network", command="get attribute",PARAMS=PARAMS, host=host,port=str(port),version=version, session=self.__session)
             network=networkID[0]["SUID"]
             networkname=networkname[0]["name"]
 
@@ -238,9 +240,9 @@ class vizmap(object):
         if verbose:
             print(URL)
             sys.stdout.flush()
-        response = urllib2.urlopen(URL)
-        response = response.read()
-        response = json.loads(response)
+        response = self.__session.get(URL)
+        with tracing.timed('parse'):
+            response = codec.loads(response.content)
 
         mappingColumnType=None
         for r in response:
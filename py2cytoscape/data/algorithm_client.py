@@ -1,35 +1,36 @@
-import requests
+from ..transport import default_transport
 
 HEADERS = {'Content-Type': 'application/json'}
 
 
 class LayoutClient(object):
-    def __init__(self, url):
+    def __init__(self, url, session=None):
         self.__url = url + 'apply/layouts'
         self.__base_url = url
+        self.session = session if session is not None else default_transport()
 
     def get_all(self):
-        return requests.get(self.__url).json()
+        return self.session.get(self.__url).json()
 
     def apply(self, name='force-directed', network=None):
         if network is None:
             raise ValueError('Target network is required')
 
         url = self.__url + '/' + name + '/' + str(network.get_id())
-        requests.get(url)
+        self.session.get(url)
 
     def bundle_edge(self, network=None):
         if network is None:
             raise ValueError('Target network is required')
 
         url = self.__base_url + 'apply/edgebundling/' + str(network.get_id())
-        requests.get(url)
+        self.session.get(url)
 
     def fit(self, network=None):
         if network is None:
             raise ValueError('Target network is required')
         url = self.__base_url + 'apply/fit/' + str(network.get_id())
-        requests.get(url)
+        self.session.get(url)
 
     def apply_from_presets(self, network=None, positions=None):
         if network is None:
@@ -44,7 +45,7 @@ class LayoutClient(object):
                             + str(view_id) + '/nodes'
         pos = self.__apply_preset(locations=positions)
 
-        return requests.put(manual_layout_url, json=pos, headers=HEADERS)
+        return self.session.put(manual_layout_url, json=pos, headers=HEADERS)
 
     def __apply_preset(self, locations):
         position_list = []
@@ -67,12 +68,13 @@ class LayoutClient(object):
 
 
 class EdgeBundlingClient(object):
-    def __init__(self, url):
+    def __init__(self, url, session=None):
         self.__url = url + 'apply/edgebundling'
+        self.session = session if session is not None else default_transport()
 
     def apply(self, network=None):
         if network is None:
             raise ValueError('Target network is required')
 
         url = self.__url + '/' + str(network.get_id())
-        requests.get(url)
+        self.session.get(url)
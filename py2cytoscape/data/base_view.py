@@ -1,8 +1,7 @@
 # -*- coding: utf-8 -*-
-import json
-import requests
 
 from . import BASE_URL, HEADERS
+from .. import codec
 
 BASE_URL_NETWORK = BASE_URL + 'networks'
 
@@ -24,6 +23,7 @@ class BaseView(object):
         else:
             model_id = network_view.get_model_id()
             view_id = network_view.get_id()
+            self.session = network_view.session
             self.url = BASE_URL_NETWORK + '/' + str(model_id) + \
                        '/views/' + str(view_id) + \
                        '/' + obj_type + '/' + str(obj_id)
@@ -54,7 +54,7 @@ class BaseView(object):
                 "value": value
             }
         ]
-        requests.put(self.url, data=json.dumps(new_value), headers=HEADERS)
+        self.session.put(self.url, data=codec.dumps(new_value), headers=HEADERS)
 
     def set_values(self, values):
         """
@@ -74,7 +74,7 @@ class BaseView(object):
             }
             new_values.append(new_val)
 
-        requests.put(self.url, data=json.dumps(new_values), headers=HEADERS)
+        self.session.put(self.url, data=codec.dumps(new_values), headers=HEADERS)
 
     def get_value(self, visual_property):
         """Get a value for the Visual Property
@@ -82,7 +82,7 @@ class BaseView(object):
         :param visual_property:
         :return:
         """
-        res = requests.get(self.url + '/' + visual_property)
+        res = self.session.get(self.url + '/' + visual_property)
         return res.json()['value']
 
     def get_values(self):
@@ -91,7 +91,7 @@ class BaseView(object):
         :return: dictionary of values (VP ID - value)
         """
 
-        results = requests.get(self.url).json()
+        results = self.session.get(self.url).json()
         values = {}
         for entry in results:
             values[entry['visualProperty']] = entry['value']
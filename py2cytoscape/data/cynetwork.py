@@ -1,17 +1,35 @@
-import json
+import time
+from contextlib import contextmanager
 
 import pandas as pd
-import requests
 from py2cytoscape.data.network_view import CyNetworkView
 
+from ..util import cytoscapejs as util
 from ..util import util_networkx as nx_util
 from ..util import util_dataframe as df_util
 
 from .util_http import check_response
+from ..util.util_concurrent import run_concurrently
+from .network_batch import NetworkBatch, MAX_WORKERS, BULK_THRESHOLD
+from .util_network import NameIndex
+from .util_cache import ResponseCache, CACHE_SIZE, CHECK_INTERVAL
+from ..util import util_table
+from .. import codec
+from .. import tracing
+from ..transport import default_transport
 from . import BASE_URL, HEADERS
 
 BASE_URL_NETWORK = BASE_URL + 'networks'
 
+# Size in bytes of the pieces read from streamed responses
+CHUNK_SIZE = 2 ** 16
+
+# Default number of rows sent in one table update request
+ROWS_PER_REQUEST = 10000
+
+# Default number of nodes or edges removed by one delete command
+DELETE_CHUNK_SIZE = 10000
+
 
 class CyNetwork(object):
 
@@ -25,7 +43,15 @@ class CyNetwork(object):
             self.__id = suid
 
         self.__url = url + '/' + str(self.__id) + '/'
-        self.session = session if session is not None else requests.Session()
+        self.__commands_url = url.rsplit('networks', 1)[0] + 'commands/'
+        self.session = tracing.trace_session(
+            session if session is not None else default_transport())
+        self.__batch = None
+        self.__name_index = {}
+        self.__cache = None
+        self.__check_counts = True
+        self.__check_interval = CHECK_INTERVAL
+        self.__checked_at = None
 
     def get_id(self):
         """
@@ -35,44 +61,86 @@ class CyNetwork(object):
         """
         return self.__id
 
-    def to_json(self):
+    def to_json(self, stream=False):
         """
         Return this network in Cytoscape.js format.
 
+        :param stream: If True, nodes and edges are generators parsed from
+            the response while it is downloaded. Consume nodes before edges.
         :return: Cytoscape.js Style JSON as dictionary.
         """
-        return self.session.get(self.__url).json()
+        if stream:
+            return util.decode_lazy(self.__stream())
+        return self.__cached('json', lambda: self.session.get(self.__url).json())
 
-    def to_networkx(self):
+    def to_networkx(self, stream=False):
         """
         Return this network in NetworkX graph object.
 
+        :param stream: If True, elements are added to the graph while the
+            network is downloaded, instead of after parsing all of it.
         :return: Network as NetworkX graph object
         """
-        return nx_util.to_networkx(self.session.get(self.__url).json())
+        return nx_util.to_networkx(self.to_json(stream=stream))
 
-    def to_dataframe(self, extra_edges_columns=[]):
+    def to_dataframe(self, extra_edges_columns=[], stream=False):
         """
         Return this network in pandas DataFrame.
 
+        :param stream: If True, edges are converted while the network is
+            downloaded and nodes are skipped without being kept.
         :return: Network as DataFrame.  This is equivalent to SIF.
         """
+        if stream:
+            network = {'elements': {'edges': self.iter_edges()}}
+        else:
+            network = self.to_json()
         return df_util.to_dataframe(
-            self.session.get(self.__url).json(),
+            network,
             edges_attr_cols=extra_edges_columns
         )
 
+    def iter_nodes(self):
+        """
+        Iterate over the nodes of this network while it is downloaded.
+
+        :return: Generator of nodes in Cytoscape.js format.
+        """
+        return self.__iter_elements('nodes')
+
+    def iter_edges(self):
+        """
+        Iterate over the edges of this network while it is downloaded.
+
+        :return: Generator of edges in Cytoscape.js format.
+        """
+        return self.__iter_elements('edges')
+
+    def __iter_elements(self, group):
+        for key, value in util.iterdecode(self.__stream()):
+            if key == group:
+                yield value
+
+    def __stream(self):
+        res = self.session.get(self.__url, stream=True)
+        try:
+            check_response(res)
+            for chunk in res.iter_content(chunk_size=CHUNK_SIZE):
+                yield chunk
+        finally:
+            res.close()
+
     def get_nodes(self):
         """
         Get all nodes as a list of SUIDs
 
         :return:
         """
-        return self.session.get(self.__url + 'nodes').json()
+        return self.__cached('nodes', lambda: self.session.get(self.__url + 'nodes').json())
 
     def get_edges(self, format='suid'):
         if format is 'suid':
-            return self.session.get(self.__url + 'edges').json()
+            return self.__cached('edges', lambda: self.session.get(self.__url + 'edges').json())
         elif format is 'edgelist':
             # TODO: implement this
             pass
@@ -93,9 +161,13 @@ class CyNetwork(object):
         :param dataframe: If True, return a pandas dataframe instead of a dict.
         :return: A dict mapping names to SUIDs for the newly-created nodes.
         """
-        res = self.session.post(self.__url + 'nodes', data=json.dumps(node_name_list), headers=HEADERS)
+        self.__invalidate()
+        res = self.session.post(self.__url + 'nodes', data=codec.dumps(node_name_list), headers=HEADERS)
         check_response(res)
         nodes = res.json()
+        if 'node' in self.__name_index:
+            self.__name_index['node'].add([node['name'] for node in nodes],
+                                          [node['SUID'] for node in nodes])
         if dataframe:
             return pd.DataFrame(nodes).set_index(['SUID'])
         else:
@@ -126,9 +198,12 @@ class CyNetwork(object):
                           'target': edge_tuple[1],
                           'interaction': edge_tuple[2]}
                          for edge_tuple in edge_list]
-        res = self.session.post(self.__url + 'edges', data=json.dumps(edge_list), headers=HEADERS)
+        self.__invalidate()
+        res = self.session.post(self.__url + 'edges', data=codec.dumps(edge_list), headers=HEADERS)
         check_response(res)
         edges = res.json()
+        # Edge names are assigned by Cytoscape and not part of the response
+        self.__name_index.pop('edge', None)
         if dataframe:
             return pd.DataFrame(edges).set_index(['SUID'])
         else:
@@ -136,23 +211,215 @@ class CyNetwork(object):
 
     def delete_node(self, id):
         url = self.__url + 'nodes/' + str(id)
-        self.session.delete(url)
+        self.__invalidate()
+        if self.__batch is not None:
+            return self.__batch.add_delete('node', id)
+        res = self.session.delete(url)
+        check_response(res)
+        self.__remove_from_index('node', id)
+        # Adjacent edges are deleted along with the node
+        self.__name_index.pop('edge', None)
 
     def delete_edge(self, id):
         url = self.__url + 'edges/' + str(id)
-        self.session.delete(url)
+        self.__invalidate()
+        if self.__batch is not None:
+            return self.__batch.add_delete('edge', id)
+        res = self.session.delete(url)
+        check_response(res)
+        self.__remove_from_index('edge', id)
+
+    def delete_nodes(self, suids, chunk_size=DELETE_CHUNK_SIZE):
+        """
+        Delete many nodes at once, along with their adjacent edges.
+
+        :param suids: SUIDs of the nodes to delete.
+        :param chunk_size: Maximum number of nodes removed by one request.
+        :return: Number of nodes deleted.
+        """
+        return self.__delete_elements('node', suids, chunk_size)
+
+    def delete_edges(self, suids, chunk_size=DELETE_CHUNK_SIZE):
+        """
+        Delete many edges at once.
+
+        :param suids: SUIDs of the edges to delete.
+        :param chunk_size: Maximum number of edges removed by one request.
+        :return: Number of edges deleted.
+        """
+        return self.__delete_elements('edge', suids, chunk_size)
+
+    def __delete_elements(self, type, suids, chunk_size=DELETE_CHUNK_SIZE):
+        suids = list(suids)
+        self.__invalidate()
+        if type == 'node':
+            self.__name_index.pop('edge', None)
+
+        count_url = self.__url + type + 's/count'
+        count = self.session.get(count_url).json()['count']
+        url = self.__commands_url + 'network/delete'
+        for i in range(0, len(suids), chunk_size):
+            params = {
+                'network': 'SUID:' + str(self.__id),
+                type + 'List': ','.join('SUID:' + str(suid)
+                                        for suid in suids[i:i + chunk_size])
+            }
+            res = self.session.post(url, data=codec.dumps(params), headers=HEADERS)
+            try:
+                check_response(res)
+            except Exception:
+                # Earlier chunks are gone, the index is downloaded again
+                self.__name_index.pop(type, None)
+                raise
+        for suid in suids:
+            self.__remove_from_index(type, suid)
+        return count - self.session.get(count_url).json()['count']
+
+    def get_name_index(self, obj_type='node'):
+        """
+        Get the mapping between names and SUIDs of nodes or edges.
+
+        The index is downloaded once and kept up to date by add_nodes,
+        delete_node and delete_edge of this object. add_edges and
+        delete_node drop the edge index, which is downloaded again on the
+        next call. Table updates writing the name column and batches drop
+        the index as well. Changes made by other clients are not tracked.
+
+        :param obj_type: 'node' or 'edge'.
+        :return: NameIndex with name2suid and suid2name dicts.
+        """
+        if obj_type not in self.__name_index:
+            names = self.__get_column(obj_type, 'name').tolist()
+            suids = self.__get_column(obj_type, 'SUID').tolist()
+            self.__name_index[obj_type] = NameIndex(names, suids)
+        return self.__name_index[obj_type]
+
+    def __remove_from_index(self, type, id):
+        if type in self.__name_index:
+            self.__name_index[type].remove(id)
+
+    @contextmanager
+    def batch(self, max_workers=MAX_WORKERS, bulk_threshold=BULK_THRESHOLD):
+        """
+        Collect per-element calls and send them together when the block ends.
+
+        Inside the block, get_node_value, get_edge_value, get_neighbours,
+        get_adjacent_edges, delete_node and delete_edge return a BatchResult
+        instead of a value. Call result() on it after the block to get the
+        value the call would have returned on its own.
+
+            with network.batch():
+                names = [network.get_node_value(n, 'name') for n in nodes]
+            names = [name.result() for name in names]
+
+        Code using these values inside the block, e.g. to decide what to
+        call next, does not run unchanged: the values are only known once
+        the block ends. Only move the calls whose results are not needed
+        before then into the block.
+
+        Calls run in the order they were made, except that runs of reads
+        and runs of deletions are each sent together, see NetworkBatch.
+
+        :param max_workers: Maximum number of concurrent requests.
+        :param bulk_threshold: Number of row lookups on one table above which
+            the whole table is downloaded once instead. Likewise, as many
+            node or edge deletions are sent as one delete_nodes or
+            delete_edges call.
+        :return: NetworkBatch collecting the calls.
+        """
+        if self.__batch is not None:
+            # Nested blocks join the outer batch.
+            yield self.__batch
+            return
+
+        self.__batch = NetworkBatch(self.session, self.__url,
+                                    max_workers=max_workers,
+                                    bulk_threshold=bulk_threshold,
+                                    delete=self.__delete_elements)
+        try:
+            yield self.__batch
+        finally:
+            batch = self.__batch
+            self.__batch = None
+        try:
+            batch.send()
+        finally:
+            # Deletions sent by the batch are not tracked one by one
+            self.__name_index = {}
+            self.__invalidate()
+
+    def enable_cache(self, max_size=CACHE_SIZE, check_counts=True,
+                     check_interval=CHECK_INTERVAL):
+        """
+        Keep the results of read calls in memory and answer repeated calls
+        from there.
+
+        Cached are to_json, get_nodes, get_edges, the get_*_table,
+        get_*_columns and get_*_column calls. The cache is emptied by every
+        modifying call of this object. Cached results are shared between
+        calls and must not be modified.
+
+        :param max_size: Maximum number of cached results. The least recently
+            used result is dropped first.
+        :param check_counts: If True, the node and edge counts are requested
+            before a cached read and the cache is emptied when they
+            changed. This detects most changes made by other clients, but
+            not changes of table values only. If False, cached reads need no
+            requests at all.
+        :param check_interval: Seconds after a check during which cached
+            reads are answered without checking the counts again, so a
+            burst of reads costs at most one check. 0 checks before every
+            cached read.
+        """
+        self.__cache = ResponseCache(max_size)
+        self.__check_counts = check_counts
+        self.__check_interval = check_interval
+        self.__checked_at = None
+
+    def disable_cache(self):
+        """ Stop caching and drop all cached results. """
+        self.__cache = None
+
+    def __cached(self, key, load):
+        cache = self.__cache
+        if cache is None:
+            return load()
+        now = time.time()
+        if self.__check_counts and (
+                self.__checked_at is None or
+                now - self.__checked_at >= self.__check_interval):
+            cache.validate(tuple(
+                self.session.get(self.__url + group + '/count').json()['count']
+                for group in ('nodes', 'edges')))
+            self.__checked_at = now
+        return cache.get(key, load)
+
+    def __invalidate(self):
+        if self.__cache is not None:
+            self.__cache.clear()
+            self.__checked_at = None
 
     def __get_table(self, type, format=None):
         url = self.__url + 'tables/default' + type
         if format is None or format is 'dataframe':
-            return pd.DataFrame(self.session.get(url).json()['rows'])
+            # Column types come from the column definitions
+            columns = self.__get_column_definitions(type)
+            rows = self.__get_rows(type)
+            return util_table.to_dataframe(
+                columns, util_table.rows_to_columns(columns, rows))
         elif format is 'csv' or format is 'tsv':
-            return self.session.get(url + '.' + format).content
+            return self.__cached(('table', type, format),
+                                 lambda: self.session.get(url + '.' + format).content)
         elif format is 'cytoscapejs':
-            return self.session.get(url).json()['rows']
+            return self.__get_rows(type)
         else:
             raise ValueError('Unsupported format: ' + format)
 
+    def __get_rows(self, type):
+        url = self.__url + 'tables/default' + type
+        return self.__cached(('table', type),
+                             lambda: self.session.get(url).json()['rows'])
+
     def get_node_table(self, format=None):
         return self.__get_table('node', format)
 
@@ -163,9 +430,13 @@ class CyNetwork(object):
         return self.__get_table('network', format)
 
     def __get_columns(self, type=None):
+        columns = self.__get_column_definitions(type)
+        return pd.DataFrame(columns).set_index(['name'])
+
+    def __get_column_definitions(self, type):
         url = self.__url + 'tables/default' + type + '/columns'
-        df = pd.DataFrame(self.session.get(url).json())
-        return df.set_index(['name'])
+        return self.__cached(('columns', type),
+                             lambda: self.session.get(url).json())
 
     def get_node_columns(self):
         """
@@ -192,9 +463,14 @@ class CyNetwork(object):
         return self.__get_columns('networks')
 
     def __get_column(self, type=None, column=None):
+        return pd.Series(self.__get_column_values(type, column))
+
+    def __get_column_values(self, type, column, cached=True):
         url = self.__url + 'tables/default' + type + '/columns/' + column
-        result = self.session.get(url).json()
-        return pd.Series(result['values'])
+        load = lambda: self.session.get(url).json()
+        result = self.__cached(('column', type, column), load) if cached \
+            else load()
+        return result['values']
 
     def get_node_column(self, column):
         return self.__get_column('node', column=column)
@@ -205,10 +481,14 @@ class CyNetwork(object):
     def __get_value(self, type=None, id=None, column=None):
         if column is None and id is not None:
             # Extract a row in table
+            if self.__batch is not None:
+                return self.__batch.add_row(type, id)
             url = self.__url + 'tables/default' + type + '/rows/' + str(id)
             return pd.Series(self.session.get(url).json())
         elif column is not None and id is not None:
             url = self.__url + 'tables/default' + type + '/rows/' + str(id) + '/' + column
+            if self.__batch is not None:
+                return self.__batch.add('get', url, lambda res: res.content)
             return self.session.get(url).content
         else:
             raise ValueError('ID is required.')
@@ -222,13 +502,103 @@ class CyNetwork(object):
     def get_network_value(self, column):
         return self.__get_value(type='network', id=self.__id, column=column)
 
+    def to_arrow(self, table='node', columns=None, max_workers=MAX_WORKERS):
+        """
+        Get a default table as pyarrow Table.
+
+        Each column is downloaded as one array of values and converted into
+        the pyarrow type matching its Cytoscape type, e.g. Integer into
+        int32 and List of String into list<string>. Requires pyarrow.
+
+        :param table: Table type: 'node', 'edge' or 'network'.
+        :param columns: Names of the columns to get, default all columns.
+        :param max_workers: Maximum number of columns downloaded at once.
+        :return: pyarrow Table.
+        """
+        definitions = self.__get_column_definitions(table)
+        if columns is not None:
+            by_name = {column['name']: column for column in definitions}
+            definitions = [by_name[name] for name in columns]
+
+        def load():
+            values = run_concurrently(
+                lambda column: self.__get_column_values(
+                    table, column['name'], cached=False),
+                definitions, max_workers)
+            return util_table.to_arrow(definitions, values)
+        # One cache entry for the whole table, not one per column
+        return self.__cached(
+            ('arrow', table, tuple(column['name'] for column in definitions)),
+            load)
+
+    def to_parquet(self, path, table='node', columns=None,
+                   max_workers=MAX_WORKERS, **kwargs):
+        """
+        Write a default table to a Parquet file. Requires pyarrow.
+
+        :param path: Path or writable file object.
+        :param table: Table type: 'node', 'edge' or 'network'.
+        :param columns: Names of the columns to write, default all columns.
+        :param max_workers: Maximum number of columns downloaded at once.
+        :param kwargs: Passed on to pyarrow.parquet.write_table.
+        """
+        util_table.to_parquet(self.to_arrow(table, columns, max_workers),
+                              path, **kwargs)
+
+    def update_node_table_from_arrow(self, table, network_key_col='name',
+                                     data_key_col=None,
+                                     rows_per_request=ROWS_PER_REQUEST,
+                                     max_workers=1):
+        return self.__update_table('node', df=table, network_key_col=network_key_col, data_key_col=data_key_col,
+                                   rows_per_request=rows_per_request, max_workers=max_workers)
+
+    def update_edge_table_from_arrow(self, table, network_key_col='name',
+                                     data_key_col=None,
+                                     rows_per_request=ROWS_PER_REQUEST,
+                                     max_workers=1):
+        return self.__update_table('edge', df=table, network_key_col=network_key_col, data_key_col=data_key_col,
+                                   rows_per_request=rows_per_request, max_workers=max_workers)
+
+    def update_network_table_from_arrow(self, table, network_key_col='name',
+                                        data_key_col=None,
+                                        rows_per_request=ROWS_PER_REQUEST,
+                                        max_workers=1):
+        return self.__update_table('network', df=table, network_key_col=network_key_col, data_key_col=data_key_col,
+                                   rows_per_request=rows_per_request, max_workers=max_workers)
+
     def update_node_table(self, df=None, network_key_col='name',
-                          data_key_col=None):
-        return self.__update_table('node', df=df, network_key_col=network_key_col, data_key_col=data_key_col)
+                          data_key_col=None, rows_per_request=ROWS_PER_REQUEST,
+                          max_workers=1):
+        return self.__update_table('node', df=df, network_key_col=network_key_col, data_key_col=data_key_col,
+                                   rows_per_request=rows_per_request, max_workers=max_workers)
+
+    def update_edge_table(self, df=None, network_key_col='name',
+                          data_key_col=None, rows_per_request=ROWS_PER_REQUEST,
+                          max_workers=1):
+        return self.__update_table('edge', df=df, network_key_col=network_key_col, data_key_col=data_key_col,
+                                   rows_per_request=rows_per_request, max_workers=max_workers)
+
+    def update_network_table(self, df=None, network_key_col='name',
+                             data_key_col=None, rows_per_request=ROWS_PER_REQUEST,
+                             max_workers=1):
+        return self.__update_table('network', df=df, network_key_col=network_key_col, data_key_col=data_key_col,
+                                   rows_per_request=rows_per_request, max_workers=max_workers)
 
     def __update_table(self, type, df, network_key_col='name',
-                       data_key_col=None):
-
+                       data_key_col=None, rows_per_request=ROWS_PER_REQUEST,
+                       max_workers=1):
+        """
+        Upload the rows of df into a default table.
+
+        :param type: Table type: 'node', 'edge' or 'network'.
+        :param df: DataFrame or pyarrow Table with the new values.
+        :param network_key_col: Key column in the Cytoscape table.
+        :param data_key_col: Key column in df. Uses the index of a DataFrame
+            or the network_key_col column of a pyarrow Table if None.
+        :param rows_per_request: Maximum number of rows sent in one request.
+            All rows are sent at once if None.
+        :param max_workers: Maximum number of concurrent requests.
+        """
         is_index_col = False
 
         if data_key_col is None:
@@ -238,27 +608,43 @@ class CyNetwork(object):
         else:
             data_key = data_key_col
 
-        table = {
-            'key': network_key_col,
-            'dataKey': data_key
-        }
-
-        if is_index_col:
-            # Use DataFrame's index as the mapping key
-            df2 = pd.DataFrame(df)
-            df2[network_key_col] = df.index
-            data = df2.to_json(orient='records')
-            del df2
+        if util_table.is_arrow(df):
+            serialize = lambda rows: codec.dumps(rows.to_pylist())
+            take = df.slice
         else:
-            data = df.to_json(orient='records')
-
-        table['data'] = json.loads(data)
-
+            if is_index_col:
+                # Use DataFrame's index as the mapping key
+                df = pd.DataFrame(df).assign(**{network_key_col: df.index})
+            serialize = lambda rows: rows.to_json(
+                orient='records').encode('utf-8')
+            take = lambda i, n: df.iloc[i:i + n]
+
+        # The rows are serialized once and spliced into the request body
+        head = b'{"key": ' + codec.dumps(network_key_col) + \
+            b', "dataKey": ' + codec.dumps(data_key) + b', "data": '
         url = self.__url + 'tables/default' + type
-        self.session.put(url, json=table, headers=HEADERS)
+        self.__invalidate()
+        columns = df.column_names if util_table.is_arrow(df) else df.columns
+        if 'name' in set(columns) - set([data_key]):
+            # Names are changed, the index is downloaded again
+            self.__name_index.pop(type, None)
+
+        def put_rows(rows):
+            with tracing.timed('serialize'):
+                body = head + serialize(rows) + b'}'
+            res = self.session.put(url, data=body, headers=HEADERS)
+            check_response(res)
+
+        if rows_per_request is None or len(df) <= rows_per_request:
+            chunks = [df]
+        else:
+            chunks = [take(i, rows_per_request)
+                      for i in range(0, len(df), rows_per_request)]
+        run_concurrently(put_rows, chunks, max_workers)
 
     def __delete_column(self, type, column):
         url = self.__url + 'tables/default' + type + '/columns/' + column
+        self.__invalidate()
         self.session.delete(url)
 
     def delete_node_table_column(self, column):
@@ -278,7 +664,8 @@ class CyNetwork(object):
             'immutable': immutable,
             'list': list
         }
-        self.session.post(url, data=json.dumps(new_column), headers=HEADERS)
+        self.__invalidate()
+        self.session.post(url, data=codec.dumps(new_column), headers=HEADERS)
 
     def create_node_column(self, name, data_type='String', is_immutable=False, is_list=False):
         self.__create_column('node', name=name, data_type=data_type, immutable=is_immutable, list=is_list)
@@ -293,10 +680,14 @@ class CyNetwork(object):
     # Utility functions
     def get_neighbours(self, node_id):
         url = self.__url + 'nodes/' + str(node_id) + '/neighbors'
+        if self.__batch is not None:
+            return self.__batch.add('get', url, lambda res: res.json())
         return self.session.get(url).json()
 
     def get_adjacent_edges(self, node_id):
         url = self.__url + 'nodes/' + str(node_id) + '/adjEdges'
+        if self.__batch is not None:
+            return self.__batch.add('get', url, lambda res: res.json())
         return self.session.get(url).json()
 
 
@@ -1,29 +1,35 @@
 # -*- coding: utf-8 -*-
 
-import requests
 from .network_client import NetworkClient
 from .style_client import StyleClient
 from .algorithm_client import LayoutClient
 from .algorithm_client import EdgeBundlingClient
 from .session_client import SessionClient
+from ..transport import Transport
 
 from . import PORT, IP, VERSION
 
 
 class CyRestClient(object):
 
-    def __init__(self, ip=IP, port=PORT, version=VERSION):
+    def __init__(self, ip=IP, port=PORT, version=VERSION, transport=None):
+        """
+        :param transport: Transport all sub-clients send their requests
+            through, e.g. one shared with a cyclient. A new one by default.
+        """
         self.__url = 'http://' + ip + ':' + str(port) + '/' + version + '/'
+        self.transport = transport if transport is not None else Transport()
 
-        self.network = NetworkClient(self.__url)
-        self.style = StyleClient(self.__url)
-        self.layout = LayoutClient(self.__url)
-        self.edgebundling = EdgeBundlingClient(self.__url)
-        self.session = SessionClient(self.__url)
+        self.network = NetworkClient(self.__url, session=self.transport)
+        self.style = StyleClient(self.__url, session=self.transport)
+        self.layout = LayoutClient(self.__url, session=self.transport)
+        self.edgebundling = EdgeBundlingClient(self.__url,
+                                               session=self.transport)
+        self.session = SessionClient(self.__url, session=self.transport)
 
     def status(self):
         try:
-            response = requests.get(self.__url).json()
+            response = self.transport.get(self.__url).json()
         except Exception as e:
             print('Could not get status from cyREST: ' + e)
         else:
@@ -0,0 +1,186 @@
+# -*- coding: utf-8 -*-
+from collections import OrderedDict
+from itertools import groupby
+
+import pandas as pd
+
+from ..util.util_concurrent import run_concurrently
+
+MAX_WORKERS = 8
+BULK_THRESHOLD = 100
+
+
+class BatchResult(object):
+    """
+    Placeholder returned by per-element CyNetwork calls made inside a
+    batch. The value becomes available when the batch is sent.
+    """
+
+    def __init__(self):
+        self.__done = False
+        self.__value = None
+        self.__error = None
+
+    def done(self):
+        return self.__done
+
+    def result(self):
+        """
+        Get the value the call would have returned outside of a batch.
+
+        :return: Result of the call. Raises the call's error, if any.
+        """
+        if not self.__done:
+            raise ValueError('Batch has not been sent yet.')
+        if self.__error is not None:
+            raise self.__error
+        return self.__value
+
+    def set_result(self, value):
+        self.__value = value
+        self.__done = True
+
+    def set_error(self, error):
+        self.__error = error
+        self.__done = True
+
+
+class NetworkBatch(object):
+    """
+    Collects per-element calls on a network and sends them together.
+
+    Calls run in the order they were made, except that consecutive reads,
+    or consecutive deletions, are sent together: a read made after a
+    deletion only runs once the deletion is done, and the other way round.
+
+    Within such a run, row lookups are answered from a single table
+    download when at least bulk_threshold rows of the same table are
+    requested. Likewise, at least bulk_threshold node or edge deletions are
+    passed to delete at once. All other calls are pipelined over up to
+    max_workers concurrent requests.
+    """
+
+    def __init__(self, session, network_url, max_workers=MAX_WORKERS,
+                 bulk_threshold=BULK_THRESHOLD, delete=None):
+        self.__session = session
+        self.__url = network_url
+        self.max_workers = max_workers
+        self.bulk_threshold = bulk_threshold
+        self.__delete = delete
+        # (kind, call) in the order of the calls, kind being 'call', 'row'
+        # or 'delete'
+        self.__queue = []
+
+    def __len__(self):
+        return len(self.__queue)
+
+    def add(self, method, url, parse):
+        """
+        Queue a single request.
+
+        :param method: HTTP method, e.g. 'get' or 'delete'.
+        :param url: Request URL.
+        :param parse: Function turning the response into the call's result.
+        :return: BatchResult for the call.
+        """
+        result = BatchResult()
+        self.__queue.append(('call', (method, url, parse, result)))
+        return result
+
+    def add_row(self, type, id):
+        """
+        Queue a lookup of a whole table row.
+
+        :param type: Table type: 'node', 'edge' or 'network'.
+        :param id: SUID of the row.
+        :return: BatchResult for the call, holding the row as Series.
+        """
+        result = BatchResult()
+        self.__queue.append(('row', (type, id, result)))
+        return result
+
+    def add_delete(self, type, id):
+        """
+        Queue the deletion of a node or edge.
+
+        :param type: 'node' or 'edge'.
+        :param id: SUID of the node or edge.
+        :return: BatchResult for the call, holding None.
+        """
+        result = BatchResult()
+        self.__queue.append(('delete', (type, id, result)))
+        return result
+
+    def send(self):
+        """ Send all queued calls and fill in their results. """
+        queue = self.__queue
+        self.__queue = []
+        for is_delete, entries in groupby(queue, self.__is_delete):
+            if is_delete:
+                self.__send_deletes(list(entries))
+            else:
+                self.__send_reads(list(entries))
+
+    @staticmethod
+    def __is_delete(entry):
+        kind, call = entry
+        return kind == 'delete' or (kind == 'call' and call[0] == 'delete')
+
+    def __send_deletes(self, entries):
+        calls = [call for kind, call in entries if kind == 'call']
+        deletes = OrderedDict()
+        for kind, call in entries:
+            if kind == 'delete':
+                deletes.setdefault(call[0], []).append(call[1:])
+        # Edges go first, deleting a node also deletes its edges
+        for type in sorted(deletes):
+            if self.__delete is None or \
+                    len(deletes[type]) < self.bulk_threshold:
+                calls += [('delete', self.__url + type + 's/' + str(id),
+                           lambda res: None, result)
+                          for id, result in deletes[type]]
+                continue
+            try:
+                self.__delete(type, [id for id, _ in deletes[type]])
+                error = None
+            except Exception as exc:
+                error = exc
+            for _, result in deletes[type]:
+                if error is None:
+                    result.set_result(None)
+                else:
+                    result.set_error(error)
+        run_concurrently(self.__send_call, calls, self.max_workers)
+
+    def __send_reads(self, entries):
+        calls = [call for kind, call in entries if kind == 'call']
+        rows = OrderedDict()
+        for kind, call in entries:
+            if kind == 'row':
+                rows.setdefault(call[0], []).append(call[1:])
+        for type, type_rows in rows.items():
+            if len(type_rows) < self.bulk_threshold:
+                calls += [self.__row_call(type, id, result)
+                          for id, result in type_rows]
+                continue
+            url = self.__url + 'tables/default' + type + '/rows'
+            table = {row['SUID']: row for row in
+                     self.__session.get(url).json()}
+            for id, result in type_rows:
+                if id in table:
+                    result.set_result(pd.Series(table[id]))
+                else:
+                    calls.append(self.__row_call(type, id, result))
+        run_concurrently(self.__send_call, calls, self.max_workers)
+
+    def __row_call(self, type, id, result):
+        url = self.__url + 'tables/default' + type + '/rows/' + str(id)
+        return 'get', url, lambda res: pd.Series(res.json()), result
+
+    def __send_call(self, call):
+        method, url, parse, result = call
+        try:
+            res = getattr(self.__session, method)(url)
+            result.set_result(parse(res))
+        except Exception as exc:
+            result.set_error(exc)
@@ -1,7 +1,6 @@
 # -*- coding: utf-8 -*-
 import os
-import requests
-import json
+import time
 import pandas as pd
 
 from . import HEADERS, SUID_LIST
@@ -11,18 +10,34 @@ from ..util import util_networkx as nx_util
 from ..util import util_igraph as ig_util
 from ..util import util_dataframe as df_util
 from ..util import util_numpy as np_util
+from .. import codec
+from .. import tracing
+from ..transport import default_transport
 
 JSON = 'json'
 
-from .cynetwork import CyNetwork, check_response
+# Export formats and the resource of a network serving them
+EXPORT_FORMATS = {
+    'png': 'views/first.png',
+    'svg': 'views/first.svg',
+    'pdf': 'views/first.pdf',
+    'cyjs': ''
+}
+# Formats taking the image height as parameter
+BITMAP_FORMATS = ('png',)
+EXPORT_WORKERS = 4
+
+from .cynetwork import CyNetwork, check_response, CHUNK_SIZE
+from ..util.util_concurrent import run_concurrently
 
 
 class NetworkClient(object):
     def __init__(self, url, session=None):
         self.__url = url + 'networks'
-        # Using a persistent session object, so we don't have to create one
+        # Using a persistent, pooled transport, so we don't have to connect
         # for every request.
-        self.session = session if session is not None else requests.Session()
+        self.session = tracing.trace_session(
+            session if session is not None else default_transport())
 
     def create_from(self, locations=None, collection=None):
         if locations is None:
@@ -52,7 +67,7 @@ class NetworkClient(object):
             'source': 'url'
         }
 
-        res = self.session.post(self.__url, data=json.dumps(location_list),
+        res = self.session.post(self.__url, data=codec.dumps(location_list),
                                 params=parameters, headers=HEADERS)
         check_response(res)
         res = res.json()
@@ -78,7 +93,19 @@ class NetworkClient(object):
         return 'file:///' + local_file
 
     def create(self, suid=None, name=None, collection=None,
-               data=None):
+               data=None, stream=False):
+        """
+        Create a new network from Cytoscape.js JSON, or get an existing one.
+
+        :param suid: SUID of an existing network to return.
+        :param name: Name of the new network.
+        :param collection: Name of the collection to add the network to.
+        :param data: Network as Cytoscape.js dictionary. Nodes and edges may
+            be generators if stream is True.
+        :param stream: If True, the network is encoded while it is sent, with
+            chunked transfer encoding, instead of as one JSON string.
+        :return: CyNetwork object.
+        """
         if suid is not None:
             # fetch existing network
             res = self.session.get(self.__url)
@@ -101,9 +128,15 @@ class NetworkClient(object):
             else:
                 network_collection = collection
 
+            if stream:
+                body = util.iterencode(network_data)
+            else:
+                with tracing.timed('serialize'):
+                    body = codec.dumps(network_data)
+
             res = self.session.post(
                 self.__url + '?collection=' + network_collection,
-                data=json.dumps(network_data),
+                data=body,
                 headers=HEADERS
             )
             check_response(res)
@@ -112,27 +145,37 @@ class NetworkClient(object):
 
         return CyNetwork(network_id, session=self.session, url=self.__url)
 
-    def create_from_networkx(self, network, name=None, collection=None):
+    def create_from_networkx(self, network, name=None, collection=None,
+                             stream=False):
         if network is None:
             raise ValueError('NetworkX graph object is required.')
 
-        cyjs = nx_util.from_networkx(network)
-        return self.create(name=name, collection=collection, data=cyjs)
+        cyjs = nx_util.from_networkx(network, lazy=stream)
+        return self.create(name=name, collection=collection, data=cyjs,
+                           stream=stream)
 
-    def create_from_igraph(self, network, name=None, collection=None):
+    def create_from_igraph(self, network, name=None, collection=None,
+                           stream=False):
         if network is None:
             raise ValueError('igraph object is required.')
 
-        cyjs = ig_util.from_igraph(network)
-        return self.create(name=name, collection=collection, data=cyjs)
+        cyjs = ig_util.from_igraph(network, lazy=stream)
+        return self.create(name=name, collection=collection, data=cyjs,
+                           stream=stream)
 
     def create_from_ndarray(self, matrix, name=None, labels=None,
-                            collection=None, weighted=False):
+                            collection=None, weighted=False, stream=False):
         if matrix is None:
             raise ValueError('2D ndarray object is required.')
 
-        cyjs = np_util.from_ndarray(matrix, name, labels, weighted=weighted)
-        return self.create(name=name, collection=collection, data=cyjs)
+        if np_util.sparse is not None and np_util.sparse.issparse(matrix):
+            cyjs = np_util.from_sparse(matrix, name, labels,
+                                       weighted=weighted, lazy=stream)
+        else:
+            cyjs = np_util.from_ndarray(matrix, name, labels,
+                                        weighted=weighted, lazy=stream)
+        return self.create(name=name, collection=collection, data=cyjs,
+                           stream=stream)
 
     def create_from_dataframe(self, dataframe,
                               source_col='source',
@@ -140,7 +183,8 @@ class NetworkClient(object):
                               interaction_col='interaction',
                               name='Created from DataFrame',
                               collection=None,
-                              extra_columns=[]):
+                              extra_columns=[],
+                              stream=False):
         if dataframe is None:
             raise ValueError('DataFrame object is required.')
 
@@ -151,8 +195,9 @@ class NetworkClient(object):
             target_col=target_col,
             interaction_col=interaction_col,
             name=name,
-            edge_attr_cols=extra_columns)
-        return self.create(collection=collection, data=cyjs)
+            edge_attr_cols=extra_columns,
+            lazy=stream)
+        return self.create(collection=collection, data=cyjs, stream=stream)
 
     def get_all(self, format=SUID_LIST):
         if format is SUID_LIST:
@@ -170,6 +215,72 @@ class NetworkClient(object):
     def delete_all(self):
         self.session.delete(self.__url)
 
+    def export(self, suids, formats=('png',), directory='.',
+               max_workers=EXPORT_WORKERS, height=None):
+        """
+        Export many networks to files, several at a time.
+
+        Files are named <SUID>.<format> and written piece by piece while
+        they are downloaded. A failed export does not stop the others, its
+        error is reported in the result instead. SUIDs and formats given
+        more than once are exported once.
+
+        :param suids: SUIDs of the networks to export.
+        :param formats: Any of 'png', 'svg', 'pdf' (first view of the
+            network) and 'cyjs' (network as Cytoscape.js JSON).
+        :param directory: Directory to write the files to.
+        :param max_workers: Maximum number of exports running at once.
+        :param height: Height of png images in pixels, default set by
+            Cytoscape.
+        :return: DataFrame with one row per export and the columns suid,
+            format, path, bytes, seconds and error.
+        """
+        for format in formats:
+            if format not in EXPORT_FORMATS:
+                raise ValueError('Unsupported export format: ' + format)
+        # Two downloads of the same file would write to the same path
+        items = list(dict.fromkeys(
+            (suid, format) for suid in suids for format in formats))
+
+        def export_item(item):
+            suid, format = item
+            url = self.__url + '/' + str(suid)
+            if EXPORT_FORMATS[format]:
+                url += '/' + EXPORT_FORMATS[format]
+            params = {'h': height} if height is not None and format in BITMAP_FORMATS else None
+            path = os.path.join(directory, str(suid) + '.' + format)
+            size = 0
+            error = None
+            start = time.time()
+            try:
+                res = self.session.get(url, params=params, stream=True)
+                try:
+                    check_response(res)
+                    # Complete files only ever appear under their own name
+                    with open(path + '.part', 'wb') as f:
+                        for chunk in res.iter_content(chunk_size=CHUNK_SIZE):
+                            f.write(chunk)
+                            size += len(chunk)
+                    os.replace(path + '.part', path)
+                finally:
+                    res.close()
+            except Exception as exc:
+                error = repr(exc)
+                if os.path.exists(path + '.part'):
+                    os.remove(path + '.part')
+            return {
+                'suid': suid,
+                'format': format,
+                'path': path if error is None else None,
+                'bytes': size,
+                'seconds': time.time() - start,
+                'error': error
+            }
+
+        results = run_concurrently(export_item, items, max_workers)
+        return pd.DataFrame(results, columns=['suid', 'format', 'path',
+                                              'bytes', 'seconds', 'error'])
+
     def delete(self, cynetwork):
         id = cynetwork.get_id()
         self.session.delete(self.__url + '/' + str(id))
@@ -1,18 +1,20 @@
 # -*- coding: utf-8 -*-
-import json
 
 import pandas as pd
-import numpy as np
-import requests
 from py2cytoscape.data.edge_view import EdgeView
 from py2cytoscape.data.node_view import NodeView
 
 from . import BASE_URL, HEADERS
-from py2cytoscape.data.util_network import NetworkUtil
 from py2cytoscape.data.util_http import check_response
+from ..util.util_concurrent import run_concurrently
+from .. import codec
+from .. import tracing
 
 BASE_URL_NETWORK = BASE_URL + 'networks'
 
+# Default number of node or edge views sent in one batch update request
+ROWS_PER_REQUEST = 10000
+
 
 class CyNetworkView(object):
 
@@ -27,6 +29,9 @@ class CyNetworkView(object):
             self.__network = network
             self.__id = suid
 
+        # All calls go through the pooled session of the network
+        self.session = network.session
+
         self.__url = BASE_URL_NETWORK + '/' \
                      + str(self.__network.get_id()) + '/views/' + str(self.__id)
 
@@ -69,7 +74,7 @@ class CyNetworkView(object):
 
     def __get_views(self, obj_type=None, format='view'):
         url = self.__url + '/' + obj_type
-        views = requests.get(url).json()
+        views = self.session.get(url).json()
         if format is 'dict':
             if obj_type is 'network':
                 return self.__get_network_view_dict(views)
@@ -141,11 +146,17 @@ class CyNetworkView(object):
     def update_node_views(self, visual_property=None, values=None, key_type='suid'):
         self.__update_views(visual_property, values, 'nodes', key_type)
 
-    def batch_update_node_views(self, value_dataframe=None):
-        self.__batch_update(value_dataframe, 'nodes')
+    def batch_update_node_views(self, value_dataframe=None,
+                                rows_per_request=ROWS_PER_REQUEST,
+                                max_workers=1):
+        self.__batch_update(value_dataframe, 'nodes',
+                            rows_per_request, max_workers)
 
-    def batch_update_edge_views(self, value_dataframe=None):
-        self.__batch_update(value_dataframe, 'edges')
+    def batch_update_edge_views(self, value_dataframe=None,
+                                rows_per_request=ROWS_PER_REQUEST,
+                                max_workers=1):
+        self.__batch_update(value_dataframe, 'edges',
+                            rows_per_request, max_workers)
 
     def update_edge_views(self, visual_property=None, values=None, key_type='suid'):
         self.__update_views(visual_property, values, 'edges', key_type)
@@ -165,21 +176,21 @@ class CyNetworkView(object):
                 "value": value
             }
         ]
-        res = requests.put(self.__url + '/network',
-                           data=json.dumps(new_value),
-                           headers=HEADERS)
+        res = self.session.put(self.__url + '/network',
+                               data=codec.dumps(new_value),
+                               headers=HEADERS)
         check_response(res)
         
 
     def __update_views(self, visual_property, values,
                        object_type=None, key_type='suid'):
         if key_type is 'name':
-            name2suid = NetworkUtil.name2suid(self.__network)
+            name2suid = self.__network.get_name_index(object_type[:-1]).name2suid
 
         body = []
         for key in values.keys():
             if key_type is 'name':
-                suid = name2suid[key]
+                suid = name2suid.get(key)
                 if suid is None:
                     continue
             else:
@@ -191,18 +202,15 @@ class CyNetworkView(object):
             body.append(new_value)
 
 
-        res = requests.put(self.__url + '/' + object_type,
-                           json=body,
-                           headers=HEADERS)
+        res = self.session.put(self.__url + '/' + object_type,
+                               data=codec.dumps(body),
+                               headers=HEADERS)
         check_response(res)
 
     def __create_new_value(self, suid, visual_property, value):
-        if(isinstance( suid, np.int64 )):
-            int_id = np.asscalar(suid)
-        else:
-            int_id = suid
+        # NumPy SUIDs and values are encoded by the codec
         return {
-            "SUID": int_id,
+            "SUID": suid,
             "view": [
                 {
                     "visualProperty": visual_property,
@@ -211,32 +219,42 @@ class CyNetworkView(object):
             ]
         }
 
-    def __batch_update(self, df, object_type=None):
-        body = []
+    def __batch_update(self, df, object_type=None,
+                       rows_per_request=ROWS_PER_REQUEST, max_workers=1):
+        """
+        Set the visual properties in the columns of df for the views of the
+        nodes or edges whose SUIDs are in the index.
+
+        :param df: DataFrame with one column per visual property.
+        :param object_type: 'nodes' or 'edges'.
+        :param rows_per_request: Maximum number of views sent in one request.
+            All views are sent at once if None.
+        :param max_workers: Maximum number of concurrent requests.
+        """
+        suids = [int(suid) for suid in df.index.tolist()]
+        columns = [str(column) for column in df.columns]
+        # NumPy scalars left in object columns are encoded by the codec
+        values = [df[column].tolist() for column in df.columns]
 
-        columns = df.columns
-        for index, row in df.iterrows():
-            entry = {
-                'SUID': int(index),
-                'view': self.__create_new_values_from_row(columns, row)
+        body = [
+            {
+                'SUID': suid,
+                'view': [{'visualProperty': column, 'value': value}
+                         for column, value in zip(columns, row)]
             }
-            body.append(entry)
-
-        res = requests.put(self.__url + '/' + object_type,
-                           data=json.dumps(body),
-                           headers=HEADERS)
+            for suid, row in zip(suids, zip(*values))
+        ]
 
-        check_response(res)
-        
-        
+        url = self.__url + '/' + object_type
 
-    def __create_new_values_from_row(self, columns, row):
-        views = []
-        for column in columns:
-            view = {
-                "visualProperty": column,
-                "value": row[column]
-            }
-            views.append(view)
-        return views
+        def put_views(views):
+            with tracing.timed('serialize'):
+                body = codec.dumps(views)
+            res = self.session.put(url, data=body, headers=HEADERS)
+            check_response(res)
 
+        if rows_per_request is None:
+            rows_per_request = max(len(body), 1)
+        chunks = [body[i:i + rows_per_request]
+                  for i in range(0, len(body), rows_per_request)]
+        run_concurrently(put_views, chunks, max_workers)
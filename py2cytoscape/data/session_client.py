@@ -1,13 +1,14 @@
-import requests
+from ..transport import default_transport
 
 
 class SessionClient(object):
 
-    def __init__(self, url):
+    def __init__(self, url, session=None):
         self.__url = url + 'session'
+        self.session = session if session is not None else default_transport()
 
     def delete(self):
-        requests.delete(self.__url)
+        self.session.delete(self.__url)
 
     def save(self, file_name=None):
         if file_name is None:
@@ -15,7 +16,7 @@ class SessionClient(object):
 
         post_url = self.__url
         params = {'file': file_name}
-        res = requests.post(post_url, params=params)
+        res = self.session.post(post_url, params=params)
         return res
 
     def open(self, file_name=None):
@@ -24,5 +25,5 @@ class SessionClient(object):
 
         get_url = self.__url
         params = {'file': file_name}
-        res = requests.get(get_url, params=params)
+        res = self.session.get(get_url, params=params)
         return res
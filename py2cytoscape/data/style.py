@@ -1,11 +1,11 @@
 from . import BASE_URL, HEADERS
-import requests
-import json
+from .. import codec
+from ..transport import default_transport
 import pandas as pd
 
 
 class Style(object):
-    def __init__(self, name):
+    def __init__(self, name, session=None):
         # Validate required argument
         if name is None:
             raise ValueError("Style name is required.")
@@ -13,6 +13,7 @@ class Style(object):
             self.__name = name
 
         self.__url = BASE_URL + 'styles/' + str(name) + '/'
+        self.session = session if session is not None else default_transport()
 
     def get_name(self):
         """
@@ -55,7 +56,7 @@ class Style(object):
 
     def __call_create_mapping(self, mapping):
         url = self.__url + 'mappings'
-        requests.post(url, data=json.dumps([mapping]), headers=HEADERS)
+        self.session.post(url, data=codec.dumps([mapping]), headers=HEADERS)
 
     def __get_passthrough(self, column=None, col_type='String', vp=None):
         return self.__get_new_mapping('passthrough', column=column,
@@ -85,27 +86,27 @@ class Style(object):
             raise ValueError('Visual Property ID is required.')
 
         url = self.__url + 'mappings/' + vp
-        return requests.get(url).json()
+        return self.session.get(url).json()
 
     def get_mappings(self):
         url = self.__url + 'mappings'
-        return requests.get(url).json()
+        return self.session.get(url).json()
 
     def get_default(self, vp=None):
         if vp is None:
             raise ValueError('Visual Property ID is required.')
 
         url = self.__url + 'defaults/' + vp
-        key_value_pair = requests.get(url).content
+        key_value_pair = self.session.get(url).content
         print(key_value_pair)
-        key2 = requests.get(url).json()
+        key2 = self.session.get(url).json()
         key_value_pair = key2
         return pd.Series({key_value_pair['visualProperty']: key_value_pair[
             'value']})
 
     def get_defaults(self):
         url = self.__url + 'defaults'
-        result = requests.get(url).json()['defaults']
+        result = self.session.get(url).json()['defaults']
         vals = {entry['visualProperty']: entry['value'] for entry in result}
         return pd.Series(vals)
 
@@ -126,7 +127,7 @@ class Style(object):
             body.append(entry)
 
         url = self.__url + 'defaults'
-        requests.put(url, data=json.dumps(body), headers=HEADERS)
+        self.session.put(url, data=codec.dumps(body), headers=HEADERS)
 
     # Delete Methods
 
@@ -135,11 +136,11 @@ class Style(object):
             return
 
         url = self.__url + 'mappings/' + vp
-        requests.delete(url)
+        self.session.delete(url)
 
     def delete_mappings(self):
         url = self.__url + 'mappings'
-        requests.delete(url)
+        self.session.delete(url)
 
 
 class StyleUtil(object):
@@ -1,28 +1,28 @@
 # -*- coding: utf-8 -*-
 
-import requests
-import json
-
 from . import HEADERS, SUID_LIST
 from .style import Style
+from .. import codec
+from ..transport import default_transport
 
 
 class StyleClient(object):
 
-    def __init__(self, url):
+    def __init__(self, url, session=None):
         self.__url = url + 'styles'
         self.__url_apply = url + 'apply/styles/'
+        self.session = session if session is not None else default_transport()
 
-        self.vps = VisualProperties(url)
+        self.vps = VisualProperties(url, session=self.session)
 
     def create(self, name=None, original_style=None):
         if name is None:
             raise ValueError('Name is required.')
 
-        existing_styles = requests.get(self.__url).json()
+        existing_styles = self.session.get(self.__url).json()
 
         if name in existing_styles:
-            return Style(name)
+            return Style(name, session=self.session)
             
         if original_style is None:
             style = {
@@ -34,8 +34,8 @@ class StyleClient(object):
             style = original_style
             style['title'] = name
             
-        new_style_name = requests.post(self.__url, data=json.dumps(style), headers=HEADERS).json()['title']
-        return Style(name=new_style_name)
+        new_style_name = self.session.post(self.__url, data=codec.dumps(style), headers=HEADERS).json()['title']
+        return Style(name=new_style_name, session=self.session)
 
     def get_all(self):
         """
@@ -43,7 +43,7 @@ class StyleClient(object):
 
         :return: List of style names
         """
-        return requests.get(self.__url).json()
+        return self.session.get(self.__url).json()
 
     def get(self, name, data_format='cy3'):
         if name is None:
@@ -52,32 +52,33 @@ class StyleClient(object):
         url = self.__url + '/' + name
         if data_format == 'cytoscapejs':
             url = url + '.json'
-            return requests.get(url).json()[0]
+            return self.session.get(url).json()[0]
         else:
-            return requests.get(url).json()
+            return self.session.get(url).json()
 
     def apply(self, style, network=None):
         if network is None:
             raise ValueError('Target network is required')
 
         url = self.__url_apply + style.get_name() + '/' + str(network.get_id())
-        requests.get(url)
+        self.session.get(url)
 
     def delete(self, style):
-        requests.delete(self.__url + '/' + style.get_name())
+        self.session.delete(self.__url + '/' + style.get_name())
 
     def delete_all(self):
-        requests.delete(self.__url)
+        self.session.delete(self.__url)
 
 
 class VisualProperties(object):
 
-    def __init__(self, url):
+    def __init__(self, url, session=None):
         self.__url = url + 'styles/visualproperties'
+        self.session = session if session is not None else default_transport()
         self.__convert_to_dict()
 
     def __convert_to_dict(self):
-        vps = requests.get(self.__url).json()
+        vps = self.session.get(self.__url).json()
         vp_dict = {}
         node_vps = []
         edge_vps = []
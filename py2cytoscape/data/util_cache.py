@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+import threading
+from collections import OrderedDict
+
+CACHE_SIZE = 32
+# Seconds a validated cache is trusted before the version is checked again
+CHECK_INTERVAL = 1.0
+
+
+class ResponseCache(object):
+    """
+    Size-bounded cache of parsed responses. When full, the least recently
+    used entry is evicted.
+
+    Entries are tagged with a version, e.g. the node and edge counts of a
+    network. Calling validate with a different version empties the cache.
+    """
+
+    def __init__(self, max_size=CACHE_SIZE):
+        if max_size < 1:
+            raise ValueError('Cache size must be at least 1.')
+        self.max_size = max_size
+        self.__entries = OrderedDict()
+        self.__version = None
+        self.__lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.__entries)
+
+    def __contains__(self, key):
+        return key in self.__entries
+
+    def get(self, key, load):
+        """
+        Get the value stored for key, calling load to create it if missing.
+
+        :param key: Hashable key of the entry.
+        :param load: Function without arguments returning the value.
+        :return: Cached or newly loaded value.
+        """
+        with self.__lock:
+            if key in self.__entries:
+                self.__entries.move_to_end(key)
+                return self.__entries[key]
+
+        value = load()
+        with self.__lock:
+            self.__entries[key] = value
+            if len(self.__entries) > self.max_size:
+                self.__entries.popitem(last=False)
+        return value
+
+    def validate(self, version):
+        """
+        Empty the cache if version differs from the one of the entries.
+
+        :param version: Current version of the cached data.
+        """
+        with self.__lock:
+            if version != self.__version:
+                self.__entries.clear()
+                self.__version = version
+
+    def clear(self):
+        with self.__lock:
+            self.__entries.clear()
+            self.__version = None
@@ -5,17 +5,41 @@ class NetworkUtil(object):
 
     @staticmethod
     def name2suid(network, obj_type='node'):
-        if obj_type is 'node':
-            table = network.get_node_table()
-        elif obj_type is 'edge':
-            table = network.get_edge_table()
-        else:
+        if obj_type not in ('node', 'edge'):
             raise ValueError('No such object type: ' + obj_type)
+        return dict(network.get_name_index(obj_type).name2suid)
 
-        subset= table['name']
-        name2suid = {}
-        for suid in subset.index:
-            name2suid[subset[suid]] = suid
-            table.set_index(["SUID"],inplace=True)
-        return name2suid
 
+class NameIndex(object):
+    """
+    Bidirectional mapping between the names and SUIDs of the nodes or edges
+    of a network. If several objects share a name, name2suid holds the last
+    one.
+    """
+
+    def __init__(self, names, suids):
+        self.name2suid = dict(zip(names, suids))
+        self.suid2name = dict(zip(suids, names))
+
+    def __len__(self):
+        return len(self.suid2name)
+
+    def add(self, names, suids):
+        """
+        Add new objects to the index.
+
+        :param names: Names of the new objects.
+        :param suids: SUIDs of the new objects, in the same order.
+        """
+        self.name2suid.update(zip(names, suids))
+        self.suid2name.update(zip(suids, names))
+
+    def remove(self, suid):
+        """
+        Remove a deleted object from the index.
+
+        :param suid: SUID of the object.
+        """
+        name = self.suid2name.pop(suid, None)
+        if self.name2suid.get(name) == suid:
+            del self.name2suid[name]
@@ -0,0 +1,304 @@
+# -*- coding: utf-8 -*-
+"""
+Timing of the HTTP requests sent to CyREST.
+
+Sessions passed through trace_session report every request to the
+registered listeners, as a RequestEvent with the method, the endpoint and
+the time spent serializing, transferring and parsing. Nothing is measured
+while no listener is registered.
+
+    with tracing.recording():
+        run_pipeline()
+
+prints the number of requests and a latency histogram per endpoint at the
+end of the block.
+"""
+import re
+import sys
+import threading
+import time
+from contextlib import contextmanager
+
+import pandas as pd
+import requests
+
+try:
+    from urllib.parse import unquote
+except ImportError:
+    from urllib import unquote
+
+# Upper bounds, in seconds, of the latency histogram buckets
+BUCKETS = (0.001, 0.002, 0.005, 0.01, 0.02, 0.05, 0.1, 0.2, 0.5, 1, 2, 5)
+
+LISTENERS = []
+
+_local = threading.local()
+
+
+class RequestEvent(object):
+    """
+    Timing of a single request.
+
+    request_bytes and response_bytes are the sizes of the bodies as sent,
+    i.e. compressed if they were. serialize is the time spent encoding,
+    compressing and preparing the request before it was sent and transfer
+    the time from sending it until the response was read. parse is added
+    when the response is decoded, so it is still 0 when the listeners are
+    called, unless they look at the event later.
+    """
+
+    def __init__(self, method, url, status=None, request_bytes=None,
+                 response_bytes=None, serialize=0.0, transfer=0.0):
+        self.method = method
+        self.url = url
+        self.endpoint = endpoint_template(url)
+        self.status = status
+        self.request_bytes = request_bytes
+        self.response_bytes = response_bytes
+        self.serialize = serialize
+        self.transfer = transfer
+        self.parse = 0.0
+
+    @property
+    def total(self):
+        return self.serialize + self.transfer + self.parse
+
+    def __repr__(self):
+        return '<RequestEvent %s %s [%s] %.4fs>' % (
+            self.method, self.endpoint, self.status, self.total)
+
+
+def endpoint_template(url):
+    """
+    Get the endpoint of a URL, with SUIDs replaced by {suid}.
+
+    :param url: Request URL, e.g.
+        http://localhost:1234/v1/networks/52/tables/defaultnode?x=1
+    :return: Path of the URL, e.g. /v1/networks/{suid}/tables/defaultnode
+    """
+    path = unquote(re.sub(r'^\w+://[^/]*', '', url).split('?')[0])
+    return re.sub(r'/\d+(?=/|\.|$)', '/{suid}', path)
+
+
+def add_listener(listener):
+    """
+    Call listener with a RequestEvent after every traced request.
+
+    Listeners are called from the thread sending the request and must be
+    thread safe.
+    """
+    LISTENERS.append(listener)
+
+
+def remove_listener(listener):
+    if listener in LISTENERS:
+        LISTENERS.remove(listener)
+
+
+@contextmanager
+def timed(phase):
+    """
+    Add the time spent in the block to a request of the current thread.
+
+    :param phase: 'serialize' to count it for the next request, e.g.
+        around encoding its body, or 'parse' to count it for the last one,
+        e.g. around decoding its response.
+    """
+    if not LISTENERS:
+        yield
+        return
+    start = time.time()
+    try:
+        yield
+    finally:
+        duration = time.time() - start
+        if phase == 'serialize':
+            _local.serialize = getattr(_local, 'serialize', 0.0) + duration
+        elif getattr(_local, 'event', None) is not None:
+            _local.event.parse += duration
+
+
+def trace_session(session):
+    """
+    Report the requests sent through a requests.Session to the listeners.
+
+    :param session: requests.Session, traced in place. Other objects are
+        returned unchanged.
+    :return: session
+    """
+    if not isinstance(session, requests.Session) or \
+            getattr(session, 'traced', False):
+        return session
+    request = session.request
+    send = session.send
+
+    def traced_request(*args, **kwargs):
+        # Preparing the request includes encoding json= bodies
+        _local.prepare = time.time() if LISTENERS else None
+        try:
+            return request(*args, **kwargs)
+        finally:
+            # Also if preparing the request failed before it was sent
+            __reset()
+
+    def traced_send(request, **kwargs):
+        start = time.time()
+        serialize = getattr(_local, 'serialize', 0.0)
+        if getattr(_local, 'prepare', None) is not None:
+            serialize += start - _local.prepare
+        try:
+            response = send(request, **kwargs)
+        finally:
+            # The timing belongs to this request, even if it failed
+            __reset()
+        if not LISTENERS:
+            return response
+        event = RequestEvent(
+            request.method, request.url, response.status_code,
+            __size(request.body),
+            None if kwargs.get('stream') else __response_size(response),
+            serialize, time.time() - start)
+        _local.event = event
+
+        parse = response.json
+
+        def json(**kw):
+            start = time.time()
+            try:
+                return parse(**kw)
+            finally:
+                event.parse += time.time() - start
+        response.json = json
+
+        for listener in list(LISTENERS):
+            listener(event)
+        return response
+
+    session.request = traced_request
+    session.send = traced_send
+    session.traced = True
+    return session
+
+
+def __reset():
+    # Forget the timing collected for the request of the current thread
+    _local.serialize = 0.0
+    _local.prepare = None
+
+
+def __size(body):
+    if body is None:
+        return 0
+    if isinstance(body, (bytes, str)):
+        return len(body)
+    # Streamed body
+    return None
+
+
+def __response_size(response):
+    # Bytes on the wire, before compressed responses are decoded
+    length = response.headers.get('Content-Length', '')
+    if length.isdigit():
+        return int(length)
+    return len(response.content)
+
+
+class EndpointStats(object):
+    """
+    Listener collecting the events of all requests, grouped by endpoint.
+    """
+
+    def __init__(self):
+        self.__lock = threading.Lock()
+        self.events = []
+
+    def __call__(self, event):
+        with self.__lock:
+            self.events.append(event)
+
+    def __frame(self):
+        with self.__lock:
+            events = list(self.events)
+        return pd.DataFrame({
+            'endpoint': [e.method + ' ' + e.endpoint for e in events],
+            'request_bytes': [e.request_bytes for e in events],
+            'response_bytes': [e.response_bytes for e in events],
+            'serialize': [e.serialize for e in events],
+            'transfer': [e.transfer for e in events],
+            'parse': [e.parse for e in events],
+            'total': [e.total for e in events]
+        })
+
+    def summary(self):
+        """
+        Get count, bytes and times per endpoint, slowest total first.
+
+        :return: DataFrame indexed by endpoint, e.g.
+            'GET /v1/networks/{suid}'.
+        """
+        frame = self.__frame()
+        grouped = frame.groupby('endpoint')
+        summary = pd.DataFrame({
+            'count': grouped.size(),
+            'request_bytes': grouped['request_bytes'].sum(),
+            'response_bytes': grouped['response_bytes'].sum(),
+            'serialize': grouped['serialize'].sum(),
+            'transfer': grouped['transfer'].sum(),
+            'parse': grouped['parse'].sum(),
+            'total': grouped['total'].sum(),
+            'p50': grouped['total'].median(),
+            'p95': grouped['total'].quantile(0.95),
+            'max': grouped['total'].max()
+        })
+        return summary.sort_values('total', ascending=False)
+
+    def histogram(self):
+        """
+        Get the number of requests per endpoint and latency bucket.
+
+        :return: DataFrame with one row per endpoint and one column per
+            bucket, e.g. '<5ms'.
+        """
+        frame = self.__frame()
+        bounds = (0,) + BUCKETS + (float('inf'),)
+        labels = ['<' + self.__duration(b) for b in BUCKETS] + \
+            ['>=' + self.__duration(BUCKETS[-1])]
+        buckets = pd.cut(frame['total'], bounds, labels=labels,
+                         right=False).rename('latency')
+        histogram = pd.crosstab(frame['endpoint'], buckets)
+        return histogram.reindex(columns=labels, fill_value=0)
+
+    @staticmethod
+    def __duration(seconds):
+        if seconds < 1:
+            return '%dms' % round(seconds * 1000)
+        return '%gs' % seconds
+
+    def report(self, file=None):
+        """ Print the summary and the histogram. """
+        file = sys.stdout if file is None else file
+        if not self.events:
+            file.write('No requests traced.\n')
+            return
+        file.write(self.summary().to_string(
+            float_format=lambda x: '%.4f' % x) + '\n\n')
+        file.write(self.histogram().to_string() + '\n')
+
+
+@contextmanager
+def recording(report=True, file=None):
+    """
+    Collect the requests sent in the block.
+
+    :param report: If True, print the summary and histogram at the end.
+    :param file: File to print to, default sys.stdout.
+    :return: EndpointStats with the events.
+    """
+    stats = EndpointStats()
+    add_listener(stats)
+    try:
+        yield stats
+    finally:
+        remove_listener(stats)
+        if report:
+            stats.report(file)
@@ -0,0 +1,169 @@
+# -*- coding: utf-8 -*-
+"""
+HTTP transport shared by the cyrest and data APIs.
+
+A Transport holds one pool of keep-alive connections to CyREST together
+with the retry, timeout and compression policy. cyclient and CyRestClient
+create one and pass it to all of their sub-clients, which call it like a
+requests.Session.
+"""
+import functools
+import threading
+import zlib
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from . import codec
+from . import tracing
+
+POOL_SIZE = 10
+MAX_RETRIES = 3
+BACKOFF_FACTOR = 0.1
+
+# Seconds to wait for a connection to Cytoscape. Reads wait as long as
+# Cytoscape needs, creating or laying out big networks can take minutes.
+CONNECT_TIMEOUT = 10
+READ_TIMEOUT = None
+
+# Response encodings asked for. Responses are decoded transparently.
+ACCEPT_ENCODING = 'gzip, deflate'
+
+# Request bodies smaller than this many bytes are sent uncompressed, the
+# time spent compressing them is more than what the smaller body saves.
+COMPRESS_THRESHOLD = 64 * 1024
+# zlib level, 1 is several times faster than the default 6 and compresses
+# the JSON of networks and tables only a few percent less.
+COMPRESS_LEVEL = 1
+
+# zlib window bits of each Content-Encoding
+_WBITS = {'gzip': 16 + zlib.MAX_WBITS, 'deflate': zlib.MAX_WBITS}
+
+
+class Transport(object):
+    """
+    Pooled HTTP connections to CyREST.
+
+    Has the request, get, post, put and delete methods of requests.Session
+    and can be passed wherever a session is accepted. json= bodies and
+    Response.json() go through py2cytoscape.codec.
+
+    :param pool_size: Maximum number of connections kept open.
+    :param max_retries: Number of times a failed connection is retried.
+        Requests that reached Cytoscape are never sent twice, as commands
+        are not idempotent.
+    :param backoff_factor: Seconds to sleep between retries, doubled at
+        every retry.
+    :param connect_timeout: Seconds to wait for a connection.
+    :param read_timeout: Seconds to wait for a response, None waits forever.
+    :param compress: 'gzip' or 'deflate' to compress request bodies of at
+        least compress_threshold bytes, None to send them as they are.
+        Only use it with a server that decodes compressed requests, e.g.
+        Cytoscape behind a proxy on a remote host.
+    :param compress_threshold: Smallest body in bytes that is compressed.
+    :param compress_level: zlib compression level, 1 (fastest) to 9.
+    :param accept_encoding: Value of the Accept-Encoding header, None to ask
+        for uncompressed responses.
+    """
+
+    def __init__(self, pool_size=POOL_SIZE, max_retries=MAX_RETRIES,
+                 backoff_factor=BACKOFF_FACTOR,
+                 connect_timeout=CONNECT_TIMEOUT, read_timeout=READ_TIMEOUT,
+                 compress=None, compress_threshold=COMPRESS_THRESHOLD,
+                 compress_level=COMPRESS_LEVEL,
+                 accept_encoding=ACCEPT_ENCODING):
+        if compress is not None and compress not in _WBITS:
+            raise ValueError('Unsupported compression: ' + str(compress))
+        # read=False raises read errors as they are, e.g. ReadTimeout
+        retries = Retry(total=max_retries, connect=max_retries, read=False,
+                        backoff_factor=backoff_factor)
+        adapter = HTTPAdapter(pool_connections=pool_size,
+                              pool_maxsize=pool_size, max_retries=retries)
+        self.session = requests.Session()
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self.session.headers['Accept-Encoding'] = \
+            accept_encoding if accept_encoding else 'identity'
+        self.session.hooks['response'].append(_decode_with_codec)
+        tracing.trace_session(self.session)
+        self.timeout = (connect_timeout, read_timeout)
+        self.compress = compress
+        self.compress_threshold = compress_threshold
+        self.compress_level = compress_level
+
+    def request(self, method, url, **kwargs):
+        """
+        Send a request, with the timeout of this transport unless another
+        one is given.
+
+        :return: requests.Response
+        """
+        kwargs.setdefault('timeout', self.timeout)
+        if kwargs.get('json') is not None:
+            with tracing.timed('serialize'):
+                kwargs['data'] = codec.dumps(kwargs['json'])
+            headers = dict(kwargs.get('headers') or {})
+            headers.setdefault('Content-Type', 'application/json')
+            kwargs['headers'] = headers
+            kwargs['json'] = None
+        if self.compress is not None:
+            self.__compress(kwargs)
+        return self.session.request(method, url, **kwargs)
+
+    def __compress(self, kwargs):
+        body = kwargs.get('data')
+        if not isinstance(body, (bytes, str)) or \
+                len(body) < self.compress_threshold:
+            return
+        headers = dict(kwargs.get('headers') or {})
+        with tracing.timed('serialize'):
+            if not isinstance(body, bytes):
+                body = body.encode('utf-8')
+            compressor = zlib.compressobj(self.compress_level, zlib.DEFLATED,
+                                          _WBITS[self.compress])
+            body = compressor.compress(body) + compressor.flush()
+        headers['Content-Encoding'] = self.compress
+        kwargs['data'] = body
+        kwargs['headers'] = headers
+
+    def get(self, url, **kwargs):
+        return self.request('GET', url, **kwargs)
+
+    def post(self, url, data=None, json=None, **kwargs):
+        return self.request('POST', url, data=data, json=json, **kwargs)
+
+    def put(self, url, data=None, **kwargs):
+        return self.request('PUT', url, data=data, **kwargs)
+
+    def delete(self, url, **kwargs):
+        return self.request('DELETE', url, **kwargs)
+
+    def close(self):
+        """ Close all pooled connections. """
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+def _decode_with_codec(response, *args, **kwargs):
+    response.json = functools.partial(codec.response_json, response)
+
+
+_DEFAULT = None
+_DEFAULT_LOCK = threading.Lock()
+
+
+def default_transport():
+    """
+    Get the transport shared by all clients created without one.
+    """
+    global _DEFAULT
+    with _DEFAULT_LOCK:
+        if _DEFAULT is None:
+            _DEFAULT = Transport()
+        return _DEFAULT
@@ -1,5 +1,10 @@
 # -*- coding: utf-8 -*-
+import codecs
 import copy
+import json
+from collections import deque
+
+from .. import codec
 
 EMPTY_NETWORK = {
     'data': {
@@ -11,8 +16,223 @@ EMPTY_NETWORK = {
     }
 }
 
+# Approximate size in bytes of the pieces produced by iterencode
+CHUNK_SIZE = 2 ** 16
+
 
 def get_empty_network(name='Empty Network'):
     empty_network = copy.deepcopy(EMPTY_NETWORK)
     empty_network['data']['name'] = name
     return empty_network
+
+
+def iterencode(network, chunk_size=CHUNK_SIZE):
+    """
+    Encode a Cytoscape.js network as JSON, a piece at a time.
+
+    Nodes and edges may be any iterable, e.g. generators, so the encoded
+    network never has to be held in memory as a whole. The pieces can be
+    passed as request body to send them with chunked transfer encoding.
+
+    :param network: Cytoscape.js network as dictionary.
+    :param chunk_size: Approximate size in bytes of each piece.
+    :return: Generator of UTF-8 encoded pieces of the JSON document.
+    """
+    buffer = []
+    buffer_size = 0
+    for piece in __iter_json(network):
+        buffer.append(piece)
+        buffer_size += len(piece)
+        if buffer_size >= chunk_size:
+            yield b''.join(buffer)
+            buffer = []
+            buffer_size = 0
+    if buffer:
+        yield b''.join(buffer)
+
+
+def __iter_json(network):
+    # Every value goes through the codec, like the bodies sent at once
+    yield b'{'
+    for key, value in network.items():
+        if key != 'elements':
+            yield codec.dumps(key) + b': ' + codec.dumps(value) + b', '
+
+    yield b'"elements": {'
+    elements = network.get('elements', {})
+    for i, group in enumerate(('nodes', 'edges')):
+        yield (b', ' if i else b'') + codec.dumps(group) + b': ['
+        for j, element in enumerate(elements.get(group, [])):
+            yield (b', ' if j else b'') + codec.dumps(element)
+        yield b']'
+    yield b'}}'
+
+
+def iterdecode(chunks):
+    """
+    Decode a Cytoscape.js JSON document while it is being read.
+
+    Nodes and edges are produced one at a time, as soon as they have been
+    read, so only one element at a time has to be held in memory.
+
+    :param chunks: Iterable of bytes, e.g. Response.iter_content().
+    :return: Generator of (key, value) pairs. key is 'nodes' or 'edges' for
+        a single element, or the name of any other top-level member, e.g.
+        'data', together with its value.
+    """
+    stream = _JsonStream(chunks)
+    stream.expect('{')
+    if stream.close('}'):
+        return
+    while True:
+        key = stream.value()
+        stream.expect(':')
+        if key == 'elements' and stream.peek() == '{':
+            stream.expect('{')
+            if not stream.close('}'):
+                while True:
+                    group = stream.value()
+                    stream.expect(':')
+                    stream.expect('[')
+                    if not stream.close(']'):
+                        while True:
+                            yield group, stream.value()
+                            if not stream.next_item(']'):
+                                break
+                    if not stream.next_item('}'):
+                        break
+        else:
+            yield key, stream.value()
+        if not stream.next_item('}'):
+            break
+
+
+def decode_lazy(chunks):
+    """
+    Decode a Cytoscape.js JSON document into a network dictionary whose
+    nodes and edges are generators reading the document on demand.
+
+    Consume nodes before edges, as they appear in CyREST responses.
+    Elements read while looking for the other group are kept until they
+    are consumed.
+
+    :param chunks: Iterable of bytes, e.g. Response.iter_content().
+    :return: Cytoscape.js network as dictionary.
+    """
+    events = iterdecode(chunks)
+    pending = {'nodes': deque(), 'edges': deque()}
+    network = {}
+
+    def read():
+        key, value = next(events)
+        if key in pending:
+            pending[key].append(value)
+        else:
+            network[key] = value
+
+    def elements(group):
+        while True:
+            if pending[group]:
+                yield pending[group].popleft()
+                continue
+            try:
+                read()
+            except StopIteration:
+                return
+
+    # Read the members in front of the first element, e.g. 'data'
+    try:
+        while not (pending['nodes'] or pending['edges']):
+            read()
+    except StopIteration:
+        pass
+
+    network.setdefault('data', {})
+    network['elements'] = {
+        'nodes': elements('nodes'),
+        'edges': elements('edges')
+    }
+    return network
+
+
+class _JsonStream(object):
+    """ Incremental reader of JSON values from an iterable of bytes. """
+
+    __WHITESPACE = ' \t\n\r'
+
+    def __init__(self, chunks):
+        self.__chunks = iter(chunks)
+        self.__decoder = codecs.getincrementaldecoder('utf-8')()
+        self.__json = json.JSONDecoder()
+        self.__buffer = ''
+        self.__pos = 0
+        self.__exhausted = False
+
+    def __read(self, min_size=1):
+        # Append decoded chunks until min_size new characters have been read.
+        if self.__pos:
+            self.__buffer = self.__buffer[self.__pos:]
+            self.__pos = 0
+        parts = [self.__buffer]
+        target = len(self.__buffer) + min_size
+        size = len(self.__buffer)
+        while size < target and not self.__exhausted:
+            try:
+                chunk = next(self.__chunks)
+            except StopIteration:
+                self.__exhausted = True
+                chunk = b''
+            text = self.__decoder.decode(chunk, final=self.__exhausted)
+            parts.append(text)
+            size += len(text)
+        self.__buffer = ''.join(parts)
+
+    def peek(self):
+        while True:
+            while self.__pos < len(self.__buffer) and \
+                    self.__buffer[self.__pos] in self.__WHITESPACE:
+                self.__pos += 1
+            if self.__pos < len(self.__buffer):
+                return self.__buffer[self.__pos]
+            if self.__exhausted:
+                raise ValueError('Unexpected end of JSON document')
+            self.__read()
+
+    def expect(self, char):
+        if self.peek() != char:
+            context = self.__buffer[self.__pos:self.__pos + 20]
+            raise ValueError('Expected %r at %r' % (char, context))
+        self.__pos += 1
+
+    def close(self, char):
+        """ Consume char if it is next. """
+        if self.peek() == char:
+            self.__pos += 1
+            return True
+        return False
+
+    def next_item(self, close):
+        """ Consume a separator. Returns False at the end of the container. """
+        if self.close(close):
+            return False
+        self.expect(',')
+        return True
+
+    def value(self):
+        self.peek()
+        attempt = len(self.__buffer) - self.__pos
+        while True:
+            try:
+                value, end = self.__json.raw_decode(self.__buffer, self.__pos)
+                # A number or literal may continue in the next chunk.
+                if end < len(self.__buffer) or self.__exhausted or \
+                        self.__buffer[self.__pos] in '{["':
+                    self.__pos = end
+                    return value
+            except ValueError:
+                if self.__exhausted:
+                    raise
+            # Read at least as much again before retrying so that large
+            # values are not decoded over and over.
+            self.__read(max(attempt, 1))
+            attempt = len(self.__buffer) - self.__pos
@@ -0,0 +1,18 @@
+# -*- coding: utf-8 -*-
+from concurrent.futures import ThreadPoolExecutor
+
+
+def run_concurrently(func, items, max_workers=1):
+    """
+    Call func on every item, sending up to max_workers calls at once.
+
+    :param func: Function taking a single item.
+    :param items: Items to call func with.
+    :param max_workers: Maximum number of concurrent calls. With 1 (default)
+        the calls are made one after another in the calling thread.
+    :return: List of results, in the order of items.
+    """
+    if max_workers is None or max_workers <= 1:
+        return [func(item) for item in items]
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(func, items))
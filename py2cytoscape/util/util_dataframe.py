@@ -3,12 +3,17 @@ import pandas as pd
 from . import cytoscapejs as cyjs
 
 
+# Number of DataFrame rows converted at once
+CHUNK_SIZE = 100000
+
+
 def from_dataframe(df,
                    source_col='source',
                    target_col='target',
                    interaction_col='interaction',
                    name='From DataFrame',
-                   edge_attr_cols=[]):
+                   edge_attr_cols=[],
+                   lazy=False):
     """
     Utility to convert Pandas DataFrame object into Cytoscape.js JSON
 
@@ -19,36 +24,63 @@ def from_dataframe(df,
     :param name: Name of network.
     :param edge_attr_cols: List containing other columns to consider in df as
         edges' attributes.
+    :param lazy: If True, nodes and edges are generators which convert df a
+        chunk of rows at a time as they are consumed, e.g. by
+        cytoscapejs.iterencode.
     :return: Dictionary version of df.
     """
 
     network = cyjs.get_empty_network(name=name)
-    nodes = set()
     if edge_attr_cols is None:
         edge_attr_cols = []
+    extra_cols = [column for column in edge_attr_cols if column in df.columns]
+
+    nodes = __iter_nodes(df, source_col, target_col)
+    edges = __iter_edges(df, source_col, target_col, interaction_col,
+                         extra_cols)
+    if not lazy:
+        nodes = [node for chunk in nodes for node in chunk]
+        edges = [edge for chunk in edges for edge in chunk]
+    else:
+        nodes = (node for chunk in nodes for node in chunk)
+        edges = (edge for chunk in edges for edge in chunk)
 
-    for index, row in df.iterrows():
-        s = row[source_col]
-        t = row[target_col]
-        if s not in nodes:
-            nodes.add(s)
-            source = get_node(s)
-            network['elements']['nodes'].append(source)
-        if t not in nodes:
-            nodes.add(t)
-            target = get_node(t)
-            network['elements']['nodes'].append(target)
-
-        extra_values = {column: row[column]
-                        for column in edge_attr_cols
-                        if column in df.columns}
-
-        network['elements']['edges'].append(
-            get_edge(s, t, interaction=row[interaction_col], **extra_values)
-        )
+    network['elements']['nodes'] = nodes
+    network['elements']['edges'] = edges
     return network
 
 
+def __iter_chunks(df):
+    for start in range(0, len(df), CHUNK_SIZE):
+        yield df.iloc[start:start + CHUNK_SIZE]
+
+
+def __iter_nodes(df, source_col, target_col):
+    # Unique nodes in order of first appearance: source, then target of
+    # every row.
+    seen = set()
+    for chunk in __iter_chunks(df):
+        sources = chunk[source_col].tolist()
+        endpoints = [None] * (2 * len(sources))
+        endpoints[::2] = sources
+        endpoints[1::2] = chunk[target_col].tolist()
+        new_nodes = [node for node in dict.fromkeys(endpoints)
+                     if node not in seen]
+        seen.update(new_nodes)
+        yield [{'data': {'id': node_id, 'name': node_id}}
+               for node_id in map(str, new_nodes)]
+
+
+def __iter_edges(df, source_col, target_col, interaction_col, extra_cols):
+    keys = ['source', 'target', 'interaction'] + extra_cols
+    for chunk in __iter_chunks(df):
+        columns = [chunk[source_col].tolist(),
+                   chunk[target_col].tolist(),
+                   chunk[interaction_col].fillna('-').tolist()] + \
+            [chunk[column].tolist() for column in extra_cols]
+        yield [{'data': dict(zip(keys, values))} for values in zip(*columns)]
+
+
 def to_dataframe(network,
                  interaction='interaction',
                  default_interaction='-',
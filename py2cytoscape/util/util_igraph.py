@@ -4,6 +4,8 @@
 Conversion utilities for igraph
 
 """
+from itertools import chain
+
 
 try:
     import igraph as ig
@@ -15,53 +17,62 @@ except Exception as error:
 DEF_SCALING = 100.0
 
 
-def from_igraph(igraph_network, layout=None, scale=DEF_SCALING):
+def from_igraph(igraph_network, layout=None, scale=DEF_SCALING, lazy=False):
+    """
+    Convert igraph object into Cytoscape.js-style JSON object.
+
+    If lazy is True, nodes and edges are generators built as they are
+    consumed, e.g. by cytoscapejs.iterencode.
+    """
     if ig is None:
         raise ImportError('igraph not found')
 
     new_graph = {}
     network_data = {}
     elements = {}
-    nodes = []
-    edges = []
 
     # Convert network attributes
     network_attr = igraph_network.attributes()
     for key in network_attr:
         network_data[key] = igraph_network[key]
 
-    # get network as a list of edges
-    edges_original = igraph_network.es
-    nodes_original = igraph_network.vs
-
+    # Read attributes a whole column at a time, not per vertex or edge
     node_attr = igraph_network.vs.attributes()
-    for idx, node in enumerate(nodes_original):
-        new_node = {}
-        data = {}
-        data['id'] = str(node.index)
-        data['name'] = str(node.index)
-        for key in node_attr:
-            data[key] = node[key]
-        new_node['data'] = data
-        if layout is not None:
-            position = {}
-            position['x'] = layout[idx][0] * scale
-            position['y'] = layout[idx][1] * scale
-            new_node['position'] = position
-
-        nodes.append(new_node)
-
-    # Add edges to the elements
+    node_columns = [igraph_network.vs[key] for key in node_attr]
     edge_attr = igraph_network.es.attributes()
-    for edge in edges_original:
-        new_edge = {}
-        data = {}
-        data['source'] = str(edge.source)
-        data['target'] = str(edge.target)
-        for key in edge_attr:
-            data[key] = edge[key]
-        new_edge['data'] = data
-        edges.append(new_edge)
+    edge_columns = [igraph_network.es[key] for key in edge_attr]
+    edge_list = igraph_network.get_edgelist()
+
+    if layout is not None:
+        coords = layout.coords if isinstance(layout, ig.Layout) else layout
+
+    def build_nodes():
+        rows = zip(*node_columns) if node_columns else \
+            ((),) * igraph_network.vcount()
+        for idx, values in enumerate(rows):
+            data = {'id': str(idx), 'name': str(idx)}
+            data.update(zip(node_attr, values))
+            new_node = {'data': data}
+            if layout is not None:
+                new_node['position'] = {
+                    'x': coords[idx][0] * scale,
+                    'y': coords[idx][1] * scale
+                }
+            yield new_node
+
+    def build_edges():
+        rows = zip(*edge_columns) if edge_columns else \
+            ((),) * len(edge_list)
+        for (source, target), values in zip(edge_list, rows):
+            data = {'source': str(source), 'target': str(target)}
+            data.update(zip(edge_attr, values))
+            yield {'data': data}
+
+    nodes = build_nodes()
+    edges = build_edges()
+    if not lazy:
+        nodes = list(nodes)
+        edges = list(edges)
 
     elements['nodes'] = nodes
     elements['edges'] = edges
@@ -72,63 +83,33 @@ def from_igraph(igraph_network, layout=None, scale=DEF_SCALING):
 
 
 def to_igraph(network):
+    """
+    Convert Cytoscape.js-style JSON object into igraph object.
+
+    The graph is created with a single igraph.Graph call from the edge list
+    and the attribute columns.
+    """
+    if ig is None:
+        raise ImportError('igraph not found')
+
+    nodes = [node['data'] for node in network['elements']['nodes']]
+    edges = [edge['data'] for edge in network['elements']['edges']]
+    vertex_attrs = __columns(nodes)
+    edge_attrs = __columns(edges)
+
+    node_id_dict = {node_id: i for i, node_id
+                    in enumerate(vertex_attrs.get('id', []))}
+    sources = edge_attrs.pop('source', [])
+    targets = edge_attrs.pop('target', [])
+    edge_tuples = list(zip(map(node_id_dict.__getitem__, sources),
+                           map(node_id_dict.__getitem__, targets)))
+
+    return ig.Graph(n=len(nodes), edges=edge_tuples,
+                    graph_attrs=network['data'],
+                    vertex_attrs=vertex_attrs, edge_attrs=edge_attrs)
+
 
-    nodes = network['elements']['nodes']
-    edges = network['elements']['edges']
-    network_attr = network['data']
-
-    node_count = len(nodes)
-    edge_count = len(edges)
-
-    g = ig.Graph()
-
-    # Graph attributes
-    for key in network_attr.keys():
-        g[key] = network_attr[key]
-
-    g.add_vertices(nodes)
-
-    # Add node attributes
-    node_attributes = {}
-    node_id_dict = {}
-    for i, node in enumerate(nodes):
-        data = node['data']
-        for key in data.keys():
-            if key not in node_attributes:
-                node_attributes[key] = [None] * node_count
-
-            # Save index to map
-            if key == 'id':
-                node_id_dict[data[key]] = i
-
-            node_attributes[key][i] = data[key]
-
-    for key in node_attributes.keys():
-        g.vs[key] = node_attributes[key]
-
-    # Create edges
-    edge_tuples = []
-    edge_attributes = {}
-    for i, edge in enumerate(edges):
-        data = edge['data']
-        source = data['source']
-        target = data['target']
-        edge_tuple = (node_id_dict[source], node_id_dict[target])
-        edge_tuples.append(edge_tuple)
-        for key in data.keys():
-            if key not in edge_attributes:
-                edge_attributes[key] = [None] * edge_count
-
-            # Save index to map
-            edge_attributes[key][i] = data[key]
-
-    g.add_edges(edge_tuples)
-
-    # Assign edge attributes
-    for key in edge_attributes.keys():
-        if key == 'source' or key == 'target':
-            continue
-        else:
-            g.es[key] = edge_attributes[key]
-
-    return g
+def __columns(rows):
+    # Turn a list of dicts into one list per key, None where a key is missing
+    keys = dict.fromkeys(chain.from_iterable(rows))
+    return {key: [row.get(key) for row in rows] for key in keys}
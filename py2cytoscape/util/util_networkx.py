@@ -10,6 +10,7 @@ https://networkx.github.io/
 
 import networkx as nx
 
+
 # Special Keys
 ID = 'id'
 NAME = 'name'
@@ -36,7 +37,7 @@ def __map_table_data(columns, graph_obj):
     return data
 
 
-def __create_node(node, node_id):
+def __create_node(node, node_id, position=None):
     new_node = {}
     node_columns = node.keys()
     data = __map_table_data(node_columns, node)
@@ -44,9 +45,10 @@ def __create_node(node, node_id):
     data[ID] = str(node_id)
     data[NAME] = str(node_id)
 
-    if 'position' in node.keys():
-        position = node['position']
+    if position is not None:
         new_node['position'] = position
+    elif 'position' in node:
+        new_node['position'] = node['position']
 
     new_node[DATA] = data
     return new_node
@@ -56,7 +58,8 @@ def __build_multi_edge(edge_tuple, g):
     source = edge_tuple[0]
     target = edge_tuple[1]
     key = edge_tuple[2]
-    data = edge_tuple[3]
+    # Copy the attributes, the graph itself must stay unchanged
+    data = dict(edge_tuple[3])
 
     data['source'] = str(source)
     data['target'] = str(target)
@@ -67,7 +70,7 @@ def __build_multi_edge(edge_tuple, g):
 def __build_edge(edge_tuple, g):
     source = edge_tuple[0]
     target = edge_tuple[1]
-    data = edge_tuple[2]
+    data = dict(edge_tuple[2])
 
     data['source'] = str(source)
     data['target'] = str(target)
@@ -84,17 +87,19 @@ def __build_empty_graph():
     }
 
 
-def from_networkx(g, layout=None, scale=DEF_SCALE):
+def from_networkx(g, layout=None, scale=DEF_SCALE, lazy=False):
+    """
+    Convert NetworkX object into Cytoscape.js-style JSON object.
+
+    If lazy is True, nodes and edges are generators built as they are
+    consumed, e.g. by cytoscapejs.iterencode.
+
+    :param layout: Dictionary of node positions, e.g. from nx.spring_layout.
+    """
     # Dictionary Object to be converted to Cytoscape.js JSON
     cygraph = __build_empty_graph()
 
-    if layout is not None:
-        pos = map(lambda position:
-                  {'x': position[0]*scale, 'y': position[1]*scale},
-                  layout.values())
-
-    nodes = g.nodes()
-    if isinstance(g, nx.MultiDiGraph) or isinstance(g, nx.MultiGraph):
+    if g.is_multigraph():
         edges = g.edges(data=True, keys=True)
         edge_builder = __build_multi_edge
     else:
@@ -104,15 +109,22 @@ def from_networkx(g, layout=None, scale=DEF_SCALE):
     # Map network table data
     cygraph[DATA] = __map_table_data(g.graph.keys(), g.graph)
 
-    for i, node_id in enumerate(nodes):
-        new_node = __create_node(g.node[node_id], node_id)
-        if layout is not None:
-            new_node['position'] = pos[i]
+    def build_nodes():
+        for node_id, node in g.nodes(data=True):
+            position = None
+            if layout is not None:
+                x, y = layout[node_id][:2]
+                position = {'x': x * scale, 'y': y * scale}
+            yield __create_node(node, node_id, position)
 
-        cygraph['elements']['nodes'].append(new_node)
+    cy_nodes = build_nodes()
+    cy_edges = (edge_builder(edge, g) for edge in edges)
+    if not lazy:
+        cy_nodes = list(cy_nodes)
+        cy_edges = list(cy_edges)
 
-    for edge in edges:
-        cygraph['elements']['edges'].append(edge_builder(edge, g))
+    cygraph['elements']['nodes'] = cy_nodes
+    cygraph['elements']['edges'] = cy_edges
 
     return cygraph
 
@@ -121,7 +133,9 @@ def to_networkx(cyjs, directed=True):
     """
     Convert Cytoscape.js-style JSON object into NetworkX object.
 
-    By default, data will be handles as a directed graph.
+    By default, data will be handles as a directed graph. Nodes and edges
+    may be generators, e.g. from CyNetwork.to_json(stream=True). They are
+    added as they are produced, nodes first.
     """
 
     if directed:
@@ -137,15 +151,8 @@ def to_networkx(cyjs, directed=True):
     nodes = cyjs[ELEMENTS][NODES]
     edges = cyjs[ELEMENTS][EDGES]
 
-    for node in nodes:
-        data = node[DATA]
-        g.add_node(data[ID], attr_dict=data)
-
-    for edge in edges:
-        data = edge[DATA]
-        source = data[SOURCE]
-        target = data[TARGET]
-
-        g.add_edge(source, target, attr_dict=data)
+    g.add_nodes_from((node[DATA][ID], node[DATA]) for node in nodes)
+    g.add_edges_from((edge[DATA][SOURCE], edge[DATA][TARGET], edge[DATA])
+                     for edge in edges)
 
     return g
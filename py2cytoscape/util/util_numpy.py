@@ -1,15 +1,86 @@
 import numpy as np
 
+try:
+    from scipy import sparse
+except ImportError:
+    sparse = None
 
-def from_ndarray(data, name=None, labels=None, directed=False, weighted=False):
+# Number of matrix cells scanned at once when extracting edges
+BLOCK_SIZE = 2 ** 22
+
+
+def from_ndarray(data, name=None, labels=None, directed=False, weighted=False,
+                 lazy=False):
     mat_dim = data.shape
     if mat_dim[0] != mat_dim[1]:
         raise ValueError('Data should be square matrix.')
     data_size = mat_dim[0]
 
+    g = __get_graph(name, labels, data_size, lazy)
+
+    if weighted:
+        edges = __get_weighted_edges(matrix=data)
+    else:
+        edges = __get_unweighted_edges(matrix=data)
+    g['elements']['edges'] = __flatten(edges, lazy)
+
+    return g
+
+
+def from_sparse(data, name=None, labels=None, directed=False, weighted=False,
+                lazy=False):
+    """
+    Convert a scipy.sparse adjacency matrix into Cytoscape.js JSON.
+
+    Only stored entries on or above the diagonal become edges. Unweighted
+    graphs keep the entries equal to 1, weighted graphs every entry that
+    is not NaN.
+
+    :param data: Square scipy.sparse matrix, e.g. in COO or CSR format.
+    :param name: Name of network.
+    :param labels: Node names, one per row.
+    :param weighted: If True, the entries are stored as edge weights.
+    :param lazy: If True, nodes and edges are generators built as they are
+        consumed, e.g. by cytoscapejs.iterencode.
+    :return: Dictionary version of data.
+    """
+    if sparse is None:
+        raise ImportError('scipy not found')
+
+    mat_dim = data.shape
+    if mat_dim[0] != mat_dim[1]:
+        raise ValueError('Data should be square matrix.')
+
+    g = __get_graph(name, labels, mat_dim[0], lazy)
+
+    upper = sparse.triu(data, format='coo')
+    upper.sum_duplicates()
+    if weighted:
+        keep = ~np.isnan(upper.data)
+    else:
+        keep = upper.data == 1
+    rows = upper.row[keep]
+    cols = upper.col[keep]
+    order = np.lexsort((cols, rows))
+
+    rows = rows[order]
+    cols = cols[order]
+    weights = upper.data[keep][order] if weighted else None
+
+    def edges():
+        for start in range(0, len(rows), BLOCK_SIZE):
+            end = start + BLOCK_SIZE
+            yield __get_edges(rows[start:end], cols[start:end],
+                              None if weights is None else weights[start:end])
+    g['elements']['edges'] = __flatten(edges(), lazy)
+
+    return g
+
+
+def __get_graph(name, labels, size, lazy=False):
     if labels is not None:
         label_len = len(labels)
-        if label_len != data_size:
+        if label_len != size:
             raise ValueError('Label length is not equal to the size of data.')
 
     network_name = name
@@ -26,27 +97,24 @@ def from_ndarray(data, name=None, labels=None, directed=False, weighted=False):
         }
     }
 
-    g['elements']['nodes'] = __get_nodes(labels, data_size)
-
-    if weighted:
-        g['elements']['edges'] = __get_weighted_edges(matrix=data)
-    else:
-        g['elements']['edges'] = __get_unweighted_edges(matrix=data)
-
+    nodes = __get_nodes(labels, size)
+    g['elements']['nodes'] = nodes if lazy else list(nodes)
     return g
 
-def __get_nodes(labels, size):
 
-    nodes = []
+def __get_nodes(labels, size):
     if labels is None:
-        node_labels = np.arange(size)
+        node_labels = range(size)
     else:
         node_labels = labels
 
-    for idx, label in enumerate(node_labels):
-        nodes.append(__get_node(idx, label))
+    return (__get_node(idx, label) for idx, label in enumerate(node_labels))
+
 
-    return nodes
+def __flatten(blocks, lazy):
+    if lazy:
+        return (element for block in blocks for element in block)
+    return [element for block in blocks for element in block]
 
 
 def __get_node(node_id, name):
@@ -59,10 +127,6 @@ def __get_node(node_id, name):
     return n
 
 
-def __get_egdes(matrix, labels):
-    pass
-
-
 def __get_edge(source, target, weight=None):
     e = {
         'data': {
@@ -78,35 +142,36 @@ def __get_edge(source, target, weight=None):
     return e
 
 
-def __get_unweighted_edges(matrix):
+def __get_edges(rows, cols, weights=None):
+    sources = [str(idx) for idx in rows.tolist()]
+    targets = [str(idx) for idx in cols.tolist()]
+    if weights is None:
+        return [__get_edge(s, t) for s, t in zip(sources, targets)]
+    return [__get_edge(s, t, weight=w)
+            for s, t, w in zip(sources, targets, weights.tolist())]
+
+
+def __get_upper_edges(matrix, is_edge, weighted):
+    """
+    Extract the edges on or above the diagonal, one list per block of rows,
+    so that the temporary masks stay small for large matrices.
+    """
     size = matrix.shape[0]
+    step = max(1, BLOCK_SIZE // max(size, 1))
+    col_idx = np.arange(size)
 
-    edges = []
-    row_idx = 0
-    for row in matrix:
-        idx = row_idx
-        while idx < size:
-            if row[idx] == 1:
-                e = __get_edge(str(row_idx), str(idx))
-                edges.append(e)
-            idx += 1
-        row_idx += 1
-    return edges
+    for start in range(0, size, step):
+        block = np.asarray(matrix[start:start + step])
+        row_idx = np.arange(start, start + block.shape[0])
+        mask = is_edge(block) & (col_idx[np.newaxis, :] >= row_idx[:, np.newaxis])
+        rows, cols = np.nonzero(mask)
+        weights = block[rows, cols] if weighted else None
+        yield __get_edges(rows + start, cols, weights)
 
 
-def __get_weighted_edges(matrix):
-    size = matrix.shape[0]
-    edges = []
-    row_idx = 0
-    for row in matrix:
-        idx = row_idx
-        while idx < size:
-            if not np.isnan(row[idx]):
-                e = __get_edge(str(row_idx), str(idx), weight=row[idx])
-                edges.append(e)
-            idx += 1
-        row_idx += 1
-    return edges
-    pass
+def __get_unweighted_edges(matrix):
+    return __get_upper_edges(matrix, lambda block: block == 1, False)
 
 
+def __get_weighted_edges(matrix):
+    return __get_upper_edges(matrix, lambda block: ~np.isnan(block), True)
@@ -0,0 +1,140 @@
+# -*- coding: utf-8 -*-
+"""
+Conversion of Cytoscape tables into typed columnar data.
+
+Column types are taken from the column definitions returned by CyREST,
+e.g. {'name': 'degree', 'type': 'Integer'} or
+{'name': 'aliases', 'type': 'List', 'listType': 'String'}.
+"""
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+    pq = None
+
+# Cytoscape column types and the names of the matching pyarrow types
+ARROW_TYPES = {
+    'Long': 'int64',
+    'Integer': 'int32',
+    'Double': 'float64',
+    'String': 'string',
+    'Boolean': 'bool_'
+}
+
+# Cytoscape column types and the matching pandas dtypes, for columns
+# without and with missing values
+PANDAS_TYPES = {
+    'Long': ('int64', 'Int64'),
+    'Integer': ('int32', 'Int32'),
+    'Double': ('float64', 'float64'),
+    'Boolean': ('bool', 'boolean')
+}
+
+
+def is_arrow(data):
+    """ Check whether data is a pyarrow Table. """
+    return pa is not None and isinstance(data, pa.Table)
+
+
+def arrow_type(column):
+    """
+    Get the pyarrow type of a Cytoscape column.
+
+    :param column: Column definition with 'type' and, for lists, 'listType'.
+    :return: pyarrow DataType, or None for unknown types.
+    """
+    if pa is None:
+        raise ImportError('pyarrow not found')
+    if column['type'] == 'List':
+        value_type = __arrow_type(column.get('listType'))
+        return None if value_type is None else pa.list_(value_type)
+    return __arrow_type(column['type'])
+
+
+def __arrow_type(type_name):
+    if type_name not in ARROW_TYPES:
+        return None
+    return getattr(pa, ARROW_TYPES[type_name])()
+
+
+def to_arrow(columns, values):
+    """
+    Build a pyarrow Table from the values of Cytoscape columns.
+
+    :param columns: Column definitions, as returned by the columns endpoint.
+    :param values: One list of values per column, in the same order.
+    :return: pyarrow Table with one typed column per definition.
+    """
+    if pa is None:
+        raise ImportError('pyarrow not found')
+    arrays = [pa.array(column_values, type=arrow_type(column))
+              for column, column_values in zip(columns, values)]
+    return pa.Table.from_arrays(arrays,
+                                names=[column['name'] for column in columns])
+
+
+def to_parquet(table, path, **kwargs):
+    """
+    Write a pyarrow Table to a Parquet file.
+
+    :param table: pyarrow Table.
+    :param path: Path or writable file object.
+    :param kwargs: Passed on to pyarrow.parquet.write_table.
+    """
+    if pq is None:
+        raise ImportError('pyarrow not found')
+    pq.write_table(table, path, **kwargs)
+
+
+def to_series(values, column):
+    """
+    Build a typed pandas Series from the values of a Cytoscape column.
+
+    Numbers and booleans get NumPy dtypes, or nullable pandas dtypes if
+    values are missing. With pyarrow installed, List columns of a known
+    value type are stored as Arrow lists, i.e. one offsets and one values
+    buffer, instead of one Python list per row. Other columns keep the
+    dtype pandas infers.
+
+    :param values: List of values.
+    :param column: Column definition with 'type' and, for lists, 'listType'.
+    :return: pandas Series.
+    """
+    if column.get('type') == 'List':
+        if pa is None or not hasattr(pd, 'ArrowDtype'):
+            return pd.Series(values, dtype=object)
+        list_type = arrow_type(column)
+        if list_type is None:
+            # Lists of values of an unknown type
+            return pd.Series(values, dtype=object)
+        return pd.Series(values, dtype=pd.ArrowDtype(list_type))
+    if column.get('type') not in PANDAS_TYPES:
+        return pd.Series(values)
+    dtype, nullable_dtype = PANDAS_TYPES[column['type']]
+    return pd.Series(values, dtype=nullable_dtype if None in values else dtype)
+
+
+def to_dataframe(columns, values):
+    """
+    Build a typed DataFrame from the values of Cytoscape columns.
+
+    :param columns: Column definitions, as returned by the columns endpoint.
+    :param values: One list of values per column, in the same order.
+    :return: DataFrame with one column per definition.
+    """
+    return pd.DataFrame({column['name']: to_series(column_values, column)
+                         for column, column_values in zip(columns, values)})
+
+
+def rows_to_columns(columns, rows):
+    """
+    Split table rows into one list of values per column.
+
+    :param columns: Column definitions, as returned by the columns endpoint.
+    :param rows: List of rows as dictionaries.
+    :return: List of values lists, in the order of columns.
+    """
+    return [[row.get(column['name']) for row in rows] for column in columns]
@@ -24,6 +24,7 @@ setup(
     author_email='kono@ucsd.edu',
     url='https://github.com/idekerlab/py2cytoscape',
     license='MIT License',
+    python_requires='>=3.7',
     install_requires=[
         'pandas',
         'networkx',
@@ -42,6 +43,9 @@ setup(
         ),
         'paramiko' : (
             'paramiko'
+        ),
+        'arrow' : (
+            'pyarrow',
         )
     },
     keywords=['data visualization', 'visualization', 'cytoscape',
@@ -51,9 +55,13 @@ setup(
         'Intended Audience :: Developers',
         'Operating System :: OS Independent',
         'Development Status :: 3 - Alpha',
-        'Programming Language :: Python :: 2.7',
-        'Programming Language :: Python :: 3.4',
-        'Programming Language :: Python :: 3.5',
+        'Programming Language :: Python :: 3',
+        'Programming Language :: Python :: 3 :: Only',
+        'Programming Language :: Python :: 3.7',
+        'Programming Language :: Python :: 3.8',
+        'Programming Language :: Python :: 3.9',
+        'Programming Language :: Python :: 3.10',
+        'Programming Language :: Python :: 3.11',
         'License :: OSI Approved :: MIT License',
         'Topic :: Scientific/Engineering :: Bio-Informatics',
         'Topic :: Scientific/Engineering :: Information Analysis',
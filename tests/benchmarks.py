@@ -0,0 +1,290 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmarks of the client's own overhead, run against the mock CyREST server.
+
+Each benchmark is timed at several sizes, given as number of edges or rows.
+Results can be saved and compared with an earlier run:
+
+    python -m tests.benchmarks --sizes 1000 10000 --output before.json
+    python -m tests.benchmarks --sizes 1000 10000 --compare before.json
+
+With --max-ratio, the run fails if a benchmark got slower than that factor.
+
+With --json, e.g. --json json, the JSON library is chosen instead of the
+fastest installed one.
+
+With --compress, every benchmark is run with plain and with gzip compressed
+bodies, and the bytes transferred and time of both are shown. Use
+--bandwidth to mimic the link to a remote Cytoscape:
+
+    python -m tests.benchmarks --compress --bandwidth 10e6 --latency 0.001
+"""
+import argparse
+import json
+import sys
+import time
+from collections import OrderedDict
+
+import networkx as nx
+import numpy as np
+import pandas as pd
+
+from py2cytoscape import codec
+from py2cytoscape.cyrest.base import api
+from py2cytoscape.data.cyrest_client import CyRestClient
+from py2cytoscape.util import util_table
+from py2cytoscape.transport import Transport
+from tests.cyrest_server import CyRestServer, PORT
+
+SIZES = (1000, 10000)
+REPEAT = 3
+
+
+def edge_frame(size, seed=0):
+    """ Random edge list of size edges between size // 2 nodes. """
+    rng = np.random.RandomState(seed)
+    nodes = max(size // 2, 2)
+    return pd.DataFrame({
+        'source': ['n' + str(i) for i in rng.randint(0, nodes, size)],
+        'target': ['n' + str(i) for i in rng.randint(0, nodes, size)],
+        'interaction': 'pp',
+        'weight': rng.rand(size)
+    })
+
+
+def create_network(client, size):
+    return client.network.create_from_dataframe(edge_frame(size),
+                                                extra_columns=['weight'])
+
+
+# Every benchmark prepares its input and returns the call to time.
+
+def bench_create_from_dataframe(client, size):
+    df = edge_frame(size)
+    return lambda: client.network.create_from_dataframe(
+        df, extra_columns=['weight'])
+
+
+def bench_create_from_networkx(client, size):
+    g = nx.from_pandas_edgelist(edge_frame(size), edge_attr=['weight'],
+                                create_using=nx.MultiDiGraph())
+    return lambda: client.network.create_from_networkx(g)
+
+
+def bench_create_from_ndarray(client, size):
+    # Dense matrix with about size non-zero entries
+    n = max(int(np.sqrt(size * 4)), 2)
+    rng = np.random.RandomState(0)
+    matrix = (rng.rand(n, n) < float(size) / (n * n)).astype(float)
+    return lambda: client.network.create_from_ndarray(matrix, name='ndarray')
+
+
+def bench_to_networkx(client, size):
+    network = create_network(client, size)
+    return network.to_networkx
+
+
+def bench_to_dataframe(client, size):
+    network = create_network(client, size)
+    return lambda: network.to_dataframe(extra_edges_columns=['weight'])
+
+
+def bench_node_table_round_trip(client, size):
+    network = client.network.create()
+    names = ['n' + str(i) for i in range(size)]
+    network.add_nodes(names)
+    rng = np.random.RandomState(0)
+    df = pd.DataFrame({
+        'score': rng.rand(size),
+        'degree': rng.randint(0, 100, size),
+        'label': names
+    }, index=names)
+
+    def run():
+        network.update_node_table(df)
+        return network.get_node_table()
+    return run
+
+
+def bench_node_table_arrow(client, size):
+    if util_table.pa is None:
+        return None
+    network = client.network.create()
+    names = ['n' + str(i) for i in range(size)]
+    network.add_nodes(names)
+    table = util_table.pa.table({
+        'name': names,
+        'score': np.random.RandomState(0).rand(size)
+    })
+
+    def run():
+        network.update_node_table_from_arrow(table)
+        return network.to_arrow()
+    return run
+
+
+def bench_view_batch_update(client, size):
+    network = client.network.create()
+    suids = list(network.add_nodes(['n' + str(i)
+                                    for i in range(size)]).values())
+    view = network.get_view(network.get_views()[0], format='view')
+    rng = np.random.RandomState(0)
+    df = pd.DataFrame({
+        'NODE_FILL_COLOR': '#FF0000',
+        'NODE_SIZE': rng.randint(10, 100, size),
+        'NODE_X_LOCATION': rng.rand(size) * 1000
+    }, index=suids)
+    return lambda: view.batch_update_node_views(df)
+
+
+def bench_command_calls(client, size):
+    network = create_network(client, 10)
+    params = {'network': 'SUID:' + str(network.get_id()),
+              'columnList': 'SUID'}
+    calls = max(size // 100, 1)
+
+    def run():
+        for _ in range(calls):
+            api(namespace='network', command='get attribute', PARAMS=params)
+    return run
+
+
+BENCHMARKS = OrderedDict([
+    ('create_from_dataframe', bench_create_from_dataframe),
+    ('create_from_networkx', bench_create_from_networkx),
+    ('create_from_ndarray', bench_create_from_ndarray),
+    ('to_networkx', bench_to_networkx),
+    ('to_dataframe', bench_to_dataframe),
+    ('node_table_round_trip', bench_node_table_round_trip),
+    ('node_table_arrow', bench_node_table_arrow),
+    ('view_batch_update', bench_view_batch_update),
+    ('command_calls', bench_command_calls),
+])
+
+
+def run_benchmarks(server, sizes=SIZES, repeat=REPEAT, names=None,
+                   transport=None):
+    """
+    Time the benchmarks against a running server.
+
+    :param server: Started CyRestServer. It is reset before every run.
+    :param sizes: Sizes to run each benchmark at.
+    :param repeat: Number of timed runs, the fastest one counts.
+    :param names: Names of the benchmarks to run, default all.
+    :param transport: Transport of the client, default a new one.
+    :return: List of dicts with name, size, best and median seconds, and
+        the body bytes sent and received by the client in the last run.
+    """
+    client = CyRestClient(port=server.port, transport=transport)
+    results = []
+    for name, bench in BENCHMARKS.items():
+        if names and name not in names:
+            continue
+        for size in sizes:
+            times = []
+            for _ in range(repeat):
+                server.reset()
+                run = bench(client, size)
+                if run is None:
+                    break
+                received, sent = server.bytes_received, server.bytes_sent
+                start = time.time()
+                run()
+                times.append(time.time() - start)
+            if times:
+                results.append({'name': name, 'size': size,
+                                'best': min(times),
+                                'median': float(np.median(times)),
+                                'sent': server.bytes_received - received,
+                                'received': server.bytes_sent - sent})
+    return results
+
+
+def compression(server, sizes=SIZES, repeat=REPEAT, names=None,
+                compress='gzip', threshold=None):
+    """
+    Run the benchmarks with plain and with compressed bodies.
+
+    :param server: Started CyRestServer. Its responses are compressed while
+        running with compression.
+    :param compress: Content-Encoding of the requests, 'gzip' or 'deflate'.
+    :param threshold: Smallest body compressed, default the one of
+        Transport.
+    :return: List of dicts with name and size, and best, sent and received
+        of both runs, the compressed ones suffixed by _compressed.
+    """
+    with Transport(accept_encoding=None) as transport:
+        plain = run_benchmarks(server, sizes, repeat, names, transport)
+    options = {} if threshold is None else {'compress_threshold': threshold}
+    server.compress = True
+    try:
+        with Transport(compress=compress, **options) as transport:
+            compressed = run_benchmarks(server, sizes, repeat, names,
+                                        transport)
+    finally:
+        server.compress = False
+    results = []
+    for before, after in zip(plain, compressed):
+        result = dict((key, before[key]) for key in
+                      ('name', 'size', 'best', 'sent', 'received'))
+        for key in ('best', 'sent', 'received'):
+            result[key + '_compressed'] = after[key]
+        results.append(result)
+    return results
+
+
+def compare(results, baseline):
+    """ Add the ratio to the best time of the same benchmark in baseline. """
+    best = {(r['name'], r['size']): r['best'] for r in baseline}
+    for result in results:
+        previous = best.get((result['name'], result['size']))
+        result['ratio'] = result['best'] / previous if previous else None
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=SIZES)
+    parser.add_argument('--repeat', type=int, default=REPEAT)
+    parser.add_argument('--latency', type=float, default=0.0,
+                        help='seconds every request is delayed by')
+    parser.add_argument('--bandwidth', type=float,
+                        help='bytes per second of the simulated link')
+    parser.add_argument('--compress', action='store_true',
+                        help='compare plain with gzip compressed bodies')
+    parser.add_argument('--only', nargs='+', help='benchmarks to run')
+    parser.add_argument('--json', choices=sorted(codec.CODECS),
+                        help='JSON library, default the fastest installed')
+    parser.add_argument('--output', help='save the results as JSON')
+    parser.add_argument('--compare', help='results of an earlier run')
+    parser.add_argument('--max-ratio', type=float,
+                        help='fail if a benchmark got slower than this')
+    args = parser.parse_args(argv)
+    codec.set_codec(args.json)
+
+    with CyRestServer(port=PORT, latency=args.latency,
+                      bandwidth=args.bandwidth) as server:
+        if args.compress:
+            results = compression(server, args.sizes, args.repeat,
+                                  args.only)
+        else:
+            results = run_benchmarks(server, args.sizes, args.repeat,
+                                     args.only)
+    if args.compare:
+        with open(args.compare) as f:
+            compare(results, json.load(f))
+
+    table = pd.DataFrame(results).set_index(['name', 'size'])
+    print(table.to_string(float_format=lambda x: '%.4f' % x))
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+    if args.max_ratio is not None:
+        slower = [r for r in results
+                  if r.get('ratio') and r['ratio'] > args.max_ratio]
+        return 1 if slower else 0
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
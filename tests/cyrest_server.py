@@ -0,0 +1,1132 @@
+# -*- coding: utf-8 -*-
+"""
+In-process stand-in for the CyREST API of Cytoscape.
+
+Implements enough of /v1 to run the client against it: networks, nodes,
+edges, default tables, views, styles, layouts, the session and a few
+/commands. Every request can be delayed by a fixed latency and a limited
+bandwidth to mimic a remote Cytoscape.
+
+    with CyRestServer(latency=0.001) as server:
+        client = CyRestClient(port=server.port)
+
+Set the environment variable CYREST_LIVE to run the tests using serve()
+against a real Cytoscape instead.
+"""
+import csv
+import gzip
+import io
+import itertools
+import json
+import math
+import os
+import re
+import socket
+import threading
+import time
+import zlib
+from collections import OrderedDict
+
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from socketserver import ThreadingMixIn
+from urllib.parse import urlsplit, parse_qsl, unquote
+
+PORT = 1234
+VERSION = 'v1'
+
+# Visual properties: ID, target type and default value
+VISUAL_PROPERTIES = (
+    ('NODE_X_LOCATION', 'CyNode', 0.0),
+    ('NODE_Y_LOCATION', 'CyNode', 0.0),
+    ('NODE_Z_LOCATION', 'CyNode', 0.0),
+    ('NODE_SIZE', 'CyNode', 50.0),
+    ('NODE_WIDTH', 'CyNode', 60.0),
+    ('NODE_HEIGHT', 'CyNode', 30.0),
+    ('NODE_SHAPE', 'CyNode', 'ELLIPSE'),
+    ('NODE_FILL_COLOR', 'CyNode', '#C80000'),
+    ('NODE_PAINT', 'CyNode', '#787878'),
+    ('NODE_BORDER_PAINT', 'CyNode', '#000000'),
+    ('NODE_BORDER_WIDTH', 'CyNode', 0.0),
+    ('NODE_BORDER_TRANSPARENCY', 'CyNode', 255),
+    ('NODE_TRANSPARENCY', 'CyNode', 255),
+    ('NODE_LABEL', 'CyNode', ''),
+    ('NODE_LABEL_COLOR', 'CyNode', '#000000'),
+    ('NODE_LABEL_FONT_SIZE', 'CyNode', 12),
+    ('NODE_LABEL_TRANSPARENCY', 'CyNode', 255),
+    ('NODE_LABEL_WIDTH', 'CyNode', 200.0),
+    ('NODE_TOOLTIP', 'CyNode', ''),
+    ('NODE_SELECTED', 'CyNode', False),
+    ('NODE_SELECTED_PAINT', 'CyNode', '#FFFF00'),
+    ('NODE_VISIBLE', 'CyNode', True),
+    ('EDGE_WIDTH', 'CyEdge', 1.0),
+    ('EDGE_PAINT', 'CyEdge', '#323232'),
+    ('EDGE_STROKE_UNSELECTED_PAINT', 'CyEdge', '#404040'),
+    ('EDGE_STROKE_SELECTED_PAINT', 'CyEdge', '#FF0000'),
+    ('EDGE_LINE_TYPE', 'CyEdge', 'SOLID'),
+    ('EDGE_TRANSPARENCY', 'CyEdge', 255),
+    ('EDGE_LABEL', 'CyEdge', ''),
+    ('EDGE_LABEL_COLOR', 'CyEdge', '#000000'),
+    ('EDGE_LABEL_FONT_SIZE', 'CyEdge', 10),
+    ('EDGE_LABEL_WIDTH', 'CyEdge', 200.0),
+    ('EDGE_SOURCE_ARROW_SHAPE', 'CyEdge', 'NONE'),
+    ('EDGE_TARGET_ARROW_SHAPE', 'CyEdge', 'NONE'),
+    ('EDGE_CURVED', 'CyEdge', True),
+    ('EDGE_TOOLTIP', 'CyEdge', ''),
+    ('EDGE_SELECTED', 'CyEdge', False),
+    ('EDGE_VISIBLE', 'CyEdge', True),
+    ('NETWORK_BACKGROUND_PAINT', 'CyNetwork', '#FFFFFF'),
+    ('NETWORK_CENTER_X_LOCATION', 'CyNetwork', 0.0),
+    ('NETWORK_CENTER_Y_LOCATION', 'CyNetwork', 0.0),
+    ('NETWORK_HEIGHT', 'CyNetwork', 400.0),
+    ('NETWORK_WIDTH', 'CyNetwork', 400.0),
+    ('NETWORK_SCALE_FACTOR', 'CyNetwork', 1.0),
+    ('NETWORK_TITLE', 'CyNetwork', ''),
+)
+
+DEFAULTS = OrderedDict((vp, default) for vp, _, default in VISUAL_PROPERTIES)
+TARGETS = {'nodes': 'CyNode', 'edges': 'CyEdge', 'network': 'CyNetwork'}
+
+COLORS = {
+    'black': '#000000', 'white': '#FFFFFF', 'red': '#FF0000',
+    'green': '#008000', 'blue': '#0000FF', 'yellow': '#FFFF00',
+    'orange': '#FFA500', 'pink': '#FFC0CB', 'gray': '#808080',
+    'grey': '#808080', 'cyan': '#00FFFF', 'magenta': '#FF00FF'
+}
+
+LAYOUTS = ('circular', 'force-directed', 'grid')
+
+# Not a valid image, only the signature of each format
+IMAGES = {
+    'png': (b'\x89PNG\r\n\x1a\n', 'image/png'),
+    'svg': (b'<svg xmlns="http://www.w3.org/2000/svg"/>', 'image/svg+xml'),
+    'pdf': (b'%PDF-1.4\n%%EOF\n', 'application/pdf')
+}
+
+DEFAULT_COLUMNS = {
+    'node': ('SUID', 'shared name', 'name', 'selected'),
+    'edge': ('SUID', 'shared name', 'shared interaction', 'name',
+             'selected', 'interaction'),
+    'network': ('SUID', 'shared name', 'name', 'selected')
+}
+
+
+class HTTPError(Exception):
+
+    def __init__(self, status, message):
+        Exception.__init__(self, message)
+        self.status = status
+        self.message = message
+
+
+def column_type(value):
+    """ Get the Cytoscape column type of a value. """
+    if isinstance(value, bool):
+        return 'Boolean'
+    if isinstance(value, int):
+        return 'Integer' if -2 ** 31 <= value < 2 ** 31 else 'Long'
+    if isinstance(value, float):
+        return 'Double'
+    return 'String'
+
+
+def normalize(vp, value):
+    """ Convert a visual property value the way Cytoscape would. """
+    default = DEFAULTS.get(vp)
+    if ('PAINT' in vp or 'COLOR' in vp) and isinstance(value, str):
+        return COLORS.get(value.lower(), value).upper()
+    if isinstance(default, float) and not isinstance(value, bool):
+        return float(value)
+    if isinstance(default, int) and not isinstance(default, bool):
+        return int(value)
+    return value
+
+
+class Table(object):
+    """ A default table: column definitions and rows keyed by SUID. """
+
+    def __init__(self, type):
+        self.columns = OrderedDict()
+        self.rows = OrderedDict()
+        for name in DEFAULT_COLUMNS[type]:
+            if name == 'SUID':
+                self.add_column(name, 'Long', immutable=True)
+            elif name == 'selected':
+                self.add_column(name, 'Boolean')
+            else:
+                self.add_column(name, 'String')
+        self.columns['SUID']['primaryKey'] = True
+
+    def add_column(self, name, type, immutable=False, list_type=None):
+        if name in self.columns:
+            return
+        column = {'name': name, 'type': type, 'immutable': immutable,
+                  'primaryKey': False}
+        if list_type is not None:
+            column['type'] = 'List'
+            column['listType'] = list_type
+        self.columns[name] = column
+
+    def add_row(self, suid, values):
+        row = {'SUID': suid, 'selected': False}
+        self.rows[suid] = row
+        self.set_values(suid, values)
+        return row
+
+    def set_values(self, suid, values):
+        row = self.rows[suid]
+        for name, value in values.items():
+            if value is None or name == 'SUID':
+                continue
+            if isinstance(value, float) and math.isnan(value):
+                continue
+            if name not in self.columns:
+                if isinstance(value, list):
+                    list_type = column_type(value[0]) if value else 'String'
+                    self.add_column(name, 'List', list_type=list_type)
+                else:
+                    self.add_column(name, column_type(value))
+            elif self.columns[name]['type'] == 'Double' and \
+                    not isinstance(value, bool):
+                value = float(value)
+            row[name] = value
+
+    def values(self, name):
+        if name not in self.columns:
+            raise HTTPError(404, 'No such column: ' + name)
+        return [row.get(name) for row in self.rows.values()]
+
+
+class View(object):
+    """ Visual property values set for a network view. """
+
+    def __init__(self, suid):
+        self.suid = suid
+        self.values = {'nodes': {}, 'edges': {}, 'network': {}}
+
+    def get(self, group, suid):
+        values = self.values[group].get(suid, {})
+        return [{'visualProperty': vp, 'value': values.get(vp, default)}
+                for vp, target, default in VISUAL_PROPERTIES
+                if target == TARGETS[group]]
+
+    def set(self, group, suid, entries):
+        values = self.values[group].setdefault(suid, {})
+        for entry in entries:
+            vp = entry['visualProperty']
+            values[vp] = normalize(vp, entry['value'])
+
+
+class Network(object):
+
+    def __init__(self, suid, next_suid):
+        self.suid = suid
+        self.next_suid = next_suid
+        self.tables = {type: Table(type) for type in DEFAULT_COLUMNS}
+        self.tables['network'].add_row(suid, {})
+        self.edges = OrderedDict()
+        self.views = OrderedDict()
+
+    @property
+    def nodes(self):
+        return self.tables['node'].rows
+
+    def add_node(self, name, values=None):
+        suid = self.next_suid()
+        data = dict(values or {})
+        data.setdefault('name', name)
+        data.setdefault('shared name', data['name'])
+        self.tables['node'].add_row(suid, data)
+        return suid
+
+    def add_edge(self, source, target, interaction='-', directed=True,
+                 values=None):
+        if source not in self.nodes or target not in self.nodes:
+            raise HTTPError(500, 'Source or target node does not exist.')
+        suid = self.next_suid()
+        name = '%s (%s) %s' % (self.nodes[source].get('name'), interaction,
+                               self.nodes[target].get('name'))
+        data = dict(values or {})
+        data.update({'interaction': interaction,
+                     'shared interaction': interaction})
+        data.setdefault('name', name)
+        data.setdefault('shared name', data['name'])
+        self.tables['edge'].add_row(suid, data)
+        self.edges[suid] = (source, target, directed)
+        return suid
+
+    def delete_node(self, suid):
+        if suid not in self.nodes:
+            return False
+        for edge in self.adjacent_edges(suid):
+            self.delete_edge(edge)
+        del self.nodes[suid]
+        for view in self.views.values():
+            view.values['nodes'].pop(suid, None)
+        return True
+
+    def delete_edge(self, suid):
+        if suid not in self.edges:
+            return False
+        del self.edges[suid]
+        del self.tables['edge'].rows[suid]
+        for view in self.views.values():
+            view.values['edges'].pop(suid, None)
+        return True
+
+    def adjacent_edges(self, node):
+        return [suid for suid, (source, target, _) in self.edges.items()
+                if node in (source, target)]
+
+    def neighbors(self, node):
+        result = []
+        for source, target, _ in self.edges.values():
+            if source == node:
+                result.append(target)
+            elif target == node:
+                result.append(source)
+        return list(OrderedDict.fromkeys(result))
+
+    def to_cyjs(self, view=None):
+        nodes = []
+        for suid, row in self.nodes.items():
+            data = dict(row)
+            data['id'] = str(suid)
+            node = {'data': data}
+            if view is not None:
+                values = view.values['nodes'].get(suid, {})
+                node['position'] = {
+                    'x': values.get('NODE_X_LOCATION', 0.0),
+                    'y': values.get('NODE_Y_LOCATION', 0.0)
+                }
+            nodes.append(node)
+        edges = []
+        for suid, (source, target, _) in self.edges.items():
+            data = dict(self.tables['edge'].rows[suid])
+            data.update({'id': str(suid), 'source': str(source),
+                         'target': str(target)})
+            edges.append({'data': data})
+        return {
+            'format_version': '1.0',
+            'generated_by': 'cyrest_server',
+            'target_cytoscapejs_version': '~2.1',
+            'data': dict(self.tables['network'].rows[self.suid]),
+            'elements': {'nodes': nodes, 'edges': edges}
+        }
+
+
+class Style(object):
+
+    def __init__(self, name):
+        self.name = name
+        self.defaults = OrderedDict(DEFAULTS)
+        self.mappings = OrderedDict()
+
+    def to_json(self):
+        return {
+            'title': self.name,
+            'defaults': [{'visualProperty': vp, 'value': value}
+                         for vp, value in self.defaults.items()],
+            'mappings': list(self.mappings.values())
+        }
+
+    def to_cyjs(self):
+        groups = {'CyNode': {}, 'CyEdge': {}}
+        for vp, target, _ in VISUAL_PROPERTIES:
+            if target in groups:
+                groups[target][vp.lower()] = self.defaults[vp]
+        return [{
+            'format_version': '1.0',
+            'generated_by': 'cyrest_server',
+            'target_cytoscapejs_version': '~2.1',
+            'title': self.name,
+            'style': [{'selector': 'node', 'css': groups['CyNode']},
+                      {'selector': 'edge', 'css': groups['CyEdge']}]
+        }]
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    # Headers and body are written separately, Nagle's algorithm would
+    # hold back the body until the client acknowledges the headers.
+    disable_nagle_algorithm = True
+
+    def setup(self):
+        BaseHTTPRequestHandler.setup(self)
+        self.server.connections.add(self.connection)
+        self.server.app.count_connection()
+
+    def finish(self):
+        self.server.connections.discard(self.connection)
+        BaseHTTPRequestHandler.finish(self)
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        self.__handle('GET')
+
+    def do_POST(self):
+        self.__handle('POST')
+
+    def do_PUT(self):
+        self.__handle('PUT')
+
+    def do_DELETE(self):
+        self.__handle('DELETE')
+
+    def __read_body(self):
+        if self.headers.get('Transfer-Encoding', '').lower() == 'chunked':
+            chunks = []
+            while True:
+                size = int(self.rfile.readline().split(b';')[0], 16)
+                if size == 0:
+                    self.rfile.readline()
+                    break
+                chunks.append(self.rfile.read(size))
+                self.rfile.readline()
+            body = b''.join(chunks)
+        else:
+            body = self.rfile.read(int(self.headers.get('Content-Length', 0)))
+        wire_size = len(body)
+        encoding = self.headers.get('Content-Encoding', '').lower()
+        if encoding == 'gzip':
+            body = gzip.GzipFile(fileobj=io.BytesIO(body)).read()
+        elif encoding == 'deflate':
+            body = zlib.decompress(body)
+        return body, wire_size
+
+    def __encode(self, content):
+        app = self.server.app
+        accepted = [e.split(';')[0].strip() for e in
+                    self.headers.get('Accept-Encoding', '').split(',')]
+        if not app.compress or len(content) < app.compress_threshold or \
+                'gzip' not in accepted:
+            return content, None
+        compressor = zlib.compressobj(1, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+        return compressor.compress(content) + compressor.flush(), 'gzip'
+
+    def __handle(self, method):
+        body, wire_size = self.__read_body()
+        app = self.server.app
+        if app.latency:
+            time.sleep(app.latency)
+        app.count_bytes(received=wire_size)
+        parts = urlsplit(self.path)
+        try:
+            status, content, content_type = app.handle(
+                method, unquote(parts.path), dict(parse_qsl(parts.query)),
+                body)
+        except HTTPError as exc:
+            status = exc.status
+            content = json.dumps({'message': exc.message}).encode('utf-8')
+            content_type = 'application/json'
+        except Exception as exc:
+            status = 500
+            content = json.dumps({'message': repr(exc)}).encode('utf-8')
+            content_type = 'application/json'
+        content, encoding = self.__encode(content)
+        if app.bandwidth:
+            time.sleep(float(wire_size + len(content)) / app.bandwidth)
+        app.count_bytes(sent=len(content))
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        if encoding:
+            self.send_header('Content-Encoding', encoding)
+        self.send_header('Content-Length', str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+
+class _HTTPServer(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+class CyRestServer(object):
+    """
+    Mock CyREST server running in a background thread.
+
+    :param port: Port to listen on, 0 picks a free port. The views and
+        styles of py2cytoscape.data always use port 1234.
+    :param latency: Seconds every request is delayed by.
+    :param bandwidth: Bytes per second the request and response bodies are
+        transferred at, None for no limit.
+    :param compress: If True, gzip responses of at least compress_threshold
+        bytes for clients accepting it.
+    """
+
+    def __init__(self, port=PORT, latency=0.0, bandwidth=None,
+                 compress=False, compress_threshold=1024):
+        self.latency = latency
+        self.bandwidth = bandwidth
+        self.compress = compress
+        self.compress_threshold = compress_threshold
+        self.commands = {
+            'command/sleep': self.__command_sleep,
+            'network/delete': self.__command_delete,
+            'network/get attribute': self.__command_get_attribute,
+            'network/set current': self.__command_set_current,
+            'session/new': self.__command_new_session,
+            'view/fit content': lambda params: {},
+            'view/export': self.__command_export
+        }
+        self.__lock = threading.RLock()
+        self.__httpd = _HTTPServer(('localhost', port), _Handler)
+        self.__httpd.app = self
+        self.__httpd.connections = set()
+        self.port = self.__httpd.server_address[1]
+        self.url = 'http://localhost:%d/%s/' % (self.port, VERSION)
+        self.__thread = None
+        self.reset()
+
+    def reset(self):
+        """ Delete all networks and styles. """
+        with self.__lock:
+            self.__suids = itertools.count(52)
+            self.networks = OrderedDict()
+            self.styles = OrderedDict([('default', Style('default'))])
+            self.current = None
+            self.request_count = 0
+            self.connection_count = 0
+            self.bytes_received = 0
+            self.bytes_sent = 0
+
+    def start(self):
+        self.__thread = threading.Thread(target=self.__httpd.serve_forever)
+        self.__thread.daemon = True
+        self.__thread.start()
+        return self
+
+    def stop(self):
+        """ Stop serving and drop all open connections. """
+        self.__httpd.shutdown()
+        self.__httpd.server_close()
+        for connection in list(self.__httpd.connections):
+            try:
+                connection.shutdown(socket.SHUT_RDWR)
+            except (OSError, socket.error):
+                pass
+        self.__thread.join()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+    def count_connection(self):
+        with self.__lock:
+            self.connection_count += 1
+
+    def count_bytes(self, received=0, sent=0):
+        """ Count body bytes as they were transferred. """
+        with self.__lock:
+            self.bytes_received += received
+            self.bytes_sent += sent
+
+    def next_suid(self):
+        return next(self.__suids)
+
+    def handle(self, method, path, params, body):
+        """
+        Answer a request.
+
+        :return: Tuple of status code, body as bytes and content type.
+        """
+        prefix = '/' + VERSION
+        if not path.startswith(prefix):
+            raise HTTPError(404, 'Not found: ' + path)
+        path = path[len(prefix):].strip('/')
+        with self.__lock:
+            self.request_count += 1
+            for route_method, pattern, handler in self.__routes():
+                if route_method != method:
+                    continue
+                match = re.match(pattern + '$', path)
+                if match is None:
+                    continue
+                data = json.loads(body.decode('utf-8')) if body else None
+                result = handler(params, data, *match.groups())
+                if isinstance(result, tuple):
+                    return result
+                if result is None:
+                    return 200, b'', 'application/json'
+                return 200, json.dumps(result).encode('utf-8'), \
+                    'application/json'
+        raise HTTPError(404, 'Not found: ' + method + ' ' + path)
+
+    def __routes(self):
+        net = r'networks/(\d+)'
+        table = net + r'/tables/default(node|edge|network)'
+        view = net + r'/views/(\d+|first)'
+        style = r'styles/([^/]+?)'
+        return (
+            ('GET', '', self.__status),
+            ('GET', 'version', self.__status),
+            ('GET', 'networks', self.__get_networks),
+            ('GET', r'networks\.json', self.__get_networks_json),
+            ('POST', 'networks', self.__create_network),
+            ('DELETE', 'networks', self.__delete_networks),
+            ('GET', 'networks/count', self.__count_networks),
+            ('GET', net, self.__get_network),
+            ('DELETE', net, self.__delete_network),
+            ('GET', net + r'/(nodes|edges)', self.__get_elements),
+            ('GET', net + r'/(nodes|edges)/count', self.__count_elements),
+            ('POST', net + '/nodes', self.__add_nodes),
+            ('POST', net + '/edges', self.__add_edges),
+            ('DELETE', net + r'/(nodes|edges)', self.__delete_elements),
+            ('GET', net + r'/(nodes|edges)/(\d+)', self.__get_element),
+            ('DELETE', net + r'/(nodes|edges)/(\d+)', self.__delete_element),
+            ('GET', net + r'/nodes/(\d+)/neighbors', self.__get_neighbors),
+            ('GET', net + r'/nodes/(\d+)/adjEdges', self.__get_adj_edges),
+            ('GET', net + r'/edges/(\d+)/(source|target)', self.__get_end),
+            ('GET', table, self.__get_table),
+            ('GET', table + r'\.(csv|tsv)', self.__get_table_text),
+            ('PUT', table, self.__update_table),
+            ('GET', table + '/rows', self.__get_rows),
+            ('GET', table + r'/rows/(\d+)', self.__get_row),
+            ('GET', table + r'/rows/(\d+)/(.+)', self.__get_cell),
+            ('GET', table + '/columns', self.__get_columns),
+            ('POST', table + '/columns', self.__create_column),
+            ('GET', table + '/columns/(.+)', self.__get_column),
+            ('DELETE', table + '/columns/(.+)', self.__delete_column),
+            ('GET', net + '/views', self.__get_views),
+            ('GET', net + '/views/count', self.__count_views),
+            ('GET', view, self.__get_view),
+            ('GET', view + r'\.(png|svg|pdf)', self.__get_image),
+            ('GET', view + '/network', self.__get_network_view),
+            ('PUT', view + '/network', self.__update_network_view),
+            ('GET', view + '/(nodes|edges)', self.__get_element_views),
+            ('PUT', view + '/(nodes|edges)', self.__update_element_views),
+            ('GET', view + r'/(nodes|edges)/(\d+)', self.__get_element_view),
+            ('PUT', view + r'/(nodes|edges)/(\d+)',
+             self.__update_element_view),
+            ('GET', view + r'/(nodes|edges)/(\d+)/(\w+)', self.__get_vp),
+            ('GET', 'styles', self.__get_styles),
+            ('POST', 'styles', self.__create_style),
+            ('DELETE', 'styles', self.__delete_styles),
+            ('GET', 'styles/visualproperties', self.__get_visual_properties),
+            ('GET', style + r'\.json', self.__get_style_cyjs),
+            ('GET', style, self.__get_style),
+            ('DELETE', style, self.__delete_style),
+            ('GET', style + '/defaults', self.__get_defaults),
+            ('PUT', style + '/defaults', self.__update_defaults),
+            ('GET', style + r'/defaults/(\w+)', self.__get_default),
+            ('GET', style + '/mappings', self.__get_mappings),
+            ('POST', style + '/mappings', self.__create_mappings),
+            ('DELETE', style + '/mappings', self.__delete_mappings),
+            ('GET', style + r'/mappings/(\w+)', self.__get_mapping),
+            ('DELETE', style + r'/mappings/(\w+)', self.__delete_mapping),
+            ('GET', 'apply/layouts', lambda params, data: list(LAYOUTS)),
+            ('GET', r'apply/layouts/([\w-]+)/(\d+)', self.__apply_layout),
+            ('GET', r'apply/styles/([^/]+)/(\d+)', self.__apply_style),
+            ('GET', r'apply/(fit|edgebundling)/(\d+)', self.__apply),
+            ('GET', 'session', self.__open_session),
+            ('POST', 'session', self.__save_session),
+            ('DELETE', 'session', self.__delete_session),
+            ('POST', 'commands/(.+)', self.__run_command),
+            ('GET', 'commands/(.+)', self.__run_command_text),
+        )
+
+    # Networks
+
+    def __status(self, params, data):
+        return {'apiVersion': VERSION, 'cytoscapeVersion': '3.6.0',
+                'numberOfCores': os.cpu_count() or 1,
+                'memoryStatus': {'usedMemory': 0, 'freeMemory': 0,
+                                 'totalMemory': 0, 'maxMemory': 0}}
+
+    def __network(self, suid):
+        suid = int(suid)
+        if suid not in self.networks:
+            raise HTTPError(404, 'Network not found: ' + str(suid))
+        return self.networks[suid]
+
+    def __new_network(self, name):
+        network = Network(self.next_suid(), self.next_suid)
+        network.tables['network'].set_values(
+            network.suid, {'name': name, 'shared name': name})
+        view = View(self.next_suid())
+        network.views[view.suid] = view
+        self.networks[network.suid] = network
+        self.current = network.suid
+        return network
+
+    def __get_networks(self, params, data):
+        return list(self.networks)
+
+    def __get_networks_json(self, params, data):
+        return [network.to_cyjs() for network in self.networks.values()]
+
+    def __count_networks(self, params, data):
+        return {'count': len(self.networks)}
+
+    def __create_network(self, params, data):
+        if params.get('source') == 'url':
+            return [{'source': location,
+                     'networkSUID': [self.__load_network(location).suid]}
+                    for location in data]
+        network = self.__new_network(data.get('data', {}).get('name',
+                                                              'Network'))
+        network_data = dict(data.get('data', {}))
+        network_data.pop('SUID', None)
+        network.tables['network'].set_values(network.suid, network_data)
+
+        elements = data.get('elements', {})
+        ids = {}
+        for node in elements.get('nodes', []):
+            values = dict(node['data'])
+            name = values.get('name', values.get('id'))
+            ids[values.get('id')] = network.add_node(name, values)
+        for edge in elements.get('edges', []):
+            values = dict(edge['data'])
+            source = ids.get(values.pop('source'))
+            target = ids.get(values.pop('target'))
+            interaction = values.pop('interaction', '-')
+            network.add_edge(source, target, interaction, values=values)
+        return {'networkSUID': network.suid}
+
+    def __load_network(self, location):
+        # Only local SIF files are read, other locations give empty networks
+        network = self.__new_network(location.rsplit('/', 1)[-1])
+        path = location[len('file://'):] if location.startswith('file://') \
+            else None
+        if path is None or not path.endswith('.sif'):
+            return network
+        names = {}
+
+        def node(name):
+            if name not in names:
+                names[name] = network.add_node(name)
+            return names[name]
+
+        with open(path) as f:
+            for line in f:
+                fields = line.rstrip('\n').split('\t' if '\t' in line
+                                                else None)
+                if not fields or not fields[0]:
+                    continue
+                source = node(fields[0])
+                for target in fields[2:]:
+                    network.add_edge(source, node(target), fields[1])
+        return network
+
+    def __delete_networks(self, params, data):
+        self.networks.clear()
+        self.current = None
+
+    def __get_network(self, params, data, suid):
+        return self.__network(suid).to_cyjs()
+
+    def __delete_network(self, params, data, suid):
+        self.networks.pop(int(suid), None)
+
+    # Nodes and edges
+
+    def __get_elements(self, params, data, suid, group):
+        network = self.__network(suid)
+        return list(network.nodes if group == 'nodes' else network.edges)
+
+    def __count_elements(self, params, data, suid, group):
+        return {'count': len(self.__get_elements(params, data, suid, group))}
+
+    def __add_nodes(self, params, data, suid):
+        network = self.__network(suid)
+        return [{'name': name, 'SUID': network.add_node(name)}
+                for name in data]
+
+    def __add_edges(self, params, data, suid):
+        network = self.__network(suid)
+        result = []
+        for edge in data:
+            edge_suid = network.add_edge(edge['source'], edge['target'],
+                                         edge.get('interaction', '-'),
+                                         edge.get('directed', True))
+            result.append({'SUID': edge_suid, 'source': edge['source'],
+                           'target': edge['target']})
+        return result
+
+    def __delete_elements(self, params, data, suid, group):
+        network = self.__network(suid)
+        for element in list(self.__get_elements(params, data, suid, group)):
+            if group == 'nodes':
+                network.delete_node(element)
+            else:
+                network.delete_edge(element)
+
+    def __get_element(self, params, data, suid, group, element):
+        network = self.__network(suid)
+        rows = network.tables[group[:-1]].rows
+        if int(element) not in rows:
+            raise HTTPError(404, 'Not found: ' + element)
+        return {'data': rows[int(element)]}
+
+    def __delete_element(self, params, data, suid, group, element):
+        network = self.__network(suid)
+        if group == 'nodes':
+            network.delete_node(int(element))
+        else:
+            network.delete_edge(int(element))
+
+    def __get_neighbors(self, params, data, suid, node):
+        return self.__network(suid).neighbors(int(node))
+
+    def __get_adj_edges(self, params, data, suid, node):
+        return self.__network(suid).adjacent_edges(int(node))
+
+    def __get_end(self, params, data, suid, edge, end):
+        source, target, _ = self.__network(suid).edges[int(edge)]
+        return {end: source if end == 'source' else target}
+
+    # Tables
+
+    def __table(self, suid, type):
+        return self.__network(suid).tables[type]
+
+    def __get_table(self, params, data, suid, type):
+        return {'SUID': int(suid), 'title': type.title() + ' Table',
+                'public': True, 'mutable': 'MUTABLE', 'primaryKey': 'SUID',
+                'rows': list(self.__table(suid, type).rows.values())}
+
+    def __get_table_text(self, params, data, suid, type, format):
+        table = self.__table(suid, type)
+        out = io.StringIO()
+        writer = csv.writer(out, delimiter=',' if format == 'csv' else '\t')
+        writer.writerow(list(table.columns))
+        for row in table.rows.values():
+            writer.writerow([row.get(name, '') for name in table.columns])
+        return 200, out.getvalue().encode('utf-8'), 'text/plain'
+
+    def __update_table(self, params, data, suid, type):
+        table = self.__table(suid, type)
+        key = data.get('key', 'name')
+        data_key = data.get('dataKey', key)
+        index = {}
+        for row_suid, row in table.rows.items():
+            index.setdefault(row.get(key), []).append(row_suid)
+        for values in data['data']:
+            values = dict(values)
+            value = values.pop(data_key, None)
+            if key != data_key:
+                values.pop(key, None)
+            for row_suid in index.get(value, []):
+                table.set_values(row_suid, values)
+
+    def __get_rows(self, params, data, suid, type):
+        return list(self.__table(suid, type).rows.values())
+
+    def __get_row(self, params, data, suid, type, row):
+        rows = self.__table(suid, type).rows
+        if int(row) not in rows:
+            raise HTTPError(404, 'Row not found: ' + row)
+        return rows[int(row)]
+
+    def __get_cell(self, params, data, suid, type, row, column):
+        value = self.__get_row(params, data, suid, type, row).get(column)
+        return 200, str(value).encode('utf-8'), 'text/plain'
+
+    def __get_columns(self, params, data, suid, type):
+        return list(self.__table(suid, type).columns.values())
+
+    def __create_column(self, params, data, suid, type):
+        table = self.__table(suid, type)
+        list_type = data.get('type', 'String') if data.get('list') else None
+        table.add_column(data['name'], data.get('type', 'String'),
+                         data.get('immutable', False), list_type)
+
+    def __get_column(self, params, data, suid, type, column):
+        return {'name': column,
+                'values': self.__table(suid, type).values(column)}
+
+    def __delete_column(self, params, data, suid, type, column):
+        table = self.__table(suid, type)
+        if column in table.columns and column != 'SUID':
+            del table.columns[column]
+            for row in table.rows.values():
+                row.pop(column, None)
+
+    # Views
+
+    def __view(self, suid, view):
+        network = self.__network(suid)
+        if not network.views:
+            raise HTTPError(404, 'No view for network: ' + suid)
+        if view == 'first':
+            return network, next(iter(network.views.values()))
+        if int(view) not in network.views:
+            raise HTTPError(404, 'View not found: ' + view)
+        return network, network.views[int(view)]
+
+    def __get_views(self, params, data, suid):
+        return list(self.__network(suid).views)
+
+    def __count_views(self, params, data, suid):
+        return {'count': len(self.__network(suid).views)}
+
+    def __get_view(self, params, data, suid, view):
+        network, view = self.__view(suid, view)
+        return network.to_cyjs(view)
+
+    def __get_image(self, params, data, suid, view, format):
+        network, view = self.__view(suid, view)
+        signature, content_type = IMAGES[format]
+        # Bigger networks make bigger files
+        padding = b'\0' * (len(network.nodes) + len(network.edges))
+        return 200, signature + padding, content_type
+
+    def __get_network_view(self, params, data, suid, view):
+        network, view = self.__view(suid, view)
+        return view.get('network', network.suid)
+
+    def __update_network_view(self, params, data, suid, view):
+        network, view = self.__view(suid, view)
+        view.set('network', network.suid, data)
+
+    def __get_element_views(self, params, data, suid, view, group):
+        network, view = self.__view(suid, view)
+        elements = network.nodes if group == 'nodes' else network.edges
+        return [{'SUID': element, 'view': view.get(group, element)}
+                for element in elements]
+
+    def __update_element_views(self, params, data, suid, view, group):
+        network, view = self.__view(suid, view)
+        elements = network.nodes if group == 'nodes' else network.edges
+        for entry in data:
+            if entry['SUID'] in elements:
+                view.set(group, entry['SUID'], entry['view'])
+
+    def __get_element_view(self, params, data, suid, view, group, element):
+        network, view = self.__view(suid, view)
+        return view.get(group, int(element))
+
+    def __update_element_view(self, params, data, suid, view, group,
+                              element):
+        network, view = self.__view(suid, view)
+        view.set(group, int(element), data)
+
+    def __get_vp(self, params, data, suid, view, group, element, vp):
+        for entry in self.__get_element_view(params, data, suid, view,
+                                             group, element):
+            if entry['visualProperty'] == vp:
+                return entry
+        raise HTTPError(404, 'No such visual property: ' + vp)
+
+    # Styles
+
+    def __style(self, name):
+        if name not in self.styles:
+            raise HTTPError(404, 'Style not found: ' + name)
+        return self.styles[name]
+
+    def __get_styles(self, params, data):
+        return list(self.styles)
+
+    def __create_style(self, params, data):
+        style = Style(data['title'])
+        for entry in data.get('defaults', []):
+            vp = entry['visualProperty']
+            style.defaults[vp] = normalize(vp, entry['value'])
+        for mapping in data.get('mappings', []):
+            style.mappings[mapping['visualProperty']] = mapping
+        self.styles[style.name] = style
+        return {'title': style.name}
+
+    def __delete_styles(self, params, data):
+        for name in list(self.styles):
+            if name != 'default':
+                del self.styles[name]
+
+    def __get_visual_properties(self, params, data):
+        return [{'visualProperty': vp,
+                 'name': vp.replace('_', ' ').title(),
+                 'targetDataType': target,
+                 'default': default}
+                for vp, target, default in VISUAL_PROPERTIES]
+
+    def __get_style(self, params, data, name):
+        return self.__style(name).to_json()
+
+    def __get_style_cyjs(self, params, data, name):
+        return self.__style(name).to_cyjs()
+
+    def __delete_style(self, params, data, name):
+        if name != 'default':
+            self.styles.pop(name, None)
+
+    def __get_defaults(self, params, data, name):
+        return {'defaults': self.__style(name).to_json()['defaults']}
+
+    def __update_defaults(self, params, data, name):
+        style = self.__style(name)
+        for entry in data:
+            vp = entry['visualProperty']
+            style.defaults[vp] = normalize(vp, entry['value'])
+
+    def __get_default(self, params, data, name, vp):
+        defaults = self.__style(name).defaults
+        if vp not in defaults:
+            raise HTTPError(404, 'No such visual property: ' + vp)
+        return {'visualProperty': vp, 'value': defaults[vp]}
+
+    def __get_mappings(self, params, data, name):
+        return list(self.__style(name).mappings.values())
+
+    def __create_mappings(self, params, data, name):
+        style = self.__style(name)
+        for mapping in data:
+            style.mappings[mapping['visualProperty']] = mapping
+
+    def __delete_mappings(self, params, data, name):
+        self.__style(name).mappings.clear()
+
+    def __get_mapping(self, params, data, name, vp):
+        mappings = self.__style(name).mappings
+        if vp not in mappings:
+            raise HTTPError(404, 'No mapping for: ' + vp)
+        return mappings[vp]
+
+    def __delete_mapping(self, params, data, name, vp):
+        self.__style(name).mappings.pop(vp, None)
+
+    # Apply
+
+    def __apply_layout(self, params, data, name, suid):
+        if name not in LAYOUTS:
+            raise HTTPError(404, 'No such layout: ' + name)
+        network = self.__network(suid)
+        width = int(math.ceil(math.sqrt(len(network.nodes)))) or 1
+        for view in network.views.values():
+            for i, node in enumerate(network.nodes):
+                view.set('nodes', node, [
+                    {'visualProperty': 'NODE_X_LOCATION',
+                     'value': 100.0 * (i % width)},
+                    {'visualProperty': 'NODE_Y_LOCATION',
+                     'value': 100.0 * (i // width)}
+                ])
+        return {'message': 'Layout finished.'}
+
+    def __apply_style(self, params, data, name, suid):
+        self.__style(name)
+        self.__network(suid)
+        return {'message': 'Visual Style applied.'}
+
+    def __apply(self, params, data, command, suid):
+        self.__network(suid)
+        return {'message': command + ' finished.'}
+
+    # Session
+
+    def __open_session(self, params, data):
+        return {'file': params.get('file')}
+
+    def __save_session(self, params, data):
+        return {'file': params.get('file')}
+
+    def __delete_session(self, params, data):
+        self.__delete_networks(params, data)
+        self.__delete_styles(params, data)
+        return {'message': 'New session created.'}
+
+    # Commands
+
+    def __run_command(self, params, data, command):
+        if command not in self.commands:
+            raise HTTPError(404, 'Failed to find command: ' + command)
+        try:
+            result = self.commands[command](data or {})
+        except (KeyError, ValueError) as exc:
+            return 500, json.dumps({'data': {}, 'errors': [
+                {'status': 500, 'message': str(exc)}]}).encode('utf-8'), \
+                'application/json'
+        return {'data': result, 'errors': []}
+
+    def __run_command_text(self, params, data, command):
+        if command not in self.commands:
+            raise HTTPError(404, 'Failed to find command: ' + command)
+        result = self.commands[command](params)
+        return 200, (json.dumps(result) + '\nFinished').encode('utf-8'), \
+            'text/plain'
+
+    def __network_param(self, params):
+        network = str(params.get('network', 'current'))
+        if network.lower() in ('', 'current'):
+            if self.current is None:
+                raise ValueError('No current network.')
+            return self.networks[self.current]
+        if network.startswith('SUID:'):
+            return self.__network(network[len('SUID:'):])
+        for candidate in self.networks.values():
+            if candidate.tables['network'].rows[candidate.suid].get(
+                    'name') == network:
+                return candidate
+        raise ValueError('Network not found: ' + network)
+
+    def __command_sleep(self, params):
+        time.sleep(float(params.get('duration', 0)))
+        return {}
+
+    def __command_delete(self, params):
+        network = self.__network_param(params)
+        for key, delete in (('edgeList', network.delete_edge),
+                            ('nodeList', network.delete_node)):
+            for item in str(params.get(key, '')).split(','):
+                if item.startswith('SUID:'):
+                    delete(int(item[len('SUID:'):]))
+        return {}
+
+    def __command_get_attribute(self, params):
+        network = self.__network_param(params)
+        row = network.tables['network'].rows[network.suid]
+        columns = params.get('columnList', 'all')
+        if columns == 'all':
+            return [dict(row)]
+        return [{column: row.get(column)
+                 for column in str(columns).split(',')}]
+
+    def __command_set_current(self, params):
+        self.current = self.__network_param(params).suid
+        return {}
+
+    def __command_new_session(self, params):
+        self.__delete_session(params, None)
+        return {}
+
+    def __command_export(self, params):
+        format = str(params.get('options', 'PNG')).lower()
+        path = params['OutputFile'] + '.' + format
+        signature = IMAGES.get(format, (b'{}', None))[0]
+        with open(path, 'wb') as f:
+            f.write(signature)
+        return {'file': path}
+
+
+def serve(port=PORT, latency=0.0):
+    """
+    Start a mock server for the tests of a module, unless the environment
+    variable CYREST_LIVE is set to test against a running Cytoscape.
+
+    :return: Started CyRestServer, or None.
+    """
+    if os.environ.get('CYREST_LIVE'):
+        return None
+    return CyRestServer(port=port, latency=latency).start()
+
+
+def module_fixture(port=PORT, latency=0.0):
+    """
+    setUpModule and tearDownModule functions running serve() for the tests
+    of a module:
+
+        setUpModule, tearDownModule = cyrest_server.module_fixture()
+    """
+    servers = []
+
+    def setUpModule():
+        servers.append(serve(port=port, latency=latency))
+
+    def tearDownModule():
+        server = servers.pop()
+        if server is not None:
+            server.stop()
+
+    return setUpModule, tearDownModule
@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+"""
+Stand-in for requests.Session in the unit tests.
+
+FakeSession records every request and answers it with respond(), which the
+tests override to serve the part of CyREST they need:
+
+    class NodeSession(FakeSession):
+        def respond(self, method, url, body):
+            return [1, 2, 3]
+
+Use the in-process server in tests.cyrest_server when a test needs more
+than a couple of canned answers.
+"""
+import threading
+from json import dumps, loads
+
+import requests
+
+
+class FakeResponse(object):
+    """ Response with a JSON body, or raw content if given. """
+
+    def __init__(self, body=None, status_code=200, content=None):
+        if content is None:
+            content = dumps(body).encode('utf-8')
+        self.content = content
+        self.status_code = status_code
+        self.text = content.decode('utf-8', 'replace')
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.exceptions.HTTPError(
+                'HTTP ' + str(self.status_code), response=self)
+
+    def json(self, **kwargs):
+        return loads(self.text)
+
+    def iter_content(self, chunk_size=1):
+        for i in range(0, len(self.content), chunk_size):
+            yield self.content[i:i + chunk_size]
+
+    def close(self):
+        pass
+
+
+class FakeSession(object):
+    """
+    Records the requests sent, as (method, url) in requests and the decoded
+    bodies in bodies, and answers them with respond().
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.requests = []
+        self.bodies = []
+
+    def respond(self, method, url, body):
+        """
+        Answer a request.
+
+        :return: A FakeResponse, or the JSON body of a successful one.
+        """
+        return None
+
+    def request(self, method, url, data=None, json=None, **kwargs):
+        if data is not None:
+            if not isinstance(data, (bytes, str)):
+                data = b''.join(data)
+            json = loads(data)
+        with self.lock:
+            self.requests.append((method, url))
+            self.bodies.append(json)
+        response = self.respond(method, url, json)
+        if not isinstance(response, FakeResponse):
+            response = FakeResponse(response)
+        return response
+
+    def get(self, url, **kwargs):
+        return self.request('get', url, **kwargs)
+
+    def post(self, url, **kwargs):
+        return self.request('post', url, **kwargs)
+
+    def put(self, url, **kwargs):
+        return self.request('put', url, **kwargs)
+
+    def delete(self, url, **kwargs):
+        return self.request('delete', url, **kwargs)
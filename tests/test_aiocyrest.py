@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+import time
+import unittest
+from unittest import mock
+
+from py2cytoscape.cyrest.aiocyrest import aiocyclient
+from py2cytoscape.data.cyrest_client import CyRestClient
+from py2cytoscape.transport import Transport
+from tests.cyrest_server import CyRestServer
+
+
+class AioCyClientTests(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.server = CyRestServer(port=0).start()
+
+    def tearDown(self):
+        self.server.stop()
+
+    async def test_run(self):
+        async with aiocyclient(port=self.server.port) as cytoscape:
+            self.assertEqual(3, await cytoscape.run(sum, [1, 2]))
+
+    async def test_namespace_calls(self):
+        network = CyRestClient(port=self.server.port).network.create(
+            name='aio')
+        async with aiocyclient(port=self.server.port) as cytoscape:
+            rows = await cytoscape.network.get_attribute(
+                network='SUID:' + str(network.get_id()), columnList='name')
+        self.assertEqual([{'name': 'aio'}], rows)
+
+    async def test_calls_run_concurrently(self):
+        network = CyRestClient(port=self.server.port).network.create()
+        self.server.latency = 0.2
+        async with aiocyclient(port=self.server.port,
+                               max_concurrency=4) as cytoscape:
+            start = time.time()
+            await asyncio.gather(*[cytoscape.network.get_attribute(
+                network='SUID:' + str(network.get_id()))
+                for _ in range(4)])
+            elapsed = time.time() - start
+        self.assertGreaterEqual(elapsed, 0.2)
+        self.assertLess(elapsed, 0.6)
+
+    async def test_exit_closes_the_connections(self):
+        with mock.patch.object(Transport, 'close') as close:
+            async with aiocyclient(port=self.server.port) as cytoscape:
+                await cytoscape.run(sum, [])
+        close.assert_called_once_with()
+
+    async def test_exit_does_not_block_the_loop(self):
+        ticks = []
+
+        async def tick():
+            while True:
+                ticks.append(time.time())
+                await asyncio.sleep(0.01)
+
+        cytoscape = aiocyclient(port=self.server.port)
+        pending = asyncio.ensure_future(cytoscape.command.sleep(duration=0.3))
+        await asyncio.sleep(0.05)
+        ticker = asyncio.ensure_future(tick())
+        # Waits for the pending call while the ticker keeps running
+        await cytoscape.__aexit__(None, None, None)
+        ticker.cancel()
+        await pending
+        self.assertGreater(len(ticks), 5)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+
+import time
+import unittest
+
+import requests
+
+from tests import benchmarks
+from tests.cyrest_server import CyRestServer
+
+
+class BenchmarkTests(unittest.TestCase):
+
+    def test_benchmarks_run(self):
+        with CyRestServer() as server:
+            results = benchmarks.run_benchmarks(server, sizes=[20], repeat=1)
+
+        names = [result['name'] for result in results]
+        self.assertIn('create_from_dataframe', names)
+        self.assertIn('view_batch_update', names)
+        for result in results:
+            self.assertEqual(20, result['size'])
+            self.assertGreater(result['best'], 0)
+
+    def test_compression(self):
+        with CyRestServer() as server:
+            results = benchmarks.compression(
+                server, sizes=[200], repeat=1, names=['view_batch_update'],
+                threshold=0)
+
+        self.assertEqual(1, len(results))
+        self.assertLess(results[0]['sent_compressed'], results[0]['sent'])
+
+    def test_compare(self):
+        baseline = [{'name': 'a', 'size': 10, 'best': 2.0}]
+        results = benchmarks.compare(
+            [{'name': 'a', 'size': 10, 'best': 3.0},
+             {'name': 'b', 'size': 10, 'best': 1.0}], baseline)
+        self.assertEqual([1.5, None], [r['ratio'] for r in results])
+
+    def test_latency(self):
+        with CyRestServer(port=0, latency=0.05) as server:
+            start = time.time()
+            status = requests.get(server.url).json()
+            self.assertGreaterEqual(time.time() - start, 0.05)
+        self.assertEqual('v1', status['apiVersion'])
+
+
+if __name__ == '__main__':
+    unittest.main()
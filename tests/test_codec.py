@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+
+import json
+import unittest
+
+import numpy as np
+import requests
+
+from py2cytoscape import codec
+from py2cytoscape.data.cyrest_client import CyRestClient
+from py2cytoscape.data.cynetwork import CyNetwork
+from tests.cyrest_server import CyRestServer
+
+
+class CodecTests(unittest.TestCase):
+
+    def tearDown(self):
+        codec.set_codec()
+
+    def test_numpy(self):
+        value = {'suid': np.int64(52), 'size': np.float32(1.5),
+                 'visible': np.bool_(True), 'xs': np.arange(3),
+                 'every_other': np.arange(6)[::2], 'name': u'ä'}
+        for name in codec.CODECS:
+            encoded = codec.set_codec(name).dumps(value)
+            self.assertIsInstance(encoded, bytes)
+            self.assertEqual(
+                {'suid': 52, 'size': 1.5, 'visible': True, 'xs': [0, 1, 2],
+                 'every_other': [0, 2, 4], 'name': u'ä'},
+                json.loads(encoded.decode('utf-8')), name)
+
+    def test_not_finite(self):
+        value = {'x': [float('nan'), float('inf'), 1.5],
+                 'y': np.array([np.nan, 2.0]), 'z': np.float64('-inf')}
+        for name in codec.CODECS:
+            self.assertEqual(
+                {'x': [None, None, 1.5], 'y': [None, 2.0], 'z': None},
+                json.loads(codec.set_codec(name).dumps(value)), name)
+
+    def test_loads(self):
+        for name in codec.CODECS:
+            codec.set_codec(name)
+            self.assertEqual({'a': [1, 2.5, None]},
+                             codec.loads(b'{"a": [1, 2.5, null]}'), name)
+            self.assertEqual({'a': u'ä'},
+                             codec.loads(u'{"a": "ä"}'.encode('utf-8')), name)
+
+    def test_unserializable(self):
+        with self.assertRaises(TypeError):
+            codec.dumps({'a': object()})
+
+    def test_unknown_library(self):
+        with self.assertRaises(ValueError):
+            codec.set_codec('simplejson2')
+
+    def test_iterencode(self):
+        from py2cytoscape.util.cytoscapejs import iterencode
+        network = {'data': {'name': 'numpy', 'score': np.float64('nan')},
+                   'elements': {'nodes': [{'data': {'id': np.int64(1)}}],
+                                'edges': []}}
+        for name in codec.CODECS:
+            codec.set_codec(name)
+            self.assertEqual(
+                {'data': {'name': 'numpy', 'score': None},
+                 'elements': {'nodes': [{'data': {'id': 1}}], 'edges': []}},
+                json.loads(b''.join(iterencode(network))), name)
+
+    def test_numpy_views(self):
+        # Views are always on port 1234
+        with CyRestServer() as server:
+            client = CyRestClient(port=server.port)
+            network = client.network.create(name='numpy')
+            suids = network.add_nodes(['a', 'b'])
+            view = network.get_view(network.get_views()[0], format='view')
+            view.update_node_views(
+                'NODE_SIZE', dict((np.int64(suid), np.int64(size))
+                                  for suid, size in zip(suids.values(),
+                                                        [10, 20])))
+            sizes = view.get_node_views_as_dict()
+            self.assertEqual([10, 20], [sizes[suid]['NODE_SIZE']
+                                        for suid in suids.values()])
+
+            # Any requests.Session, not only a Transport
+            network = CyNetwork(network.get_id(), session=requests.Session(),
+                                url=server.url + 'networks')
+            view = network.get_view(network.get_views()[0], format='view')
+            view.update_node_views('NODE_SIZE', {np.int64(suids['a']):
+                                                 np.int64(30)})
+            self.assertEqual(
+                30, view.get_node_views_as_dict()[suids['a']]['NODE_SIZE'])
+
+
+if __name__ == '__main__':
+    unittest.main()
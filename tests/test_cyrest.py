@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+
+import os
+import tempfile
+import threading
+import time
+import unittest
+
+import requests
+
+from py2cytoscape.cyrest.base import wait_for, wait_until_ready, \
+    wait_until_stable, WaitTimeout
+from py2cytoscape.cyrest.cyrest import cyclient
+from py2cytoscape.data.cyrest_client import CyRestClient
+from tests.cyrest_server import CyRestServer
+from tests.fake_session import FakeSession
+
+
+class DownSession(FakeSession):
+    """ Refuses connections until it has been called `down` times. """
+
+    def __init__(self, down):
+        super(DownSession, self).__init__()
+        self.down = down
+
+    def respond(self, method, url, body):
+        if len(self.requests) <= self.down:
+            raise requests.exceptions.ConnectionError()
+        return {}
+
+
+class WaitTests(unittest.TestCase):
+
+    def test_wait_for_returns_first_true_value(self):
+        values = iter([None, 0, 'done'])
+        self.assertEqual('done', wait_for(lambda: next(values)))
+
+    def test_wait_for_timeout(self):
+        start = time.time()
+        self.assertRaises(WaitTimeout, wait_for, lambda: False, timeout=0.1)
+        self.assertLess(time.time() - start, 1)
+
+    def test_wait_until_ready(self):
+        session = DownSession(down=3)
+        self.assertTrue(wait_until_ready(timeout=5, session=session))
+        self.assertEqual(4, len(session.requests))
+
+    def test_wait_until_ready_timeout(self):
+        self.assertRaises(WaitTimeout, wait_until_ready, timeout=0.1,
+                          session=DownSession(down=1000))
+
+    def test_wait_until_stable(self):
+        values = iter([0, 1, 2, 3, 3, 4])
+        self.assertEqual(3, wait_until_stable(lambda: next(values),
+                                              interval=0.001))
+
+    def test_wait_until_file_written(self):
+        fd, path = tempfile.mkstemp()
+        os.close(fd)
+
+        def write():
+            with open(path, 'wb') as f:
+                for _ in range(5):
+                    f.write(b'x' * 100)
+                    f.flush()
+                    time.sleep(0.1)
+        writer = threading.Thread(target=write)
+        writer.start()
+        try:
+            # A partly written file is not stable yet
+            size = wait_until_stable(lambda: os.path.getsize(path),
+                                     interval=0.15, timeout=5)
+        finally:
+            writer.join()
+            os.remove(path)
+        self.assertEqual(500, size)
+
+    def test_wait_for_view(self):
+        with CyRestServer(port=0) as server:
+            network = CyRestClient(port=server.port).network.create(
+                name='waited')
+            cytoscape = cyclient(port=server.port)
+            properties = cytoscape.wait_for_view(
+                network='SUID:' + str(network.get_id()), timeout=5)
+        self.assertIn('NETWORK_SCALE_FACTOR',
+                      [p['visualProperty'] for p in properties])
+
+
+if __name__ == '__main__':
+    unittest.main()
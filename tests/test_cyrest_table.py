@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from py2cytoscape.cyrest.cyrest import cyclient
+from py2cytoscape.cyrest.table import table_rows
+from py2cytoscape.data.cyrest_client import CyRestClient
+from tests.cyrest_server import CyRestServer
+
+
+class CyRestTableTests(unittest.TestCase):
+
+    def setUp(self):
+        self.server = CyRestServer(port=0).start()
+        self.client = CyRestClient(port=self.server.port)
+        self.cytoscape = cyclient(port=self.server.port)
+
+    def tearDown(self):
+        self.server.stop()
+
+    def create(self, name, nodes):
+        network = self.client.network.create(name=name)
+        network.add_nodes(nodes)
+        return network
+
+    def test_network_recreated_under_same_name(self):
+        network = self.create('net', ['a', 'b'])
+        df = self.cytoscape.table.getTable(table='node', network='net')
+        self.assertEqual(['a', 'b'], sorted(df.index))
+
+        self.client.network.delete(network)
+        self.create('net', ['c'])
+        df = self.cytoscape.table.getTable(table='node', network='net')
+        self.assertEqual(['c'], list(df.index))
+
+    def test_load_and_get_rows(self):
+        self.create('net', ['a', 'b', 'c'])
+        df = pd.DataFrame({'score': [1.5, np.nan, 3.0],
+                           'degree': [1, 2, 3],
+                           'label': ['x', None, 'z']},
+                          index=['a', 'b', 'c'])
+        self.cytoscape.table.loadTableData(df, network='net', batch_size=2)
+
+        # All columns, read from the rows in one call
+        result = self.cytoscape.table.getTable(table='node', network='net')
+        self.assertEqual(['a', 'b', 'c'], list(result.index))
+        self.assertEqual([1.5, 3.0], result['score'].dropna().tolist())
+        self.assertTrue(pd.isnull(result.loc['b', 'score']))
+        self.assertEqual(['x', 'z'], result['label'].dropna().tolist())
+
+    def test_load_in_batches(self):
+        self.create('net', ['n' + str(i) for i in range(5)])
+        df = pd.DataFrame({'score': np.arange(5.0)},
+                          index=['n' + str(i) for i in range(5)])
+        before = self.server.request_count
+        self.cytoscape.table.loadTableData(df, network='net', batch_size=2)
+        # One lookup of the network SUID and three uploads
+        self.assertEqual(4, self.server.request_count - before)
+        result = self.cytoscape.table.getTable(table='node', network='net',
+                                               columns=['score'])
+        self.assertEqual(list(np.arange(5.0)), result['score'].tolist())
+
+    def test_get_columns_concurrently(self):
+        self.create('net', ['a', 'b'])
+        df = pd.DataFrame({'score': [1.0, 2.0], 'other': [3.0, 4.0]},
+                          index=['a', 'b'])
+        self.cytoscape.table.loadTableData(df, network='net')
+
+        before = self.server.request_count
+        result = self.cytoscape.table.getTable(
+            table='node', network='net', columns=['score', 'missing'],
+            max_workers=4)
+        # The definitions, then the name and score columns one by one
+        self.assertEqual(3, self.server.request_count - before)
+        self.assertEqual(['score'], list(result.columns))
+        self.assertEqual([1.0, 2.0], result.loc[['a', 'b'], 'score'].tolist())
+
+        # More columns than workers: the rows are read at once
+        before = self.server.request_count
+        result = self.cytoscape.table.getTable(
+            table='node', network='net', columns=['score', 'other'],
+            max_workers=2)
+        self.assertEqual(2, self.server.request_count - before)
+        self.assertEqual([3.0, 4.0], result.loc[['a', 'b'], 'other'].tolist())
+
+
+class TableRowsTests(unittest.TestCase):
+
+    def test_dense(self):
+        df = pd.DataFrame({'score': [1, 2], 'label': ['x', 'y']},
+                          index=['a', 'b'])
+        self.assertEqual([{'name': 'a', 'score': 1.0, 'label': 'x'},
+                          {'name': 'b', 'score': 2.0, 'label': 'y'}],
+                         table_rows(df))
+
+    def test_missing_values(self):
+        df = pd.DataFrame({'score': [np.nan, 2.0, np.nan],
+                           'label': ['x', None, None]},
+                          index=['a', 'b', 'c'])
+        # Missing cells are left out, rows without any value are dropped
+        self.assertEqual([{'name': 'a', 'label': 'x'},
+                          {'name': 'b', 'score': 2.0}],
+                         table_rows(df))
+
+    def test_keys_and_mixed_columns(self):
+        df = pd.DataFrame({'value': ['x', 1, True]}, index=[1, 2, 3])
+        self.assertEqual([{'id': '1', 'value': 'x'},
+                          {'id': '2', 'value': 1.0},
+                          {'id': '3', 'value': 1.0}],
+                         table_rows(df, key_column='id'))
+
+    def test_empty(self):
+        self.assertEqual([], table_rows(pd.DataFrame({'score': []})))
+        self.assertEqual([], table_rows(pd.DataFrame(index=['a', 'b'])))
+
+
+if __name__ == '__main__':
+    unittest.main()
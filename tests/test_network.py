@@ -7,6 +7,9 @@ import networkx as nx
 
 import py2cytoscape.util.util_dataframe as df_util
 from py2cytoscape.data.cyrest_client import CyRestClient
+from tests import cyrest_server
+
+setUpModule, tearDownModule = cyrest_server.module_fixture()
 
 
 def pp(dict_data):
@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+
+import unittest
+
+from py2cytoscape.data.cynetwork import CyNetwork
+from py2cytoscape.data.network_batch import BatchResult
+from tests.fake_session import FakeSession
+
+URL = 'http://localhost:1234/v1/networks'
+
+
+class NetworkSession(FakeSession):
+    """ Answers table and neighbour requests of a 10-node network. """
+
+    def __init__(self):
+        super(NetworkSession, self).__init__()
+        self.count = 10
+
+    def respond(self, method, url, body):
+        if method == 'delete':
+            return {}
+        if method == 'post':
+            self.deleted = body
+            self.count -= len(body.get('nodeList', '').split(','))
+            return {'data': {}, 'errors': []}
+        path = url.split('/networks/1/')[1]
+        if path == 'tables/defaultnode/rows':
+            return [{'SUID': i, 'name': 'n' + str(i)} for i in range(10)]
+        parts = path.split('/')
+        if parts[0] == 'tables':
+            suid = int(parts[3])
+            if len(parts) == 5:
+                return 'n' + str(suid)
+            return {'SUID': suid, 'name': 'n' + str(suid)}
+        if parts[1] == 'count':
+            return {'count': self.count}
+        return [int(parts[1]) + 1]
+
+
+class NetworkBatchTests(unittest.TestCase):
+
+    def setUp(self):
+        self.session = NetworkSession()
+        self.network = CyNetwork(1, session=self.session, url=URL)
+
+    def test_results_match_unbatched_calls(self):
+        expected_row = self.network.get_node_value(3)
+        expected_value = self.network.get_node_value(3, column='name')
+        expected_neighbours = self.network.get_neighbours(3)
+
+        with self.network.batch():
+            row = self.network.get_node_value(3)
+            value = self.network.get_node_value(3, column='name')
+            neighbours = self.network.get_neighbours(3)
+            self.assertIsInstance(row, BatchResult)
+            self.assertFalse(row.done())
+
+        self.assertTrue(row.result().equals(expected_row))
+        self.assertEqual(expected_value, value.result())
+        self.assertEqual(expected_neighbours, neighbours.result())
+
+    def test_bulk_row_lookup(self):
+        with self.network.batch(bulk_threshold=5):
+            rows = [self.network.get_node_value(i) for i in range(10)]
+
+        self.assertEqual(['n' + str(i) for i in range(10)],
+                         [row.result()['name'] for row in rows])
+        self.assertEqual([('get', URL + '/1/tables/defaultnode/rows')],
+                         self.session.requests)
+
+    def test_pipelined_deletes(self):
+        with self.network.batch(max_workers=4):
+            results = [self.network.delete_node(i) for i in range(20)]
+
+        self.assertEqual(20, len(self.session.requests))
+        self.assertEqual([None] * 20, [r.result() for r in results])
+
+    def test_reads_and_deletes_keep_their_order(self):
+        with self.network.batch(max_workers=4, bulk_threshold=2):
+            before = [self.network.get_node_value(i) for i in (3, 4)]
+            self.network.delete_node(3)
+            self.network.delete_node(4)
+            after = self.network.get_neighbours(3)
+
+        self.assertEqual(
+            [('get', URL + '/1/tables/defaultnode/rows'),
+             ('get', URL + '/1/nodes/count'),
+             ('post', 'http://localhost:1234/v1/commands/network/delete'),
+             ('get', URL + '/1/nodes/count'),
+             ('get', URL + '/1/nodes/3/neighbors')],
+            self.session.requests)
+        self.assertEqual(['n3', 'n4'], [r.result()['name'] for r in before])
+        self.assertEqual([4], after.result())
+
+    def test_values_unknown_inside_block(self):
+        with self.network.batch():
+            row = self.network.get_node_value(3)
+            # Code using the value right away does not work in a batch
+            self.assertRaises(ValueError, row.result)
+            self.assertRaises(TypeError, lambda: row['name'])
+
+        self.assertEqual('n3', row.result()['name'])
+
+    def test_error_discards_batch(self):
+        with self.assertRaises(RuntimeError):
+            with self.network.batch():
+                result = self.network.delete_node(1)
+                raise RuntimeError()
+
+        self.assertEqual([], self.session.requests)
+        self.assertRaises(ValueError, result.result)
+
+    def test_delete_nodes(self):
+        self.assertEqual(3, self.network.delete_nodes([1, 2, 3], chunk_size=2))
+
+        self.assertEqual([('get', URL + '/1/nodes/count'),
+                          ('post', 'http://localhost:1234/v1/commands/network/delete'),
+                          ('post', 'http://localhost:1234/v1/commands/network/delete'),
+                          ('get', URL + '/1/nodes/count')],
+                         self.session.requests)
+        self.assertEqual({'network': 'SUID:1', 'nodeList': 'SUID:3'},
+                         self.session.deleted)
+
+    def test_bulk_deletes(self):
+        with self.network.batch(bulk_threshold=5):
+            results = [self.network.delete_edge(i) for i in range(20)]
+
+        self.assertEqual([None] * 20, [r.result() for r in results])
+        self.assertEqual(3, len(self.session.requests))
+        self.assertEqual(','.join('SUID:' + str(i) for i in range(20)),
+                         self.session.deleted['edgeList'])
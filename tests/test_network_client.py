@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from py2cytoscape.data.network_client import NetworkClient
+from tests.fake_session import FakeResponse, FakeSession
+
+URL = 'http://localhost:1234/v1/'
+
+
+class ExportSession(FakeSession):
+    """ Serves exports of networks 1 and 2, network 3 has no view. """
+
+    def __init__(self):
+        super(ExportSession, self).__init__()
+        self.params = {}
+
+    def get(self, url, params=None, **kwargs):
+        with self.lock:
+            self.params[url.split('/networks/')[1]] = params
+        return super(ExportSession, self).get(url, **kwargs)
+
+    def respond(self, method, url, body):
+        path = url.split('/networks/')[1]
+        if path.startswith('3/views'):
+            return FakeResponse(status_code=404, content=b'')
+        return FakeResponse(content=path.encode('utf-8') * 1000)
+
+
+class NetworkExportTests(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.session = ExportSession()
+        self.client = NetworkClient(URL, session=self.session)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_export(self):
+        result = self.client.export([1, 2, 3], formats=('png', 'cyjs'),
+                                    directory=self.directory, max_workers=3)
+
+        self.assertEqual(6, len(result))
+        self.assertEqual([1, 1, 2, 2, 3, 3], result['suid'].tolist())
+        failed = result[result['error'].notnull()]
+        self.assertEqual([(3, 'png')],
+                         list(zip(failed['suid'], failed['format'])))
+        self.assertEqual(['1.cyjs', '1.png', '2.cyjs', '2.png', '3.cyjs'],
+                         sorted(os.listdir(self.directory)))
+        with open(os.path.join(self.directory, '2.png'), 'rb') as f:
+            self.assertEqual(b'2/views/first.png' * 1000, f.read())
+        with open(os.path.join(self.directory, '2.cyjs'), 'rb') as f:
+            self.assertEqual(b'2' * 1000, f.read())
+        self.assertTrue((result['seconds'] >= 0).all())
+
+    def test_height(self):
+        self.client.export([1], formats=('png', 'svg', 'pdf', 'cyjs'),
+                           directory=self.directory, height=100)
+
+        self.assertEqual({'1/views/first.png': {'h': 100},
+                          '1/views/first.svg': None,
+                          '1/views/first.pdf': None,
+                          '1': None}, self.session.params)
+
+    def test_duplicates(self):
+        result = self.client.export([1, 2, 1], formats=('cyjs', 'cyjs'),
+                                    directory=self.directory, max_workers=3)
+
+        self.assertEqual([1, 2], result['suid'].tolist())
+        self.assertEqual(2, len(self.session.requests))
+        with open(os.path.join(self.directory, '1.cyjs'), 'rb') as f:
+            self.assertEqual(b'1' * 1000, f.read())
+
+    def test_unsupported_format(self):
+        self.assertRaises(ValueError, self.client.export, [1],
+                          formats=('gif',))
@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+
+import unittest
+
+import pandas as pd
+
+from py2cytoscape.data.cynetwork import CyNetwork
+from py2cytoscape.util import util_table
+from py2cytoscape.util.util_table import pa
+from tests.fake_session import FakeSession
+
+URL = 'http://localhost:1234/v1/networks'
+
+
+COLUMNS = [
+    {'name': 'SUID', 'type': 'Long', 'primaryKey': True},
+    {'name': 'name', 'type': 'String', 'primaryKey': False},
+    {'name': 'degree', 'type': 'Integer', 'primaryKey': False},
+    {'name': 'aliases', 'type': 'List', 'listType': 'String',
+     'primaryKey': False}
+]
+
+VALUES = {
+    'SUID': [10, 11],
+    'name': ['a', 'b'],
+    'degree': [1, None],
+    'aliases': [['x', 'y'], []]
+}
+
+
+class TableSession(FakeSession):
+    """ Serves the node table of a network and records the updates. """
+
+    def respond(self, method, url, body):
+        if method == 'put':
+            return None
+        column = url.split('/')[-1]
+        if column == 'columns':
+            return COLUMNS
+        if column == 'defaultnode':
+            names = [c['name'] for c in COLUMNS]
+            return {'rows': [dict(zip(names, row))
+                             for row in zip(*VALUES.values())]}
+        return {'name': column, 'values': VALUES[column]}
+
+    def updates(self):
+        """ URL and body of the table updates sent. """
+        return [(url, body) for (method, url), body
+                in zip(self.requests, self.bodies) if method == 'put']
+
+
+class NetworkTableTests(unittest.TestCase):
+
+    def setUp(self):
+        self.session = TableSession()
+        self.network = CyNetwork(1, session=self.session, url=URL)
+        self.df = pd.DataFrame({'score': [0.5 * i for i in range(25)]},
+                               index=['n' + str(i) for i in range(25)])
+
+    def test_update_node_table(self):
+        self.network.update_node_table(self.df)
+
+        self.assertEqual(1, len(self.session.updates()))
+        url, body = self.session.updates()[0]
+        self.assertEqual(URL + '/1/tables/defaultnode', url)
+        self.assertEqual('name', body['key'])
+        self.assertEqual('name', body['dataKey'])
+        self.assertEqual({'score': 1.0, 'name': 'n2'}, body['data'][2])
+        self.assertNotIn('name', self.df.columns)
+
+    def test_chunked_update(self):
+        df = self.df.reset_index().rename(columns={'index': 'id'})
+        self.network.update_edge_table(df, data_key_col='id',
+                                       rows_per_request=10, max_workers=3)
+
+        self.assertEqual(3, len(self.session.updates()))
+        rows = sorted((row for _, body in self.session.updates()
+                       for row in body['data']), key=lambda row: row['score'])
+        self.assertEqual(df.to_dict('records'), rows)
+        for url, body in self.session.updates():
+            self.assertEqual(URL + '/1/tables/defaultedge', url)
+            self.assertEqual('id', body['dataKey'])
+            self.assertTrue(len(body['data']) <= 10)
+
+    def test_typed_node_table(self):
+        table = self.network.get_node_table()
+
+        self.assertEqual('int64', table['SUID'].dtype)
+        self.assertEqual('Int32', table['degree'].dtype)
+        self.assertTrue(pd.isna(table['degree'][1]))
+        self.assertEqual(['x', 'y'], list(table['aliases'][0]))
+
+    def test_unknown_list_type(self):
+        for column in ({'name': 'x', 'type': 'List'},
+                       {'name': 'x', 'type': 'List', 'listType': 'Color'}):
+            series = util_table.to_series([['#FF0000'], None], column)
+            self.assertEqual(object, series.dtype)
+            self.assertEqual(['#FF0000'], series[0])
+
+    @unittest.skipIf(pa is None, 'pyarrow not found')
+    def test_to_arrow(self):
+        table = self.network.to_arrow()
+
+        self.assertEqual(['SUID', 'name', 'degree', 'aliases'],
+                         table.column_names)
+        self.assertEqual(pa.int64(), table.schema.field('SUID').type)
+        self.assertEqual(pa.int32(), table.schema.field('degree').type)
+        self.assertEqual(pa.list_(pa.string()),
+                         table.schema.field('aliases').type)
+        self.assertEqual(VALUES, table.to_pydict())
+
+    @unittest.skipIf(pa is None, 'pyarrow not found')
+    def test_cached_arrow(self):
+        # The definitions and the table fit, not one entry per column
+        self.network.enable_cache(max_size=2, check_counts=False)
+        table = self.network.to_arrow()
+        self.assertIs(table, self.network.to_arrow())
+
+    @unittest.skipIf(pa is None, 'pyarrow not found')
+    def test_update_from_arrow(self):
+        table = pa.table({'name': ['a', 'b'], 'score': [0.5, 1.5]})
+        self.network.update_node_table_from_arrow(table, rows_per_request=1)
+
+        self.assertEqual(2, len(self.session.updates()))
+        url, body = self.session.updates()[1]
+        self.assertEqual('name', body['dataKey'])
+        self.assertEqual([{'name': 'b', 'score': 1.5}], body['data'])
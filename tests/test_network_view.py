@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from py2cytoscape.data.cynetwork import CyNetwork
+from py2cytoscape.data.network_view import CyNetworkView
+from tests.fake_session import FakeSession
+
+URL = 'http://localhost:1234/v1/networks'
+
+
+class NetworkViewTests(unittest.TestCase):
+
+    def setUp(self):
+        self.session = FakeSession()
+        network = CyNetwork(1, session=self.session, url=URL)
+        self.view = CyNetworkView(network, 2)
+
+    def test_batch_update_node_views(self):
+        df = pd.DataFrame({
+            'NODE_FILL_COLOR': ['#FF0000', '#00FF00'],
+            'NODE_SIZE': np.array([10, 20], dtype=np.int64),
+            'NODE_LABEL': np.array([np.float32(1.5), 'b'], dtype=object)
+        }, index=np.array([5, 6], dtype=np.int64))
+        self.view.batch_update_node_views(df)
+
+        self.assertEqual(1, len(self.session.requests))
+        self.assertEqual(('put', URL + '/1/views/2/nodes'),
+                         self.session.requests[0])
+        body = self.session.bodies[0]
+        self.assertEqual({
+            'SUID': 5,
+            'view': [
+                {'visualProperty': 'NODE_FILL_COLOR', 'value': '#FF0000'},
+                {'visualProperty': 'NODE_SIZE', 'value': 10},
+                {'visualProperty': 'NODE_LABEL', 'value': 1.5}
+            ]
+        }, body[0])
+
+    def test_chunked_batch_update(self):
+        df = pd.DataFrame({'EDGE_WIDTH': np.arange(25) / 2.0},
+                          index=range(100, 125))
+        self.view.batch_update_edge_views(df, rows_per_request=10,
+                                          max_workers=3)
+
+        self.assertEqual(3, len(self.session.requests))
+        views = sorted(entry['SUID'] for body in self.session.bodies
+                       for entry in body)
+        self.assertEqual(list(range(100, 125)), views)
@@ -1,12 +1,15 @@
 # -*- coding: utf-8 -*-
 
+import json
 import unittest
 
+import pandas as pd
+
 from py2cytoscape.data.style import Style
 from py2cytoscape.data.cyrest_client import CyRestClient
+from tests import cyrest_server
 
-import pandas as pd
-import json
+setUpModule, tearDownModule = cyrest_server.module_fixture()
 
 STYLE_NAME = 'style1'
 
@@ -47,13 +50,13 @@ class StyleTests(unittest.TestCase):
         print(defs)
         self.assertIsNotNone(defs)
         self.assertEqual(pd.Series, type(defs))
-        self.assertEqual(106, len(defs))
+        self.assertEqual(len(self.client.style.vps.get_all()), len(defs))
 
         defs2 = self.style.get_defaults()
         print(defs2)
         self.assertIsNotNone(defs2)
         self.assertEqual(pd.Series, type(defs2))
-        self.assertEqual(106, len(defs2))
+        self.assertEqual(len(self.client.style.vps.get_all()), len(defs2))
 
         print('\n---------- Defaults tests finished! -----------\n')
 
@@ -69,10 +72,10 @@ class StyleTests(unittest.TestCase):
         print(n_label)
         # These should be same as VP defaults.
         self.assertEqual(pd.Series, type(n_label))
-        self.assertEqual('', n_label.ix['NODE_LABEL'])
-        self.assertEqual(50, n_size.ix['NODE_SIZE'])
-        self.assertEqual('ELLIPSE', n_shape.ix['NODE_SHAPE'])
-        self.assertEqual(1, e_width.ix['EDGE_WIDTH'])
+        self.assertEqual('', n_label.loc['NODE_LABEL'])
+        self.assertEqual(50, n_size.loc['NODE_SIZE'])
+        self.assertEqual('ELLIPSE', n_shape.loc['NODE_SHAPE'])
+        self.assertEqual(1, e_width.loc['EDGE_WIDTH'])
 
     def test_update_defaults(self):
         print('\n---------- Add Defaults tests start -----------\n')
@@ -100,19 +103,19 @@ class StyleTests(unittest.TestCase):
         default_style.update_defaults(new_defaults)
 
         defs = default_style.get_defaults()
-        self.assertEqual(20, defs.ix['NODE_SIZE'])
-        self.assertEqual('#eeeeff'.upper(), defs.ix['NODE_FILL_COLOR'])
-        self.assertEqual(0, defs.ix['NODE_BORDER_WIDTH'])
-        self.assertEqual(120, defs.ix['NODE_TRANSPARENCY'])
-        self.assertEqual('#FFFFFF', defs.ix['NODE_LABEL_COLOR'])
+        self.assertEqual(20, defs.loc['NODE_SIZE'])
+        self.assertEqual('#eeeeff'.upper(), defs.loc['NODE_FILL_COLOR'])
+        self.assertEqual(0, defs.loc['NODE_BORDER_WIDTH'])
+        self.assertEqual(120, defs.loc['NODE_TRANSPARENCY'])
+        self.assertEqual('#FFFFFF', defs.loc['NODE_LABEL_COLOR'])
 
-        self.assertEqual(9, defs.ix['EDGE_WIDTH'])
-        self.assertEqual('#aaaaaa'.upper(), defs.ix['EDGE_STROKE_UNSELECTED_PAINT'])
-        self.assertEqual('LONG_DASH', defs.ix['EDGE_LINE_TYPE'])
-        self.assertEqual(120, defs.ix['EDGE_TRANSPARENCY'])
+        self.assertEqual(9, defs.loc['EDGE_WIDTH'])
+        self.assertEqual('#aaaaaa'.upper(), defs.loc['EDGE_STROKE_UNSELECTED_PAINT'])
+        self.assertEqual('LONG_DASH', defs.loc['EDGE_LINE_TYPE'])
+        self.assertEqual(120, defs.loc['EDGE_TRANSPARENCY'])
 
         # Network defaults
-        self.assertEqual('#000000', defs.ix['NETWORK_BACKGROUND_PAINT'])
+        self.assertEqual('#000000', defs.loc['NETWORK_BACKGROUND_PAINT'])
 
         print('\n---------- Defaults tests finished! -----------\n')
 
@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+
+import io
+import json
+import time
+import unittest
+
+import pandas as pd
+import requests
+
+from py2cytoscape import tracing
+from py2cytoscape.cyrest.base import api, create_session
+from py2cytoscape.data.network_client import NetworkClient
+from tests.cyrest_server import CyRestServer
+
+
+class TracingTests(unittest.TestCase):
+
+    def setUp(self):
+        self.server = CyRestServer(port=0).start()
+        self.client = NetworkClient(self.server.url)
+
+    def tearDown(self):
+        self.server.stop()
+
+    def test_endpoint_template(self):
+        self.assertEqual(
+            '/v1/networks/{suid}/views/{suid}.png',
+            tracing.endpoint_template(
+                'http://localhost:1234/v1/networks/52/views/60.png?h=100'))
+        self.assertEqual(
+            '/v1/commands/network/get attribute',
+            tracing.endpoint_template(
+                'http://localhost:1234/v1/commands/network/get attribute'))
+
+    def test_events(self):
+        events = []
+        tracing.add_listener(events.append)
+        try:
+            network = self.client.create(name='traced')
+            network.add_nodes(['a', 'b'])
+            network.update_node_table(pd.DataFrame({'score': [1.0, 2.0]},
+                                                   index=['a', 'b']))
+            nodes = network.get_nodes()
+        finally:
+            tracing.remove_listener(events.append)
+
+        self.assertEqual(['POST /v1/networks',
+                          'POST /v1/networks/{suid}/nodes',
+                          'PUT /v1/networks/{suid}/tables/defaultnode',
+                          'GET /v1/networks/{suid}/nodes'],
+                         [e.method + ' ' + e.endpoint for e in events])
+        self.assertEqual([200] * 4, [e.status for e in events])
+        put = events[2]
+        self.assertGreater(put.request_bytes, 0)
+        self.assertGreater(put.serialize, 0)
+        self.assertGreater(put.transfer, 0)
+        get = events[3]
+        self.assertEqual(len(json.dumps(nodes)), get.response_bytes)
+        self.assertGreater(get.parse, 0)
+
+        # Nothing is traced without listeners
+        network.get_nodes()
+        self.assertEqual(4, len(events))
+
+    def test_failed_request_keeps_no_timing(self):
+        session = create_session(max_retries=0)
+        events = []
+        tracing.add_listener(events.append)
+        try:
+            # One request fails while sent, the other before it is sent
+            with tracing.timed('serialize'):
+                time.sleep(0.05)
+            self.assertRaises(requests.exceptions.ConnectionError,
+                              session.get, 'http://localhost:1/v1/')
+            with tracing.timed('serialize'):
+                time.sleep(0.05)
+            self.assertRaises(requests.exceptions.MissingSchema,
+                              session.get, 'localhost/v1/')
+            session.get(self.server.url)
+        finally:
+            tracing.remove_listener(events.append)
+
+        self.assertEqual(1, len(events))
+        self.assertLess(events[0].serialize, 0.05)
+
+    def test_recording(self):
+        session = create_session()
+        out = io.StringIO()
+        with tracing.recording(file=out) as stats:
+            network = self.client.create()
+            for _ in range(3):
+                api(url=self.server.url + 'commands/network/get attribute',
+                    PARAMS={'network': 'SUID:' + str(network.get_id())},
+                    session=session)
+
+        summary = stats.summary()
+        self.assertEqual(3, summary.loc[
+            'POST /v1/commands/network/get attribute', 'count'])
+        self.assertEqual(1, summary.loc['POST /v1/networks', 'count'])
+        histogram = stats.histogram()
+        self.assertEqual([1, 3], sorted(histogram.sum(axis=1).tolist()))
+        self.assertIn('<1ms', histogram.columns)
+        self.assertIn('POST /v1/commands/network/get attribute',
+                      out.getvalue())
+
+
+if __name__ == '__main__':
+    unittest.main()
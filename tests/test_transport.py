@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+
+import json
+import unittest
+
+import requests
+
+from py2cytoscape import codec
+from py2cytoscape.cyrest.cyrest import cyclient
+from py2cytoscape.data.cyrest_client import CyRestClient
+from py2cytoscape.transport import Transport
+from tests.cyrest_server import CyRestServer
+
+
+class TransportTests(unittest.TestCase):
+
+    def setUp(self):
+        self.server = CyRestServer(port=0).start()
+
+    def tearDown(self):
+        self.server.stop()
+
+    def test_clients_share_connections(self):
+        with Transport(pool_size=1) as transport:
+            client = CyRestClient(port=self.server.port, transport=transport)
+            cy = cyclient(port=self.server.port, transport=transport)
+            for sub in (client.network, client.style, client.layout,
+                        client.edgebundling, client.session):
+                self.assertIs(transport, sub.session)
+
+            client.status()
+            network = client.network.create(name='shared')
+            network.add_nodes(['a', 'b'])
+            client.style.get_all()
+            cy.network.list()
+            self.assertTrue(self.server.request_count >= 5)
+            self.assertEqual(1, self.server.connection_count)
+
+    def test_read_timeout(self):
+        with Transport(read_timeout=0.1) as transport:
+            client = CyRestClient(port=self.server.port, transport=transport)
+            self.server.latency = 0.5
+            with self.assertRaises(requests.exceptions.ReadTimeout):
+                client.network.get_all()
+            # A timeout given to the call wins
+            self.assertEqual(
+                [], transport.get(self.server.url + 'networks',
+                                  timeout=5).json())
+
+    def test_connection_retries(self):
+        port = self.server.port
+        self.server.stop()
+        with Transport(max_retries=1, backoff_factor=0) as transport:
+            with self.assertRaises(requests.exceptions.ConnectionError):
+                transport.get('http://localhost:%d/v1/' % port)
+        self.server = CyRestServer(port=0).start()
+
+    def test_compressed_requests(self):
+        nodes = ['n' + str(i) for i in range(2000)]
+        for encoding in ('gzip', 'deflate'):
+            self.server.reset()
+            with Transport(compress=encoding, compress_threshold=0) as \
+                    transport:
+                client = CyRestClient(port=self.server.port,
+                                      transport=transport)
+                network = client.network.create(name=encoding)
+                received = self.server.bytes_received
+                suids = network.add_nodes(nodes)
+            self.assertEqual(len(nodes), len(suids))
+            # The body is sent compressed and decoded by the server
+            self.assertLess(self.server.bytes_received - received,
+                            len(json.dumps(nodes)) / 2)
+
+    def test_compress_threshold(self):
+        with Transport(compress='gzip', compress_threshold=10 ** 6) as \
+                transport:
+            client = CyRestClient(port=self.server.port, transport=transport)
+            network = client.network.create(name='small')
+            received = self.server.bytes_received
+            network.add_nodes(['a', 'b'])
+            self.assertEqual(len(codec.dumps(['a', 'b'])),
+                             self.server.bytes_received - received)
+
+    def test_compressed_responses(self):
+        self.server.compress = True
+        self.server.compress_threshold = 0
+        with Transport() as transport:
+            response = transport.get(self.server.url)
+            self.assertEqual('gzip', response.headers['Content-Encoding'])
+            self.assertEqual('v1', response.json()['apiVersion'])
+        with Transport(accept_encoding=None) as transport:
+            response = transport.get(self.server.url)
+            self.assertNotIn('Content-Encoding', response.headers)
+
+    def test_unsupported_compression(self):
+        with self.assertRaises(ValueError):
+            Transport(compress='br')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -7,7 +7,7 @@ import igraph as ig
 import networkx as nx
 from py2cytoscape import util
 
-import scipy as sp
+import numpy as np
 import tempfile
 
 
@@ -72,9 +72,9 @@ class NetworkConversionTests(unittest.TestCase):
     def test_networkx_digraph_edge_attr(self):
         print('\n---------- Digraph Edge Att Test Start -----------\n')
         g = nx.DiGraph()
-        g.add_path([0, 1, 2, 3, 4])
-        eb = nx.edge_betweenness(g)
-        nx.set_edge_attributes(g, 'eb', eb)
+        nx.add_path(g, [0, 1, 2, 3, 4])
+        eb = nx.edge_betweenness_centrality(g)
+        nx.set_edge_attributes(g, eb, 'eb')
         cyjs = util.from_networkx(g)
 
         print(json.dumps(cyjs, indent=4))
@@ -134,13 +134,13 @@ class NetworkConversionTests(unittest.TestCase):
         mx1 = nx.adjacency_matrix(g)
         fp = tempfile.NamedTemporaryFile()
         file_name = fp.name
-        sp.savetxt(file_name, mx1.toarray(), fmt='%d')
+        np.savetxt(file_name, mx1.toarray(), fmt='%d')
 
         # Load it back to matrix
-        mx2 = sp.loadtxt(file_name)
+        mx2 = np.loadtxt(file_name)
         fp.close()
 
-        g2 = nx.from_numpy_matrix(mx2)
+        g2 = nx.from_numpy_array(mx2)
         cyjs_g = util.from_networkx(g2)
 
         #print(json.dumps(cyjs_g, indent=4))
@@ -233,11 +233,11 @@ class NetworkConversionTests(unittest.TestCase):
         g.graph['name'] = 'original'
         g.graph['density'] = nx.density(g)
 
-        nx.set_node_attributes(g, 'betweenness', nx.betweenness_centrality(g))
-        nx.set_node_attributes(g, 'degree', nx.degree(g))
-        nx.set_node_attributes(g, 'closeness', nx.closeness_centrality(g))
+        nx.set_node_attributes(g, nx.betweenness_centrality(g), 'betweenness')
+        nx.set_node_attributes(g, dict(nx.degree(g)), 'degree')
+        nx.set_node_attributes(g, nx.closeness_centrality(g), 'closeness')
 
-        nx.set_edge_attributes(g, 'eb', nx.edge_betweenness(g))
+        nx.set_edge_attributes(g, nx.edge_betweenness_centrality(g), 'eb')
 
         cyjs1 = util.from_networkx(g)
         g2 = util.to_networkx(cyjs1)
@@ -248,8 +248,8 @@ class NetworkConversionTests(unittest.TestCase):
         edge_set = set(list(map(lambda x: (int(x[0]), int(x[1])), g2.edges())))
         self.assertEqual(0, len(edge_set.difference(set(edges))))
 
-        node_original = g.node[1]
-        node_generated = g2.node['1']
+        node_original = g.nodes[1]
+        node_generated = g2.nodes['1']
 
         print(node_original)
         print(node_generated)
@@ -258,6 +258,18 @@ class NetworkConversionTests(unittest.TestCase):
         self.assertEqual(node_original['betweenness'], node_generated['betweenness'])
         self.assertEqual(node_original['closeness'], node_generated['closeness'])
 
+    def test_networkx_layout(self):
+        g = nx.path_graph(3)
+        layout = nx.circular_layout(g)
+        cyjs = util.from_networkx(g, layout=layout, scale=10)
+
+        for node in cyjs['elements']['nodes']:
+            x, y = layout[int(node['data']['id'])]
+            self.assertAlmostEqual(x * 10, node['position']['x'])
+            self.assertAlmostEqual(y * 10, node['position']['y'])
+        # Edge attributes of the graph are left untouched
+        self.assertEqual({}, g[0][1])
+
     def test_from_igraph(self):
         print('---------- From igraph object to Cytoscape.js -----------\n')
         empty = ig.Graph()
@@ -300,6 +312,25 @@ class NetworkConversionTests(unittest.TestCase):
         ea_names = g.es.attribute_names()
         self.assertEqual(8, len(ea_names))
 
+    def test_igraph_roundtrip(self):
+        g = ig.Graph.Ring(5)
+        g.vs['label'] = ['a', 'b', 'c', 'd', 'e']
+        g.es['weight'] = [0.5, 1.5, 2.5, 3.5, 4.5]
+        layout = g.layout_circle()
+
+        cyjs = util.from_igraph(g, layout=layout, scale=10)
+        node = cyjs['elements']['nodes'][3]
+        self.assertEqual({'id': '3', 'name': '3', 'label': 'd'}, node['data'])
+        self.assertAlmostEqual(layout[3][0] * 10, node['position']['x'])
+        self.assertEqual({'source': '3', 'target': '4', 'weight': 3.5},
+                         cyjs['elements']['edges'][3]['data'])
+
+        from py2cytoscape.util.util_igraph import to_igraph
+        g2 = to_igraph(cyjs)
+        self.assertEqual(g.get_edgelist(), g2.get_edgelist())
+        self.assertEqual(g.vs['label'], g2.vs['label'])
+        self.assertEqual(g.es['weight'], g2.es['weight'])
+
     def test_from_igraph_random(self):
         print('---------- From igraph random network object to Cytoscape.js -----------\n')
         ba_graph = ig.Graph.Barabasi(100, 3)
@@ -352,6 +383,68 @@ class NetworkDataframeTests(unittest.TestCase):
         df = to_dataframe(network, edges_attr_cols=['SUID'])
         self.assertIn('SUID', df.columns)
 
+    def test_from_dataframe(self):
+        import pandas as pd
+        from py2cytoscape.util.util_dataframe import from_dataframe
+        df = pd.DataFrame({
+            'source': ['a', 'b', 'a', 'c'],
+            'target': ['b', 'c', 'd', 'a'],
+            'interaction': ['pp', None, 'pd', 'pp'],
+            'score': [0.5, 1.0, 1.5, 2.0]
+        })
+        network = from_dataframe(df, edge_attr_cols=['score', 'missing'])
+
+        nodes = network['elements']['nodes']
+        self.assertEqual(['a', 'b', 'c', 'd'],
+                         [node['data']['id'] for node in nodes])
+        edges = network['elements']['edges']
+        self.assertEqual(4, len(edges))
+        self.assertEqual({'source': 'b', 'target': 'c', 'interaction': '-',
+                          'score': 1.0}, edges[1]['data'])
+        # Values must be plain Python objects
+        json.dumps(network)
+
+    def test_iterencode(self):
+        import pandas as pd
+        from py2cytoscape.util.cytoscapejs import iterencode
+        from py2cytoscape.util.util_dataframe import from_dataframe
+        df = pd.read_csv(self.cur_dir + '/data/galFiltered.sif',
+                         names=['source', 'interaction', 'target'], sep=' ')
+
+        lazy = from_dataframe(df, lazy=True)
+        chunks = list(iterencode(lazy, chunk_size=1024))
+        self.assertTrue(len(chunks) > 1)
+        decoded = json.loads(b''.join(chunks).decode('utf-8'))
+        self.assertEqual(from_dataframe(df), decoded)
+
+        with open(self.cur_dir + '/data/galFiltered.json', 'r') as f:
+            network = json.load(f)
+        decoded = json.loads(b''.join(iterencode(network)).decode('utf-8'))
+        self.assertEqual(network, decoded)
+
+    def test_iterdecode(self):
+        from py2cytoscape.util.cytoscapejs import iterdecode, decode_lazy
+        with open(self.cur_dir + '/data/galFiltered.json', 'r') as f:
+            network = json.load(f)
+        network['data']['name'] = u'galé ✓'
+        raw = json.dumps(network, ensure_ascii=False).encode('utf-8')
+        # Small chunks split elements, numbers and multi-byte characters
+        chunks = [raw[i:i + 7] for i in range(0, len(raw), 7)]
+
+        events = list(iterdecode(chunks))
+        self.assertIn(('data', network['data']), events)
+        self.assertEqual(network['elements']['nodes'],
+                         [value for key, value in events if key == 'nodes'])
+        self.assertEqual(network['elements']['edges'],
+                         [value for key, value in events if key == 'edges'])
+
+        lazy = decode_lazy(chunks)
+        self.assertEqual(network['data'], lazy['data'])
+        self.assertEqual(network['elements']['nodes'],
+                         list(lazy['elements']['nodes']))
+        self.assertEqual(network['elements']['edges'],
+                         list(lazy['elements']['edges']))
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+
+import unittest
+
+from py2cytoscape.data.cynetwork import CyNetwork
+from py2cytoscape.data.util_cache import ResponseCache
+from tests.fake_session import FakeSession
+
+URL = 'http://localhost:1234/v1/networks'
+
+
+class GrowingSession(FakeSession):
+    """ Serves the nodes of a network that can grow behind our back. """
+
+    def __init__(self):
+        super(GrowingSession, self).__init__()
+        self.nodes = [1, 2, 3]
+
+    def respond(self, method, url, body):
+        if method == 'post':
+            self.nodes.append(4)
+            return [{'name': 'd', 'SUID': 4}]
+        path = url.split('/networks/1/')[1]
+        if path == 'nodes/count':
+            return {'count': len(self.nodes)}
+        if path == 'edges/count':
+            return {'count': 0}
+        return list(self.nodes)
+
+    def paths(self):
+        """ Paths below the network of the reads sent. """
+        return [url.split('/networks/1/')[1]
+                for method, url in self.requests if method == 'get']
+
+
+class ResponseCacheTests(unittest.TestCase):
+
+    def test_lru_eviction(self):
+        cache = ResponseCache(max_size=2)
+        cache.get('a', lambda: 1)
+        cache.get('b', lambda: 2)
+        self.assertEqual(1, cache.get('a', lambda: None))
+        cache.get('c', lambda: 3)
+
+        self.assertIn('a', cache)
+        self.assertNotIn('b', cache)
+        self.assertEqual(2, len(cache))
+
+    def test_validate(self):
+        cache = ResponseCache()
+        cache.validate(1)
+        cache.get('a', lambda: 1)
+        cache.validate(1)
+        self.assertIn('a', cache)
+        cache.validate(2)
+        self.assertNotIn('a', cache)
+
+
+class NetworkCacheTests(unittest.TestCase):
+
+    def setUp(self):
+        self.session = GrowingSession()
+        self.network = CyNetwork(1, session=self.session, url=URL)
+
+    def test_disabled_by_default(self):
+        self.network.get_nodes()
+        self.network.get_nodes()
+        self.assertEqual(['nodes', 'nodes'], self.session.paths())
+
+    def test_cached_reads(self):
+        self.network.enable_cache(check_counts=False)
+        self.assertEqual([1, 2, 3], self.network.get_nodes())
+        self.assertEqual([1, 2, 3], self.network.get_nodes())
+        self.assertEqual(['nodes'], self.session.paths())
+
+        self.network.add_node('d')
+        self.assertEqual([1, 2, 3, 4], self.network.get_nodes())
+        self.assertEqual(['nodes', 'nodes'], self.session.paths())
+
+    def test_server_side_change(self):
+        self.network.enable_cache(check_interval=0)
+        self.network.get_nodes()
+        self.network.get_nodes()
+        self.assertEqual(1, self.session.paths().count('nodes'))
+
+        self.session.nodes.append(4)
+        self.assertEqual([1, 2, 3, 4], self.network.get_nodes())
+        self.assertEqual(2, self.session.paths().count('nodes'))
+
+    def test_checks_are_throttled(self):
+        self.network.enable_cache(check_interval=60)
+        for _ in range(5):
+            self.network.get_nodes()
+        # One check and one read for the whole burst
+        self.assertEqual(['nodes/count', 'edges/count', 'nodes'],
+                         self.session.paths())
+
+        # Changes by other clients show up once the interval is over
+        self.session.nodes.append(4)
+        self.assertEqual([1, 2, 3], self.network.get_nodes())
+        self.network.enable_cache(check_interval=0)
+        self.assertEqual([1, 2, 3, 4], self.network.get_nodes())
@@ -1,10 +1,13 @@
-
+import os
 import unittest
 import warnings
 
 from py2cytoscape.data.cynetwork import CyNetwork
 from py2cytoscape.data.cyrest_client import CyRestClient
 from py2cytoscape.data.util_network import NetworkUtil
+from tests import cyrest_server
+
+setUpModule, tearDownModule = cyrest_server.module_fixture()
 
 
 class CheckResponseTests(unittest.TestCase):
@@ -13,7 +16,8 @@ class CheckResponseTests(unittest.TestCase):
         self.client = CyRestClient()
         self.client.network.delete_all()        
         locations = [
-            'http://chianti.ucsd.edu/cytoscape-data/galFiltered.sif'
+            os.path.join(os.path.dirname(os.path.realpath(__file__)),
+                         'data/galFiltered.sif')
         ]
         self.network = self.client.network.create_from(locations)
         view_id_list = self.network.get_views() 
@@ -1,7 +1,16 @@
+import os
+import unittest
+
+import pandas as pd
+
 from py2cytoscape.data.cyrest_client import CyRestClient
+from py2cytoscape.data.cynetwork import CyNetwork
 from py2cytoscape.data.util_network import NetworkUtil
+from tests import cyrest_server
+from tests.fake_session import FakeResponse, FakeSession
+
+setUpModule, tearDownModule = cyrest_server.module_fixture()
 
-import unittest
 
 class UtilNetworkTests(unittest.TestCase):
 
@@ -13,7 +22,8 @@ class UtilNetworkTests(unittest.TestCase):
     def test_name2suid(self):
         print('\n---------- name2suid tests start -----------\n')
         locations = [
-            'http://chianti.ucsd.edu/cytoscape-data/galFiltered.sif'
+            os.path.join(os.path.dirname(os.path.realpath(__file__)),
+                         'data/galFiltered.sif')
         ]
         network = self.client.network.create_from(locations)
         node_count = len(network.get_nodes())
@@ -22,3 +32,76 @@ class UtilNetworkTests(unittest.TestCase):
         edge_result = NetworkUtil.name2suid(network, obj_type='edge')
         self.assertEqual(node_count, len(result))
         self.assertEqual(edge_count, len(edge_result))
+
+
+class NameSession(FakeSession):
+    """ Serves the name and SUID columns of a 3-node network. """
+
+    def __init__(self):
+        super(NameSession, self).__init__()
+        self.names = ['a', 'b', 'c']
+        self.status_code = 200
+
+    def respond(self, method, url, body):
+        if method == 'post':
+            return [{'name': 'd', 'SUID': 13}]
+        if method == 'delete':
+            return FakeResponse({}, status_code=self.status_code)
+        if method == 'put':
+            for row in body['data']:
+                self.names[row['SUID'] - 10] = row['name']
+            return None
+        column = url.split('/')[-1]
+        if column == 'SUID':
+            return {'name': 'SUID', 'values': [10, 11, 12]}
+        return {'name': 'name', 'values': list(self.names)}
+
+
+class NameIndexTests(unittest.TestCase):
+
+    def setUp(self):
+        self.session = NameSession()
+        self.network = CyNetwork(1, session=self.session,
+                                 url='http://localhost:1234/v1/networks')
+
+    def test_name2suid(self):
+        self.assertEqual({'a': 10, 'b': 11, 'c': 12},
+                         NetworkUtil.name2suid(self.network))
+        self.assertEqual('b', self.network.get_name_index().suid2name[11])
+
+    def test_index_follows_changes(self):
+        index = self.network.get_name_index()
+        self.network.add_node('d')
+        self.network.delete_node(10)
+
+        self.assertIs(index, self.network.get_name_index())
+        self.assertEqual({'b': 11, 'c': 12, 'd': 13}, index.name2suid)
+        self.assertEqual({11: 'b', 12: 'c', 13: 'd'}, index.suid2name)
+        self.assertEqual(2, [method for method, _ in self.session.requests]
+                         .count('get'))
+
+    def test_aborted_batch(self):
+        index = self.network.get_name_index()
+        with self.assertRaises(RuntimeError):
+            with self.network.batch():
+                self.network.delete_node(10)
+                raise RuntimeError()
+
+        # Nothing was deleted
+        self.assertEqual(10, self.network.get_name_index().name2suid['a'])
+        self.assertIs(index, self.network.get_name_index())
+
+    def test_failed_delete(self):
+        index = self.network.get_name_index()
+        self.session.status_code = 500
+        self.assertRaises(IOError, self.network.delete_node, 10)
+        self.assertEqual(10, index.name2suid['a'])
+
+    def test_renamed_nodes(self):
+        self.network.get_name_index()
+        self.network.update_node_table(
+            pd.DataFrame({'SUID': [11], 'name': ['e']}),
+            network_key_col='SUID', data_key_col='SUID')
+
+        self.assertEqual({'a': 10, 'e': 11, 'c': 12},
+                         self.network.get_name_index().name2suid)
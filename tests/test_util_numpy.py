@@ -4,6 +4,11 @@ import numpy as np
 
 import unittest
 
+try:
+    from scipy import sparse
+except ImportError:
+    sparse = None
+
 class UtilNumpyTests(unittest.TestCase):
 
     def setUp(self):
@@ -45,3 +50,21 @@ class UtilNumpyTests(unittest.TestCase):
         print(g1)
         print(g2)
         print(g3['elements']['nodes'][0])
+
+    @unittest.skipIf(sparse is None, 'scipy not found')
+    def test_from_sparse(self):
+        dense = np.random.randint(2, size=(50, 50))
+        g1 = util.from_ndarray(dense, name="Dense")
+        g2 = util.from_sparse(sparse.csr_matrix(dense), name="Sparse")
+
+        self.assertEqual(50, len(g2['elements']['nodes']))
+        self.assertEqual(g1['elements']['edges'], g2['elements']['edges'])
+
+        weights = sparse.coo_matrix(([0.5, 2.0, np.nan], ([0, 3, 1], [2, 1, 1])),
+                                    shape=(4, 4))
+        g3 = util.from_sparse(weights, weighted=True)
+        edges = g3['elements']['edges']
+        # (3, 1) is below the diagonal and (1, 1) is NaN
+        self.assertEqual(1, len(edges))
+        self.assertEqual({'id': '0-2', 'source': '0', 'target': '2',
+                          'weight': 0.5}, edges[0]['data'])